@@ -0,0 +1,222 @@
+"""
+Circuit Breaker - Fail fast against unhealthy Lords
+
+Without a breaker, every quest step pays the full retry schedule against a
+Lord that is down, and concurrent quests turn that into a retry storm.
+
+States:
+- CLOSED: calls flow; consecutive failures are counted
+- OPEN: calls are rejected immediately (CircuitOpenError) until reset_timeout passes
+- HALF_OPEN: a limited number of trial calls probe the Lord; success closes
+  the circuit, failure re-opens it
+
+Only infrastructure failures (connection errors, HTTP errors, timeouts) trip
+the breaker - a Lord answering with a JSON-RPC error is healthy.
+"""
+
+import time
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker state"""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected by an open circuit"""
+
+    def __init__(self, lord_name: str, retry_after: float):
+        super().__init__(f"Circuit open for Lord {lord_name} (retry in {retry_after:.1f}s)")
+        self.lord_name = lord_name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Breaker for a single Lord.
+
+    Usage:
+        breaker.acquire()           # Raises CircuitOpenError when open
+        try:
+            ...
+            breaker.record(True)
+        except Exception:
+            breaker.record(False)
+    """
+
+    def __init__(
+        self,
+        lord_name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        on_state_change: Optional[Callable[[str, CircuitState, CircuitState], None]] = None,
+    ):
+        """
+        Initialize breaker.
+
+        Args:
+            lord_name: Name of Lord
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds to stay open before allowing trial calls
+            half_open_max_calls: Concurrent trial calls allowed while half-open
+            on_state_change: Callback(lord_name, old_state, new_state)
+        """
+        self.lord_name = lord_name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = max(0.0, reset_timeout)
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self.on_state_change = on_state_change
+
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self._trial_calls = 0
+
+        # Metrics
+        self.rejected = 0
+        self.opened = 0
+
+    def acquire(self):
+        """
+        Admit a call or reject it.
+
+        Raises:
+            CircuitOpenError: If the circuit is open (or half-open with all trial slots taken)
+        """
+        if self.state == CircuitState.OPEN:
+            elapsed = time.monotonic() - self.opened_at
+            if elapsed < self.reset_timeout:
+                self.rejected += 1
+                raise CircuitOpenError(self.lord_name, self.reset_timeout - elapsed)
+            self._transition(CircuitState.HALF_OPEN)
+
+        if self.state == CircuitState.HALF_OPEN:
+            if self._trial_calls >= self.half_open_max_calls:
+                self.rejected += 1
+                raise CircuitOpenError(self.lord_name, 0.0)
+            self._trial_calls += 1
+
+    def record(self, ok: Optional[bool]):
+        """
+        Record the outcome of an admitted call.
+
+        Args:
+            ok: True on success, False on failure, None if the call was
+                abandoned (e.g. cancelled) - only frees a trial slot
+        """
+        if self.state == CircuitState.HALF_OPEN:
+            self._trial_calls = max(0, self._trial_calls - 1)
+
+        if ok is None:
+            return
+
+        if ok:
+            self.consecutive_failures = 0
+            if self.state == CircuitState.HALF_OPEN:
+                self._transition(CircuitState.CLOSED)
+            return
+
+        self.consecutive_failures += 1
+        if self.state == CircuitState.HALF_OPEN or (
+            self.state == CircuitState.CLOSED and self.consecutive_failures >= self.failure_threshold
+        ):
+            self.opened_at = time.monotonic()
+            self.opened += 1
+            self._transition(CircuitState.OPEN)
+
+    def reset(self):
+        """Force the circuit closed"""
+        self.consecutive_failures = 0
+        self._trial_calls = 0
+        self._transition(CircuitState.CLOSED)
+
+    def stats(self) -> Dict[str, Any]:
+        retry_after = None
+        if self.state == CircuitState.OPEN:
+            retry_after = max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.consecutive_failures,
+            "retry_after_seconds": retry_after,
+            "rejected": self.rejected,
+            "opened": self.opened,
+        }
+
+    def _transition(self, new_state: CircuitState):
+        old_state = self.state
+        if old_state == new_state:
+            return
+        self.state = new_state
+        if new_state != CircuitState.HALF_OPEN:
+            self._trial_calls = 0
+        if self.on_state_change:
+            self.on_state_change(self.lord_name, old_state, new_state)
+
+
+StateListener = Callable[[str, CircuitState, CircuitState], None]
+
+
+class LordCircuitBreakers:
+    """
+    Lazily created breaker per Lord, sharing one configuration.
+
+    Several executors can share one instance: each subscribes with
+    add_listener() instead of replacing on_state_change.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        on_state_change: Optional[Callable[[str, CircuitState, CircuitState], None]] = None,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.on_state_change = on_state_change
+        self._listeners: List[StateListener] = []
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def add_listener(self, listener: StateListener):
+        """Subscribe to state changes of every Lord's breaker"""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: StateListener) -> bool:
+        try:
+            self._listeners.remove(listener)
+        except ValueError:
+            return False
+        return True
+
+    def for_lord(self, lord_name: str) -> CircuitBreaker:
+        breaker = self._breakers.get(lord_name)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                lord_name,
+                failure_threshold=self.failure_threshold,
+                reset_timeout=self.reset_timeout,
+                half_open_max_calls=self.half_open_max_calls,
+                on_state_change=self._notify,
+            )
+            self._breakers[lord_name] = breaker
+        return breaker
+
+    def state(self, lord_name: str) -> CircuitState:
+        breaker = self._breakers.get(lord_name)
+        return breaker.state if breaker else CircuitState.CLOSED
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {lord_name: breaker.stats() for lord_name, breaker in self._breakers.items()}
+
+    def _notify(self, lord_name: str, old_state: CircuitState, new_state: CircuitState):
+        # Resolved at call time so the owner can attach a callback after construction
+        if self.on_state_change:
+            self.on_state_change(lord_name, old_state, new_state)
+        for listener in list(self._listeners):
+            listener(lord_name, old_state, new_state)
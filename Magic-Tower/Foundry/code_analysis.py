@@ -0,0 +1,226 @@
+"""
+Code Analysis - Single-pass Python source metrics for Lord Sentinel
+
+check_quality used to estimate structure with code.count("def "),
+code.count("if ") and friends: one full scan per marker, and fooled by
+strings and comments ("# if you..." counted as a branch).
+
+This engine reads each source once with tokenize (comments, blank and code
+lines) and parses it once with ast. A single tree walk counts functions
+and classes and computes McCabe cyclomatic complexity per function.
+
+Each function also gets a fingerprint of its AST (positions excluded), so
+two revisions of a file can be compared function by function.
+
+analyze_source() is a pure function (safe for process pools) and results
+round-trip through plain dicts, so callers can cache them by
+content_hash() in any store (Lord Sentinel uses LordResultCache).
+
+Usage:
+    metrics = analyze_source(source)
+    stored = dataclasses.asdict(metrics)
+    metrics = SourceMetrics.from_dict(stored)
+"""
+
+import ast
+import hashlib
+import io
+import tokenize
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Union
+
+
+# ============================================================
+# METRICS
+# ============================================================
+
+@dataclass
+class FunctionMetrics:
+    """Complexity of one function or method"""
+    name: str
+    line: int
+    complexity: int
+    fingerprint: str = ""  # Hash of the function's AST, independent of its position
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "line": self.line, "complexity": self.complexity}
+
+
+@dataclass
+class SourceMetrics:
+    """Metrics for one source file"""
+    lines: int = 0
+    code_lines: int = 0
+    comment_lines: int = 0
+    blank_lines: int = 0
+    num_classes: int = 0
+    functions: List[FunctionMetrics] = field(default_factory=list)
+    module_complexity: int = 0  # Decision points outside any function
+    syntax_error: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SourceMetrics":
+        """Rebuild from dataclasses.asdict() output"""
+        fields = dict(data)
+        fields["functions"] = [FunctionMetrics(**function) for function in data.get("functions", [])]
+        return cls(**fields)
+
+    @property
+    def num_functions(self) -> int:
+        return len(self.functions)
+
+    @property
+    def total_complexity(self) -> int:
+        return sum(function.complexity for function in self.functions) + self.module_complexity
+
+    @property
+    def max_complexity(self) -> int:
+        return max((function.complexity for function in self.functions), default=0)
+
+    @property
+    def avg_complexity(self) -> float:
+        if not self.functions:
+            return float(self.module_complexity)
+        return sum(function.complexity for function in self.functions) / len(self.functions)
+
+    @property
+    def comment_density(self) -> float:
+        """Comment lines per non-blank line"""
+        non_blank = self.code_lines + self.comment_lines
+        return self.comment_lines / non_blank if non_blank else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "lines": self.lines,
+            "code_lines": self.code_lines,
+            "comment_lines": self.comment_lines,
+            "blank_lines": self.blank_lines,
+            "num_functions": self.num_functions,
+            "num_classes": self.num_classes,
+            "cyclomatic_complexity": self.total_complexity,
+            "avg_complexity_per_function": round(self.avg_complexity, 2),
+            "max_complexity": self.max_complexity,
+            "comment_density": round(self.comment_density, 3),
+            "functions": [function.as_dict() for function in self.functions],
+            "syntax_error": self.syntax_error,
+        }
+
+
+# ============================================================
+# ANALYSIS
+# ============================================================
+
+# Nodes that add one independent path
+_BRANCH_NODES = (
+    ast.If, ast.IfExp, ast.For, ast.AsyncFor, ast.While,
+    ast.ExceptHandler, ast.Assert, ast.comprehension, ast.match_case,
+)
+
+
+class _MetricsVisitor(ast.NodeVisitor):
+    """One walk: classes, functions and per-function complexity"""
+
+    def __init__(self, metrics: SourceMetrics):
+        self.metrics = metrics
+        # Complexity counters of the enclosing functions (innermost last)
+        self._stack: List[FunctionMetrics] = []
+
+    def generic_visit(self, node: ast.AST):
+        if isinstance(node, _BRANCH_NODES):
+            self._add(1 + (len(node.ifs) if isinstance(node, ast.comprehension) else 0))
+        elif isinstance(node, ast.BoolOp):
+            self._add(len(node.values) - 1)
+        super().generic_visit(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        self.metrics.num_classes += 1
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda]):
+        function = FunctionMetrics(name=getattr(node, "name", "<lambda>"), line=node.lineno, complexity=1)
+        if not isinstance(node, ast.Lambda):
+            function.fingerprint = hashlib.sha1(ast.dump(node).encode("utf-8")).hexdigest()[:16]
+            self.metrics.functions.append(function)
+        self._stack.append(function)
+        self.generic_visit(node)
+        self._stack.pop()
+        if isinstance(node, ast.Lambda):
+            # Lambdas count toward the function they live in
+            self._add(function.complexity - 1)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+    visit_Lambda = visit_FunctionDef
+
+    def _add(self, amount: int):
+        if self._stack:
+            self._stack[-1].complexity += amount
+        else:
+            self.metrics.module_complexity += amount
+
+
+def _count_lines(source: str, metrics: SourceMetrics) -> bool:
+    """
+    Classify lines with tokenize.
+
+    Returns:
+        False if the source could not be tokenized (lines classified by text instead)
+    """
+    lines = source.splitlines()
+    metrics.lines = len(lines)
+    comment_rows = set()
+    code_rows = set()
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(source).readline):
+            if token.type == tokenize.COMMENT:
+                comment_rows.add(token.start[0])
+            elif token.type not in (
+                tokenize.NL, tokenize.NEWLINE, tokenize.INDENT, tokenize.DEDENT, tokenize.ENDMARKER,
+            ):
+                # Multi-line tokens (docstrings) cover every row they span
+                code_rows.update(range(token.start[0], token.end[0] + 1))
+        tokenized = True
+    except (tokenize.TokenError, SyntaxError):
+        tokenized = False
+        for row, line in enumerate(lines, start=1):
+            stripped = line.strip()
+            if stripped.startswith("#"):
+                comment_rows.add(row)
+            elif stripped:
+                code_rows.add(row)
+
+    # A line with code and a trailing comment counts as code
+    metrics.code_lines = len(code_rows)
+    metrics.comment_lines = len(comment_rows - code_rows)
+    metrics.blank_lines = max(0, metrics.lines - metrics.code_lines - metrics.comment_lines)
+    return tokenized
+
+
+def analyze_source(source: str) -> SourceMetrics:
+    """
+    Analyze one Python source.
+
+    Args:
+        source: Source text
+
+    Returns:
+        SourceMetrics. Unparseable sources get line counts only and
+        syntax_error set.
+    """
+    metrics = SourceMetrics()
+    _count_lines(source, metrics)
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError) as e:
+        metrics.syntax_error = f"{type(e).__name__}: {e}"
+        return metrics
+    _MetricsVisitor(metrics).visit(tree)
+    return metrics
+
+
+# ============================================================
+# CONTENT HASH
+# ============================================================
+
+def content_hash(source: str) -> str:
+    """SHA-256 of the source text"""
+    return hashlib.sha256(source.encode("utf-8", "surrogatepass")).hexdigest()
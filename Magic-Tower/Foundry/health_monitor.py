@@ -0,0 +1,182 @@
+"""
+Health Monitor - Active health probes for Lords
+
+The gateway used to find out a Lord was dead only when a client's quest
+failed. HealthMonitor probes every target on an interval, in the
+background, and keeps a healthy/unhealthy verdict per target that routing
+can consult before sending traffic.
+
+Verdicts use thresholds so one slow probe doesn't flap a Lord:
+- healthy -> unhealthy after unhealthy_threshold consecutive failed probes
+- unhealthy -> healthy after healthy_threshold consecutive successful probes
+
+New targets start healthy (nothing is known against them yet). A probe
+is any coroutine function taking the target name; it fails by raising or
+by exceeding the timeout.
+
+Usage:
+    monitor = HealthMonitor(probe, interval=10.0, timeout=2.0)
+    monitor.add("scribe")
+    await monitor.start()
+    if monitor.is_healthy("scribe"):
+        ...
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+Probe = Callable[[str], Awaitable[Any]]
+
+
+@dataclass
+class TargetHealth:
+    """Health verdict and probe history of one target"""
+    healthy: bool = True
+    consecutive_successes: int = 0
+    consecutive_failures: int = 0
+    probes: int = 0
+    failures: int = 0
+    last_checked: Optional[float] = None
+    last_latency: Optional[float] = None
+    last_error: Optional[str] = None
+    changed_at: Optional[float] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "healthy": self.healthy,
+            "consecutive_successes": self.consecutive_successes,
+            "consecutive_failures": self.consecutive_failures,
+            "probes": self.probes,
+            "failures": self.failures,
+            "last_checked": self.last_checked,
+            "last_latency_ms": round(self.last_latency * 1000, 2) if self.last_latency is not None else None,
+            "last_error": self.last_error,
+            "changed_at": self.changed_at,
+        }
+
+
+class HealthMonitor:
+    """Probes targets periodically and tracks healthy/unhealthy verdicts"""
+
+    def __init__(
+        self,
+        probe: Probe,
+        interval: float = 10.0,
+        timeout: float = 2.0,
+        unhealthy_threshold: int = 3,
+        healthy_threshold: int = 2,
+        on_state_change: Optional[Callable[[str, bool], None]] = None,
+    ):
+        """
+        Initialize monitor.
+
+        Args:
+            probe: Coroutine function probing one target by name (raises on failure)
+            interval: Seconds between probe rounds (<= 0 disables the background loop)
+            timeout: Seconds before a probe counts as failed
+            unhealthy_threshold: Consecutive failures that mark a target unhealthy
+            healthy_threshold: Consecutive successes that mark it healthy again
+            on_state_change: Callback(name, healthy) when a verdict flips
+        """
+        self.probe = probe
+        self.interval = interval
+        self.timeout = timeout
+        self.unhealthy_threshold = max(1, unhealthy_threshold)
+        self.healthy_threshold = max(1, healthy_threshold)
+        self.on_state_change = on_state_change
+        self._targets: Dict[str, TargetHealth] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def add(self, name: str):
+        """Start tracking a target (no-op if already tracked)"""
+        self._targets.setdefault(name, TargetHealth())
+
+    def remove(self, name: str) -> bool:
+        return self._targets.pop(name, None) is not None
+
+    def is_healthy(self, name: str) -> bool:
+        """Verdict for a target (untracked targets are not known to be bad)"""
+        health = self._targets.get(name)
+        return health is None or health.healthy
+
+    def healthy(self, names: List[str]) -> List[str]:
+        """The healthy subset of names, order preserved"""
+        return [name for name in names if self.is_healthy(name)]
+
+    async def check(self, name: str) -> bool:
+        """
+        Probe one target now and record the outcome.
+
+        Returns:
+            Whether the probe succeeded
+        """
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self.probe(name), self.timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.record(name, False, error=f"{type(e).__name__}: {e}" if str(e) else type(e).__name__)
+            return False
+        self.record(name, True, latency=time.perf_counter() - start)
+        return True
+
+    async def check_all(self) -> Dict[str, bool]:
+        """Probe every target concurrently"""
+        names = list(self._targets)
+        results = await asyncio.gather(*[self.check(name) for name in names])
+        return dict(zip(names, results))
+
+    def record(self, name: str, ok: bool, latency: Optional[float] = None, error: Optional[str] = None):
+        """Record a probe outcome (ignored for targets removed meanwhile)"""
+        health = self._targets.get(name)
+        if health is None:
+            return
+
+        health.probes += 1
+        health.last_checked = time.time()
+        health.last_latency = latency
+        if ok:
+            health.consecutive_successes += 1
+            health.consecutive_failures = 0
+            health.last_error = None
+            if not health.healthy and health.consecutive_successes >= self.healthy_threshold:
+                self._transition(name, health, True)
+        else:
+            health.failures += 1
+            health.consecutive_failures += 1
+            health.consecutive_successes = 0
+            health.last_error = error
+            if health.healthy and health.consecutive_failures >= self.unhealthy_threshold:
+                self._transition(name, health, False)
+
+    async def start(self):
+        """Start the background probe loop"""
+        if self.interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: health.as_dict() for name, health in self._targets.items()}
+
+    async def _run(self):
+        while True:
+            await self.check_all()
+            await asyncio.sleep(self.interval)
+
+    def _transition(self, name: str, health: TargetHealth, healthy: bool):
+        health.healthy = healthy
+        health.changed_at = time.time()
+        logger.warning(f"{name} is now {'healthy' if healthy else 'UNHEALTHY'}")
+        if self.on_state_change:
+            self.on_state_change(name, healthy)
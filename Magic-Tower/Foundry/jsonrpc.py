@@ -0,0 +1,39 @@
+"""
+JSON-RPC 2.0 - Error codes and message helpers shared by Lords and clients
+"""
+
+from typing import Any, Dict, Optional
+
+JSONRPC_VERSION = "2.0"
+
+# Standard error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+# Implementation-defined server errors (-32000 to -32099)
+SERVER_BUSY = -32000
+
+ERROR_MESSAGES = {
+    PARSE_ERROR: "Parse error",
+    INVALID_REQUEST: "Invalid Request",
+    METHOD_NOT_FOUND: "Method not found",
+    INVALID_PARAMS: "Invalid params",
+    INTERNAL_ERROR: "Internal error",
+    SERVER_BUSY: "Server busy",
+}
+
+
+def result_response(request_id: Any, result: Any) -> Dict[str, Any]:
+    """Success response ("result" last so it can be sliced out of the encoded body)"""
+    return {"jsonrpc": JSONRPC_VERSION, "id": request_id, "result": result}
+
+
+def error_response(request_id: Any, code: int, message: Optional[str] = None, data: Any = None) -> Dict[str, Any]:
+    """Error response with a standard message when none is given"""
+    error: Dict[str, Any] = {"code": code, "message": message or ERROR_MESSAGES.get(code, "Server error")}
+    if data is not None:
+        error["data"] = data
+    return {"jsonrpc": JSONRPC_VERSION, "id": request_id, "error": error}
@@ -3,14 +3,56 @@ King Gateway - Round Table MCP Server Coordinator
 Minimal proof-of-concept based on IBM ContextForge patterns
 
 This gateway routes quests to appropriate Lords (MCP servers) based on quest type.
-Phase 1: In-memory Lord registry with HTTP transport.
+Phase 1: In-memory Lord registry with HTTP or in-process ("inproc") transport.
+
+Proxy fast path: quests go out over an app-lifetime LordClientPool, and
+the Lord's "result" bytes are streamed into the QuestResponse body without
+being decoded and re-encoded. Lord Servers put "result" last in the
+JSON-RPC response, so only the short envelope before it and the tail after
+it are inspected (for an "error" field). Any other response shape - including
+"result": null or members after the result - falls back to a full decode.
+
+Response cache: deterministic quest types (QUEST_CACHE_TTLS) are answered
+from an LRU keyed by (lord, quest_type, canonical quest_data), with ETag /
+If-None-Match and Cache-Control support. GET/DELETE /admin/cache inspect
+and purge it.
+
+Request coalescing: concurrent cache misses for the same cacheable quest
+share one upstream Lord call (SingleFlight); every caller gets its result
+or its error. GET /stats reports how many requests were coalesced.
+
+Capability discovery: at startup and every KING_DISCOVERY_INTERVAL seconds
+the gateway calls tools/list on each Lord and rebuilds a quest_type ->
+[lords] index from the answers. Quests for tools no Lord implements are
+rejected at the gateway without a round trip. A Lord that cannot be
+reached keeps its last known (initially configured) capabilities.
+
+Health probes: every KING_HEALTH_INTERVAL seconds each Lord's /health (or
+its health_path) is probed. After KING_UNHEALTHY_THRESHOLD consecutive
+failures a Lord is taken out of routing; after KING_HEALTHY_THRESHOLD
+consecutive successes it is routed to again. POST/DELETE /admin/lords
+register and deregister Lords at runtime.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
+import hashlib
+import asyncio
 import httpx
+import itertools
 import logging
-from typing import Dict, Any, Optional
+import os
+import re
+import time
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
+
+from health_monitor import HealthMonitor
+from lord_cache import LRUTTLCache, canonical_key
+from lord_client import JsonRpcBatcher, LordClientPool
+from singleflight import SingleFlight
+from lord_registry import INPROC, INPROC_APPS, load_asgi_app
+from lord_server import json_dumps, json_loads
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -39,6 +81,192 @@ LORDS = {
     },
 }
 
+# In-process transports for co-located Lords (transport: "inproc"), created on first use
+_INPROC_TRANSPORTS: Dict[str, httpx.ASGITransport] = {}
+
+
+def _lord_transport(lord_name: str, lord: Dict[str, Any]) -> Optional[httpx.AsyncBaseTransport]:
+    """
+    Transport for a Lord entry.
+    
+    "inproc" Lords are called through their ASGI app (optional "app" key,
+    "module:attr"; defaults to lord_<name>:app) without touching the network.
+    """
+    if lord.get("transport", "http") != INPROC:
+        return None
+    
+    transport = _INPROC_TRANSPORTS.get(lord_name)
+    if transport is None:
+        target = lord.get("app") or INPROC_APPS.get(lord_name)
+        if not target:
+            raise HTTPException(status_code=500, detail=f"No in-process app configured for Lord {lord_name}")
+        transport = httpx.ASGITransport(app=load_asgi_app(target))
+        _INPROC_TRANSPORTS[lord_name] = transport
+    return transport
+
+
+# App-lifetime connection pool (opened at startup, closed at shutdown)
+LORD_TIMEOUT = 30.0
+_client_pool: Optional[LordClientPool] = None
+
+
+def _get_client_pool() -> LordClientPool:
+    global _client_pool
+    if _client_pool is None:
+        _client_pool = LordClientPool()
+    return _client_pool
+
+
+async def _close_client_pool():
+    global _client_pool
+    if _client_pool is not None:
+        await _client_pool.aclose()
+        _client_pool = None
+
+
+app.router.add_event_handler("startup", _get_client_pool)
+app.router.add_event_handler("shutdown", _close_client_pool)
+
+
+def _split_lord_url(url: str) -> Tuple[str, str]:
+    """"http://host:port/mcp" -> ("http://host:port", "/mcp")"""
+    parsed = httpx.URL(url)
+    origin = f"{parsed.scheme}://{parsed.netloc.decode('ascii')}"
+    return origin, parsed.raw_path.decode("ascii") or "/"
+
+
+# Capability discovery: quest_type -> Lords implementing it (registration order)
+DISCOVERY_INTERVAL = float(os.environ.get("KING_DISCOVERY_INTERVAL", "60"))
+DISCOVERY_TIMEOUT = 5.0
+_capability_index: Dict[str, Tuple[str, ...]] = {}
+_discovery_task: Optional[asyncio.Task] = None
+
+
+def _rebuild_capability_index():
+    """Recompute the routing index from every Lord's capabilities"""
+    global _capability_index
+    index: Dict[str, List[str]] = {}
+    for lord_name, lord in LORDS.items():
+        for tool_name in lord.get("capabilities", ()):
+            index.setdefault(tool_name, []).append(lord_name)
+    _capability_index = {tool_name: tuple(lords) for tool_name, lords in index.items()}
+
+
+async def _discover_lord(lord_name: str, lord: Dict[str, Any]) -> bool:
+    """Replace a Lord's capabilities with its tools/list answer (False if unreachable)"""
+    base_url, path = _split_lord_url(lord["url"])
+    request = {"jsonrpc": "2.0", "method": "tools/list", "id": next(_rpc_ids)}
+    try:
+        response = await _get_client_pool().post(
+            lord_name, base_url, path, request,
+            timeout=DISCOVERY_TIMEOUT, transport=_lord_transport(lord_name, lord),
+        )
+        tools = response.json()["result"]["tools"]
+    except (httpx.HTTPError, HTTPException, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Capability discovery failed for Lord {lord_name}: {e}")
+        return False
+    
+    lord["capabilities"] = [tool["name"] for tool in tools]
+    lord["discovered_at"] = time.time()
+    return True
+
+
+async def refresh_capabilities() -> Dict[str, bool]:
+    """
+    Discover every Lord's tools and rebuild the routing index.
+    
+    Returns:
+        Lord name -> whether its tools/list call succeeded
+    """
+    names = list(LORDS)
+    results = await asyncio.gather(*[_discover_lord(name, LORDS[name]) for name in names])
+    _rebuild_capability_index()
+    logger.info(f"Capability index: {len(_capability_index)} quest types across {len(names)} Lords")
+    return dict(zip(names, results))
+
+
+async def _discovery_loop():
+    while True:
+        await asyncio.sleep(DISCOVERY_INTERVAL)
+        await refresh_capabilities()
+
+
+async def _start_discovery():
+    global _discovery_task
+    await refresh_capabilities()
+    if DISCOVERY_INTERVAL > 0 and _discovery_task is None:
+        _discovery_task = asyncio.create_task(_discovery_loop())
+
+
+async def _stop_discovery():
+    global _discovery_task
+    if _discovery_task is not None:
+        _discovery_task.cancel()
+        _discovery_task = None
+
+
+_rebuild_capability_index()
+app.router.add_event_handler("startup", _start_discovery)
+app.router.add_event_handler("shutdown", _stop_discovery)
+
+
+# Active health probes: unhealthy Lords are out of routing until they recover
+HEALTH_INTERVAL = float(os.environ.get("KING_HEALTH_INTERVAL", "10"))
+HEALTH_TIMEOUT = float(os.environ.get("KING_HEALTH_TIMEOUT", "2"))
+UNHEALTHY_THRESHOLD = int(os.environ.get("KING_UNHEALTHY_THRESHOLD", "3"))
+HEALTHY_THRESHOLD = int(os.environ.get("KING_HEALTHY_THRESHOLD", "2"))
+HEALTH_PATH = os.environ.get("KING_HEALTH_PATH", "/health")
+
+
+async def _probe_lord(lord_name: str):
+    """GET the Lord's health path over its pooled client (raises if unhealthy)"""
+    lord = LORDS[lord_name]
+    base_url, _ = _split_lord_url(lord["url"])
+    client = _get_client_pool().client_for(lord_name, base_url, _lord_transport(lord_name, lord))
+    response = await client.get(lord.get("health_path") or HEALTH_PATH, timeout=HEALTH_TIMEOUT)
+    response.raise_for_status()
+
+
+_health = HealthMonitor(
+    _probe_lord,
+    interval=HEALTH_INTERVAL,
+    timeout=HEALTH_TIMEOUT,
+    unhealthy_threshold=UNHEALTHY_THRESHOLD,
+    healthy_threshold=HEALTHY_THRESHOLD,
+)
+for _lord_name in LORDS:
+    _health.add(_lord_name)
+
+app.router.add_event_handler("startup", _health.start)
+app.router.add_event_handler("shutdown", _health.stop)
+
+
+# Response cache: seconds a quest type's response stays valid (absent/0 = not cached).
+# Only quest types whose Lords answer identically for identical quest_data belong here.
+QUEST_CACHE_TTLS: Dict[str, float] = {
+    "design_system": 300,
+    "analyze_architecture": 300,
+    "write_docs": 600,
+    "create_summary": 3600,
+}
+_response_cache = LRUTTLCache(
+    max_entries=int(os.environ.get("KING_CACHE_MAX_ENTRIES", "1024")),
+    max_bytes=int(os.environ.get("KING_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+    default_ttl=None,
+    sizeof=lambda entry: len(entry["body"]),
+)
+
+# Identical cacheable quests in flight at the same time share one Lord call
+_in_flight = SingleFlight()
+
+
+# JSON-RPC batching: concurrent quests for the same Lord within the window share
+# one HTTP request (KING_BATCH_WINDOW_MS, 0 = disabled)
+BATCH_WINDOW_MS = float(os.environ.get("KING_BATCH_WINDOW_MS", "0"))
+_batcher: Optional[JsonRpcBatcher] = JsonRpcBatcher(window=BATCH_WINDOW_MS / 1000) if BATCH_WINDOW_MS > 0 else None
+_rpc_ids = itertools.count(1)
+
+
 # Request/Response models
 class QuestRequest(BaseModel):
     """Quest request from client"""
@@ -46,6 +274,15 @@ class QuestRequest(BaseModel):
     quest_data: Dict[str, Any]  # Quest-specific parameters
     lord_name: Optional[str] = None  # Optional: explicitly target a Lord
 
+class LordRegistration(BaseModel):
+    """Runtime Lord registration"""
+    name: str
+    url: str  # JSON-RPC endpoint, e.g. "http://localhost:8003/mcp"
+    description: str = ""
+    capabilities: List[str] = []  # Used until tools/list discovery succeeds
+    transport: str = "http"
+    health_path: Optional[str] = None  # Defaults to KING_HEALTH_PATH
+
 class QuestResponse(BaseModel):
     """Quest response to client"""
     lord: str
@@ -61,7 +298,8 @@ async def root():
         "service": "Round Table King Gateway",
         "version": "0.1.0",
         "status": "operational",
-        "lords_registered": len(LORDS)
+        "lords_registered": len(LORDS),
+        "lords_healthy": len(_health.healthy(list(LORDS)))
     }
 
 
@@ -72,22 +310,159 @@ async def list_lords():
         "lords": {
             name: {
                 "url": config["url"],
+                "transport": config.get("transport", "http"),
                 "description": config["description"],
-                "capabilities": config["capabilities"]
+                "capabilities": config["capabilities"],
+                "discovered_at": config.get("discovered_at"),
+                "healthy": _health.is_healthy(name)
             }
             for name, config in LORDS.items()
         }
     }
 
 
+@app.post("/admin/lords")
+async def register_lord(registration: LordRegistration):
+    """Register (or replace) a Lord at runtime; its tools are discovered right away"""
+    try:
+        _split_lord_url(registration.url)
+    except (httpx.InvalidURL, UnicodeError) as e:
+        raise HTTPException(status_code=422, detail=f"Invalid Lord URL {registration.url}: {e}")
+    
+    lord: Dict[str, Any] = {
+        "url": registration.url,
+        "transport": registration.transport,
+        "description": registration.description,
+        "capabilities": list(registration.capabilities),
+    }
+    if registration.health_path:
+        lord["health_path"] = registration.health_path
+    
+    name = registration.name
+    replaced = name in LORDS
+    _INPROC_TRANSPORTS.pop(name, None)
+    _health.remove(name)  # A replaced Lord starts with a fresh verdict
+    LORDS[name] = lord
+    _health.add(name)
+    
+    discovered = await _discover_lord(name, lord)
+    _rebuild_capability_index()
+    logger.info(f"{'Replaced' if replaced else 'Registered'} Lord {name} at {registration.url}")
+    return {"lord": name, "replaced": replaced, "discovered": discovered, "capabilities": lord["capabilities"]}
+
+
+@app.delete("/admin/lords/{lord_name}")
+async def deregister_lord(lord_name: str):
+    """Remove a Lord from routing, health probing and the response cache"""
+    if LORDS.pop(lord_name, None) is None:
+        raise HTTPException(status_code=404, detail=f"Lord {lord_name} not registered in gateway")
+    
+    _health.remove(lord_name)
+    _INPROC_TRANSPORTS.pop(lord_name, None)
+    _rebuild_capability_index()
+    purged = (await purge_cache(lord=lord_name))["purged"]
+    logger.info(f"Deregistered Lord {lord_name}")
+    return {"lord": lord_name, "deregistered": True, "cache_purged": purged}
+
+
+@app.get("/admin/health")
+async def lord_health():
+    """Health verdicts and probe history per Lord"""
+    return {
+        "lords": _health.stats(),
+        "interval_seconds": HEALTH_INTERVAL,
+        "timeout_seconds": HEALTH_TIMEOUT,
+        "unhealthy_threshold": UNHEALTHY_THRESHOLD,
+        "healthy_threshold": HEALTHY_THRESHOLD,
+    }
+
+
+@app.post("/admin/health/check")
+async def check_lord_health():
+    """Probe every Lord now"""
+    return {"probes": await _health.check_all(), "lords": _health.stats()}
+
+
+@app.get("/capabilities")
+async def list_capabilities():
+    """Routing index: quest type -> Lords that implement it"""
+    return {"quest_types": _capability_index, "refresh_interval_seconds": DISCOVERY_INTERVAL}
+
+
+@app.post("/admin/capabilities/refresh")
+async def refresh_capabilities_now():
+    """Run capability discovery immediately"""
+    return {"lords": await refresh_capabilities(), "quest_types": _capability_index}
+
+
+@app.get("/stats")
+async def gateway_stats():
+    """Coalescing, response cache and connection pool statistics"""
+    return {
+        "coalescing": _in_flight.stats(),
+        "cache": _response_cache.stats(),
+        "client_pool": _client_pool.stats() if _client_pool is not None else None,
+        "health": _health.stats(),
+    }
+
+
+@app.get("/admin/cache")
+async def cache_info():
+    """Response cache statistics and entries (most recently used last)"""
+    entries = []
+    for key in _response_cache.keys():
+        entry = _response_cache.peek(key)
+        if entry is None:
+            continue
+        entries.append({
+            "key": key,
+            "lord": entry["lord"],
+            "quest_type": entry["quest_type"],
+            "etag": entry["etag"],
+            "bytes": len(entry["body"]),
+            "age_seconds": round(time.time() - entry["stored_at"], 3),
+            "ttl_remaining_seconds": _response_cache.ttl_remaining(key),
+        })
+    return {"stats": _response_cache.stats(), "ttls": QUEST_CACHE_TTLS, "entries": entries}
+
+
+@app.delete("/admin/cache")
+async def purge_cache(lord: Optional[str] = None, quest_type: Optional[str] = None):
+    """Purge the response cache (optionally only one Lord and/or quest type)"""
+    if lord is None and quest_type is None:
+        return {"purged": _response_cache.clear()}
+    
+    purged = 0
+    for key in _response_cache.keys():
+        entry = _response_cache.peek(key)
+        if entry is None:
+            continue
+        if (lord is None or entry["lord"] == lord) and (quest_type is None or entry["quest_type"] == quest_type):
+            purged += _response_cache.delete(key)
+    return {"purged": purged}
+
+
+@app.delete("/admin/cache/{key}")
+async def purge_cache_entry(key: str):
+    """Purge one cached response"""
+    if not _response_cache.delete(key):
+        raise HTTPException(status_code=404, detail=f"No cached response: {key}")
+    return {"purged": 1}
+
+
 @app.post("/quest", response_model=QuestResponse)
-async def route_quest(quest: QuestRequest):
+async def route_quest(quest: QuestRequest, request: Request):
     """
     Route quest to appropriate Lord based on quest_type or explicit lord_name.
     
     This is the core coordination function - maps quests to Lords.
+    Cacheable quest types are served from the response cache; clients may
+    send Cache-Control: no-cache (refresh) / no-store (don't cache) and
+    If-None-Match (304 when the ETag still matches). Concurrent misses for
+    the same quest are coalesced into one Lord call.
     """
-    logger.info(f"Received quest: type={quest.quest_type}, data={quest.quest_data}")
+    logger.info(f"Received quest: type={quest.quest_type}")
+    logger.debug(f"Quest data: {quest.quest_data}")
     
     # Routing logic: determine which Lord handles this quest
     lord_name = quest.lord_name
@@ -97,6 +472,12 @@ async def route_quest(quest: QuestRequest):
         lord_name = _route_quest_to_lord(quest.quest_type)
     
     if not lord_name:
+        if _capability_index.get(quest.quest_type):
+            raise HTTPException(
+                status_code=503,
+                detail=f"No healthy Lord handles quest type: {quest.quest_type}",
+                headers={"Retry-After": str(max(1, int(HEALTH_INTERVAL)))}
+            )
         raise HTTPException(
             status_code=404,
             detail=f"No Lord handles quest type: {quest.quest_type}"
@@ -110,48 +491,124 @@ async def route_quest(quest: QuestRequest):
             detail=f"Lord {lord_name} not registered in gateway"
         )
     
+    if lord_name not in _capability_index.get(quest.quest_type, ()):
+        raise HTTPException(
+            status_code=404,
+            detail=f"Lord {lord_name} does not handle quest type: {quest.quest_type}"
+        )
+    
+    if not _health.is_healthy(lord_name):
+        raise HTTPException(
+            status_code=503,
+            detail=f"Lord {lord_name} is unhealthy",
+            headers={"Retry-After": str(max(1, int(HEALTH_INTERVAL)))}
+        )
+    
+    ttl = QUEST_CACHE_TTLS.get(quest.quest_type, 0)
+    if ttl <= 0:
+        response = await _forward_quest(lord_name, lord, quest)
+        response.headers["Cache-Control"] = "no-store"
+        return response
+    
+    directives = _cache_directives(request.headers.get("cache-control"))
+    cache_key = canonical_key(lord_name, quest.quest_type, quest.quest_data)
+    
+    if "no-cache" not in directives and "no-store" not in directives:
+        entry = _response_cache.get(cache_key)
+        if entry is not None:
+            return _cached_response(entry, cache_key, request, "HIT")
+    
+    async def fetch() -> Dict[str, Any]:
+        body = await _response_body(await _forward_quest(lord_name, lord, quest))
+        return {
+            "body": body,
+            "etag": f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            "lord": lord_name,
+            "quest_type": quest.quest_type,
+            "stored_at": time.time(),
+        }
+    
+    entry = await _in_flight.do(cache_key, fetch)
+    if "no-store" in directives:
+        return _cached_response(entry, cache_key, request, "BYPASS", max_age=0)
+    _response_cache.set(cache_key, entry, ttl=ttl)
+    return _cached_response(entry, cache_key, request, "MISS", max_age=ttl)
+
+
+def _cache_directives(header: Optional[str]) -> set:
+    """Cache-Control directive names, lower-cased"""
+    if not header:
+        return set()
+    return {part.split("=", 1)[0].strip().lower() for part in header.split(",") if part.strip()}
+
+
+def _cached_response(
+    entry: Dict[str, Any],
+    cache_key: str,
+    request: Request,
+    status: str,
+    max_age: Optional[float] = None,
+) -> Response:
+    """Cached/cacheable quest response, or 304 if the client's ETag matches"""
+    if max_age is None:
+        max_age = _response_cache.ttl_remaining(cache_key) or 0
+    headers = {
+        "ETag": entry["etag"],
+        "Cache-Control": f"max-age={int(max_age)}" if max_age > 0 else "no-store",
+        "X-Cache": status,
+    }
+    if status == "HIT":
+        headers["Age"] = str(int(time.time() - entry["stored_at"]))
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip() for tag in if_none_match.split(",")}
+        if "*" in tags or entry["etag"] in tags or f"W/{entry['etag']}" in tags:
+            return Response(status_code=304, headers=headers)
+    return Response(content=entry["body"], media_type="application/json", headers=headers)
+
+
+async def _response_body(response: Response) -> bytes:
+    """Collect a quest response's bytes (streamed result bytes are joined, not parsed)"""
+    if isinstance(response, StreamingResponse):
+        return b"".join([chunk async for chunk in response.body_iterator])
+    return response.body
+
+
+async def _forward_quest(lord_name: str, lord: Dict[str, Any], quest: QuestRequest) -> Response:
+    """Send the quest to its Lord over the pooled client"""
     logger.info(f"Routing quest to Lord: {lord_name} at {lord['url']}")
     
-    # Forward quest to Lord via HTTP (JSON-RPC 2.0 format)
+    # Build JSON-RPC 2.0 request
+    jsonrpc_request = {
+        "jsonrpc": "2.0",
+        "method": "tools/call",
+        "params": {
+            "name": quest.quest_type,
+            "arguments": quest.quest_data
+        },
+        "id": next(_rpc_ids)
+    }
+    
+    base_url, path = _split_lord_url(lord["url"])
+    pool = _get_client_pool()
+    transport = _lord_transport(lord_name, lord)
+    
+    # Forward quest to Lord via the pooled client
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Build JSON-RPC 2.0 request
-            jsonrpc_request = {
-                "jsonrpc": "2.0",
-                "method": "tools/call",
-                "params": {
-                    "name": quest.quest_type,
-                    "arguments": quest.quest_data
-                },
-                "id": 1
-            }
-            
-            response = await client.post(lord["url"], json=jsonrpc_request)
-            response.raise_for_status()
-            
-            jsonrpc_response = response.json()
-            
-            logger.info(f"Raw JSON-RPC response from {lord_name}: {jsonrpc_response}")
-            
-            # Extract result from JSON-RPC response
-            # JSON-RPC 2.0 spec: only check if error key exists AND is not null
-            if "error" in jsonrpc_response:
-                error = jsonrpc_response["error"]
-                logger.info(f"Error field present: {error}, type: {type(error)}")
-                if error is not None and error != "None":
-                    raise HTTPException(
-                        status_code=500,
-                        detail=f"Lord {lord_name} returned error: {error}"
-                    )
-            
-            result = jsonrpc_response.get("result")
-            
-            return QuestResponse(
-                lord=lord_name,
-                quest_type=quest.quest_type,
-                result=result,
-                status="success"
+        if _batcher is None:
+            response = await pool.stream(
+                lord_name, base_url, path, json_dumps(jsonrpc_request),
+                timeout=LORD_TIMEOUT, transport=transport,
             )
+            return await _proxy_response(lord_name, quest.quest_type, response)
+        
+        async def send(payload: Any) -> Any:
+            response = await pool.post(lord_name, base_url, path, payload, timeout=LORD_TIMEOUT, transport=transport)
+            return response.json()
+        
+        jsonrpc_response = await _batcher.call(lord["url"], jsonrpc_request, send)
+        return _quest_response(lord_name, quest.quest_type, jsonrpc_response)
             
     except httpx.HTTPStatusError as e:
         logger.error(f"HTTP error from Lord {lord_name}: {e}")
@@ -167,26 +624,170 @@ async def route_quest(quest: QuestRequest):
         )
 
 
-def _route_quest_to_lord(quest_type: str) -> Optional[str]:
+# Bytes of the Lord response read to find "result" before giving up on the fast path
+PROXY_HEAD_LIMIT = 4096
+# Bytes read ahead before streaming: smaller responses are checked whole
+PROXY_BUFFER_LIMIT = 64 * 1024
+# Bytes held back while streaming, to check what follows the result
+PROXY_TAIL_LIMIT = 4096
+_RESULT_KEY = re.compile(rb'"result"\s*:')
+_MEMBER_KEY = re.compile(rb',\s*"(?:[^"\\]|\\.)*"\s*:')
+_SUCCESS_SUFFIX = b',"status":"success"}'
+
+
+async def _proxy_response(lord_name: str, quest_type: str, response: httpx.Response) -> Response:
     """
-    Route quest type to appropriate Lord.
+    Turn a streaming Lord response into the quest response.
     
-    This is a simple routing table - will become more sophisticated
-    with capability matching in Phase 2.
+    Fast path: the body is {"jsonrpc", "id", "result": ...} with nothing
+    after the result. The gateway emits {"lord", "quest_type", "result":
+    then the Lord's result bytes, then ,"status": "success"} - the result is
+    never parsed. Bodies up to PROXY_BUFFER_LIMIT are checked whole and
+    sent in one piece; larger ones are streamed as they arrive.
+    Otherwise (error responses, "result": null, members after the result,
+    unknown shapes) the body is decoded.
     """
-    routing_table = {
-        # Lord Architect
-        "design_system": "architect",
-        "analyze_architecture": "architect",
-        "review_design": "architect",
+    chunks = response.aiter_bytes()
+    body = b""
+    match = None
+    done = False
+    try:
+        async for chunk in chunks:
+            body += chunk
+            match = _RESULT_KEY.search(body)
+            if match or len(body) > PROXY_HEAD_LIMIT:
+                break
+        else:
+            done = True
         
-        # Lord Scribe
-        "write_docs": "scribe",
-        "create_summary": "scribe",
-        "index_knowledge": "scribe",
-    }
+        if match and _is_plain_envelope(body[:match.start()]):
+            if not done:
+                async for chunk in chunks:
+                    body += chunk
+                    if len(body) > PROXY_BUFFER_LIMIT:
+                        break
+                else:
+                    done = True
+            
+            result = body[match.end():]
+            # JSON-RPC error responses may carry "result": null before "error"
+            if not result.lstrip().startswith(b"null"):
+                prefix = json_dumps({"lord": lord_name, "quest_type": quest_type})[:-1] + b',"result":'
+                if not done:
+                    stream = _stream_result(prefix, lord_name, result, chunks, response)
+                    response = None  # Closed by the stream
+                    return StreamingResponse(stream, media_type="application/json")
+                
+                value = _result_value(result)
+                if value is not None:
+                    return Response(content=prefix + value + _SUCCESS_SUFFIX, media_type="application/json")
+        
+        if not done:
+            async for chunk in chunks:
+                body += chunk
+    finally:
+        if response is not None:
+            await response.aclose()
+    
+    return _quest_response(lord_name, quest_type, json_loads(body))
+
+
+def _is_plain_envelope(envelope: bytes) -> bool:
+    """True if the bytes before "result" are just the jsonrpc/id members"""
+    envelope = envelope.rstrip()
+    if not envelope.endswith(b","):
+        return False
+    try:
+        members = json_loads(envelope[:-1] + b"}")
+    except ValueError:
+        return False
+    return isinstance(members, dict) and "id" in members and set(members) <= {"jsonrpc", "id"}
+
+
+def _result_value(rest: bytes) -> Optional[bytes]:
+    """
+    The result value's bytes, given everything after "result": (the body's tail).
+    
+    Returns:
+        The bytes without the envelope's closing brace, or None if the body
+        doesn't end right after the result (e.g. an "error" member follows).
+        Only the last PROXY_TAIL_LIMIT bytes are inspected.
+    """
+    rest = rest.rstrip()
+    if not rest.endswith(b"}"):
+        return None
+    
+    # A trailing member is a key whose remainder decodes as an object on its own
+    # (keys found inside result strings leave unbalanced quotes/braces behind)
+    tail_start = max(0, len(rest) - PROXY_TAIL_LIMIT)
+    for member in _MEMBER_KEY.finditer(rest, tail_start):
+        try:
+            json_loads(b"{" + rest[member.start() + 1:])
+        except ValueError:
+            continue
+        return None
+    return rest[:-1]
+
+
+async def _stream_result(
+    prefix: bytes,
+    lord_name: str,
+    first: bytes,
+    chunks: AsyncIterator[bytes],
+    response: httpx.Response,
+) -> AsyncIterator[bytes]:
+    """Yield prefix + the Lord's result bytes (minus its closing brace) + status"""
+    try:
+        yield prefix
+        # Hold the tail back: the envelope's closing brace (and anything else
+        # after the result) is in it
+        pending = first
+        async for chunk in chunks:
+            pending += chunk
+            if len(pending) > 2 * PROXY_TAIL_LIMIT:
+                yield pending[:-PROXY_TAIL_LIMIT]
+                pending = pending[-PROXY_TAIL_LIMIT:]
+        value = _result_value(pending)
+        if value is None:
+            # Headers are already sent: abort rather than report success
+            logger.error(f"Lord {lord_name} response has members after its result; aborting proxied stream")
+            raise RuntimeError(f"Lord {lord_name} returned a malformed JSON-RPC response")
+        yield value
+        yield _SUCCESS_SUFFIX
+    finally:
+        await response.aclose()
+
+
+def _quest_response(lord_name: str, quest_type: str, jsonrpc_response: Any) -> Response:
+    """Decoded path: check the JSON-RPC error field and wrap the result"""
+    # JSON-RPC 2.0 spec: only check if error key exists AND is not null
+    error = jsonrpc_response.get("error") if isinstance(jsonrpc_response, dict) else None
+    if error is not None and error != "None":
+        raise HTTPException(
+            status_code=500,
+            detail=f"Lord {lord_name} returned error: {error}"
+        )
+    
+    quest_response = QuestResponse(
+        lord=lord_name,
+        quest_type=quest_type,
+        result=jsonrpc_response.get("result") if isinstance(jsonrpc_response, dict) else None,
+        status="success"
+    )
+    return Response(content=json_dumps(quest_response.model_dump()), media_type="application/json")
+
+
+def _route_quest_to_lord(quest_type: str) -> Optional[str]:
+    """
+    Route quest type to appropriate Lord.
     
-    return routing_table.get(quest_type)
+    Looks the quest type up in the capability index built from tools/list
+    discovery; the first registered healthy Lord implementing it wins.
+    """
+    for lord_name in _capability_index.get(quest_type, ()):
+        if _health.is_healthy(lord_name):
+            return lord_name
+    return None
 
 
 if __name__ == "__main__":
@@ -5,141 +5,39 @@ Handles design_system, analyze_architecture, and review_design quests
 Minimal MCP server implementation following JSON-RPC 2.0 protocol.
 """
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any
 import logging
 
-# Initialize FastAPI app
-app = FastAPI(
-    title="Lord Architect MCP Server",
-    version="0.1.0",
-    description="System architecture and design patterns specialist"
-)
+from lord_server import LordServer
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-
-# JSON-RPC 2.0 models
-class JSONRPCRequest(BaseModel):
-    """JSON-RPC 2.0 request format"""
-    jsonrpc: str = "2.0"
-    method: str
-    params: Optional[Dict[str, Any]] = None
-    id: int
-
-
-class JSONRPCResponse(BaseModel):
-    """JSON-RPC 2.0 response format"""
-    jsonrpc: str = "2.0"
-    result: Optional[Any] = None
-    error: Optional[Dict[str, Any]] = None
-    id: int
-    
-    class Config:
-        # Exclude null fields from JSON output
-        exclude_none = True
-
-
-@app.get("/")
-async def root():
-    """Health check endpoint"""
-    return {
-        "lord": "Architect",
-        "status": "operational",
-        "capabilities": ["design_system", "analyze_architecture", "review_design"]
-    }
-
-
-@app.post("/mcp")
-async def handle_mcp_request(request: JSONRPCRequest):
-    """
-    Handle MCP JSON-RPC 2.0 requests.
-    
-    Supports:
-    - tools/list: List available tools
-    - tools/call: Execute a tool
-    """
-    logger.info(f"Received MCP request: method={request.method}, params={request.params}")
-    
-    try:
-        if request.method == "tools/list":
-            # Return list of available tools
-            result = {
-                "tools": [
-                    {
-                        "name": "design_system",
-                        "description": "Design a system architecture based on requirements",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "app_name": {"type": "string"},
-                                "requirements": {"type": "array", "items": {"type": "string"}},
-                                "scale": {"type": "string", "enum": ["small", "medium", "large"]}
-                            },
-                            "required": ["app_name"]
-                        }
-                    },
-                    {
-                        "name": "analyze_architecture",
-                        "description": "Analyze existing architecture and provide recommendations",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "architecture": {"type": "string"},
-                                "focus": {"type": "string"}
-                            }
-                        }
-                    }
-                ]
-            }
-            
-            return JSONRPCResponse(result=result, id=request.id)
-        
-        elif request.method == "tools/call":
-            # Execute a tool
-            params = request.params or {}
-            tool_name = params.get("name")
-            arguments = params.get("arguments", {})
-            
-            if tool_name == "design_system":
-                result = _design_system(arguments)
-            elif tool_name == "analyze_architecture":
-                result = _analyze_architecture(arguments)
-            else:
-                return JSONRPCResponse(
-                    error={
-                        "code": -32601,
-                        "message": f"Tool not found: {tool_name}"
-                    },
-                    id=request.id
-                )
-            
-            return JSONRPCResponse(result=result, id=request.id)
-        
-        else:
-            # Unsupported method
-            return JSONRPCResponse(
-                error={
-                    "code": -32601,
-                    "message": f"Method not found: {request.method}"
-                },
-                id=request.id
-            )
-            
-    except Exception as e:
-        logger.error(f"Error processing request: {e}")
-        return JSONRPCResponse(
-            error={
-                "code": -32603,
-                "message": f"Internal error: {str(e)}"
-            },
-            id=request.id
-        )
-
-
+# MCP server (JSON-RPC dispatch, tools/list, timing - see lord_server.py)
+server = LordServer(
+    "architect",
+    title="Lord Architect MCP Server",
+    version="0.1.0",
+    description="System architecture and design patterns specialist",
+    port=8001,
+)
+app = server.app
+
+
+@server.tool(
+    "design_system",
+    "Design a system architecture based on requirements",
+    {
+        "type": "object",
+        "properties": {
+            "app_name": {"type": "string"},
+            "requirements": {"type": "array", "items": {"type": "string"}},
+            "scale": {"type": "string", "enum": ["small", "medium", "large"]}
+        },
+        "required": ["app_name"]
+    },
+)
 def _design_system(arguments: Dict[str, Any]) -> Dict[str, Any]:
     """
     Design a system architecture.
@@ -212,6 +110,17 @@ Requirements: {len(requirements)} specified
     }
 
 
+@server.tool(
+    "analyze_architecture",
+    "Analyze existing architecture and provide recommendations",
+    {
+        "type": "object",
+        "properties": {
+            "architecture": {"type": "string"},
+            "focus": {"type": "string"}
+        }
+    },
+)
 def _analyze_architecture(arguments: Dict[str, Any]) -> Dict[str, Any]:
     """
     Analyze existing architecture.
@@ -262,7 +171,5 @@ def _analyze_architecture(arguments: Dict[str, Any]) -> Dict[str, Any]:
 
 
 if __name__ == "__main__":
-    import uvicorn
-    
     logger.info("Starting Lord Architect MCP Server on port 8001...")
-    uvicorn.run(app, host="0.0.0.0", port=8001)
+    server.run(port=8001)
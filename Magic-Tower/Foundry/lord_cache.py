@@ -0,0 +1,286 @@
+"""
+Lord Result Cache - Content-addressed memoization of Lord tool calls
+
+Identical (lord_name, tool_name, arguments) calls return identical results
+for deterministic Lords, so QuestExecutor can skip the round trip entirely.
+
+Architecture:
+- Canonical key: SHA-256 of sorted, compact JSON of the call
+- Memory tier: LRU with TTL, entry-count and byte-size eviction
+- Persistent tier (optional): lord_result_cache table in the QuestRepository SQLite file
+- Hit/miss/eviction counters for observability
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+def canonical_json(value: Any) -> str:
+    """Deterministic JSON encoding (sorted keys, no whitespace)"""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def canonical_key(*parts: Any) -> str:
+    """
+    Content-address a call.
+
+    Args:
+        parts: Call components, e.g. (lord_name, tool_name, arguments)
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON encoding
+    """
+    return hashlib.sha256(canonical_json(list(parts)).encode("utf-8")).hexdigest()
+
+
+class LRUTTLCache:
+    """
+    In-memory LRU cache with per-entry TTL and entry/byte limits.
+
+    Values are sized with `sizeof` (default: len). max_bytes is a byte
+    budget only if values are bytes or sizeof returns their size in bytes.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = 64 * 1024 * 1024,
+        default_ttl: Optional[float] = 300.0,
+        sizeof: Callable[[Any], int] = len,
+    ):
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._sizeof = sizeof
+        # key -> (value, expires_at, size)
+        self._entries: "OrderedDict[str, Tuple[Any, Optional[float], int]]" = OrderedDict()
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return self._lookup(key, touch=False) is not None
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return cached value (refreshing recency) or None on miss/expiry"""
+        entry = self._lookup(key, touch=True)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[0]
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds to live (default_ttl if None, 0/negative disables expiry)
+
+        Returns:
+            False if the value alone exceeds max_bytes (not cached)
+        """
+        size = self._sizeof(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return False
+
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl and ttl > 0 else None
+
+        self.delete(key)
+        self._entries[key] = (value, expires_at, size)
+        self._bytes += size
+        self._evict()
+        return True
+
+    def peek(self, key: str) -> Optional[Any]:
+        """Return cached value without refreshing recency or counting a lookup"""
+        entry = self._lookup(key, touch=False)
+        return entry[0] if entry is not None else None
+
+    def delete(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry[2]
+        return True
+
+    def clear(self) -> int:
+        """Drop every entry, returning how many were removed"""
+        count = len(self._entries)
+        self._entries.clear()
+        self._bytes = 0
+        return count
+
+    def ttl_remaining(self, key: str) -> Optional[float]:
+        """Seconds until expiry (None if missing or never expires)"""
+        entry = self._lookup(key, touch=False)
+        if entry is None or entry[1] is None:
+            return None
+        return max(0.0, entry[1] - time.monotonic())
+
+    def keys(self):
+        return list(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def _lookup(self, key: str, touch: bool) -> Optional[Tuple[Any, Optional[float], int]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] is not None and entry[1] <= time.monotonic():
+            self.delete(key)
+            self.expirations += 1
+            return None
+        if touch:
+            self._entries.move_to_end(key)
+        return entry
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        ):
+            _, (_, _, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+
+
+class LordResultCache:
+    """
+    Two-tier memoization of Lord tool results.
+
+    Results are stored as UTF-8 encoded canonical JSON, so every hit returns
+    a fresh copy that callers can mutate without corrupting the cache, and
+    max_bytes counts encoded bytes. An entry promoted from the persistent
+    tier keeps its persistent expiry.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = 64 * 1024 * 1024,
+        ttl: Optional[float] = 300.0,
+        repository: Optional[Any] = None,
+        enabled_by_default: bool = True,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Memory tier entry limit
+            max_bytes: Memory tier size limit (encoded JSON bytes)
+            ttl: Seconds a result stays valid (None/0 = no expiry)
+            repository: Optional QuestRepository used as the persistent tier
+            enabled_by_default: Cache steps that don't set LordStep.cache
+        """
+        self.ttl = ttl
+        self.repository = repository
+        self.enabled_by_default = enabled_by_default
+        self.memory = LRUTTLCache(max_entries=max_entries, max_bytes=max_bytes, default_ttl=ttl)
+
+        self.hits = 0
+        self.misses = 0
+        self.memory_hits = 0
+        self.persistent_hits = 0
+        self.stores = 0
+
+    @staticmethod
+    def key_for(lord_name: str, tool_name: str, arguments: Dict[str, Any]) -> str:
+        return canonical_key(lord_name, tool_name, arguments)
+
+    def enabled_for(self, step_cache: Optional[bool]) -> bool:
+        """Resolve per-step opt-in/opt-out against the cache default"""
+        return self.enabled_by_default if step_cache is None else step_cache
+
+    async def get(self, lord_name: str, tool_name: str, arguments: Dict[str, Any]) -> Tuple[bool, Any]:
+        """
+        Look up a call result.
+
+        Returns:
+            (hit, result) - result is a fresh decoded copy on hit
+        """
+        key = self.key_for(lord_name, tool_name, arguments)
+
+        encoded = self.memory.get(key)
+        if encoded is not None:
+            self.hits += 1
+            self.memory_hits += 1
+            return True, json.loads(encoded)
+
+        if self.repository is not None:
+            entry = await asyncio.to_thread(self.repository.get_cached_entry, key)
+            if entry is not None:
+                encoded, expires_at = entry
+                self.hits += 1
+                self.persistent_hits += 1
+                # Promote to memory tier, expiring no later than the persistent entry
+                ttl = None
+                if expires_at is not None:
+                    ttl = expires_at - time.time()
+                    if self.ttl and self.ttl < ttl:
+                        ttl = self.ttl
+                if ttl is None or ttl > 0:
+                    self.memory.set(key, encoded.encode("utf-8"), ttl=ttl)
+                return True, json.loads(encoded)
+
+        self.misses += 1
+        return False, None
+
+    async def put(self, lord_name: str, tool_name: str, arguments: Dict[str, Any], result: Any):
+        """Store a successful call result in both tiers"""
+        key = self.key_for(lord_name, tool_name, arguments)
+        encoded = canonical_json(result)
+
+        self.memory.set(key, encoded.encode("utf-8"))
+        self.stores += 1
+
+        if self.repository is not None:
+            expires_at = time.time() + self.ttl if self.ttl else None
+            await asyncio.to_thread(
+                self.repository.put_cached_result, key, lord_name, tool_name, encoded, expires_at
+            )
+
+    def clear(self):
+        """Drop the memory tier (persistent entries expire by TTL)"""
+        self.memory.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "memory_hits": self.memory_hits,
+            "persistent_hits": self.persistent_hits,
+            "stores": self.stores,
+            "persistent": self.repository is not None,
+            "memory": self.memory.stats(),
+        }
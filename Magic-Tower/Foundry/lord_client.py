@@ -0,0 +1,422 @@
+"""
+Lord Client Pool - Long-lived HTTP connections to Lord MCP servers
+
+Replaces the per-call httpx.AsyncClient in QuestExecutor with one pooled,
+keep-alive client per Lord endpoint, so steps and retries reuse warm
+connections instead of paying a TCP handshake every time.
+
+Architecture:
+- One httpx.AsyncClient per Lord base URL (lazily created)
+- Shared limits / keep-alive / HTTP/2 settings via LordClientConfig
+- Lifecycle: async context manager or explicit aclose()
+- Per-Lord request statistics for observability
+- stream(): raw-bytes POST with an unread response body, for proxying
+- JsonRpcBatcher: coalesces concurrent calls to one endpoint into a
+  JSON-RPC 2.0 batch request, correlating responses by unique id
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+import httpx
+
+try:
+    import h2  # noqa: F401  (required by httpx for HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LordClientConfig:
+    """Connection pool settings shared by every Lord client"""
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    timeout: float = 30.0
+    connect_timeout: float = 5.0
+
+    def __post_init__(self):
+        self.max_connections = max(1, self.max_connections)
+        self.max_keepalive_connections = min(self.max_connections, max(0, self.max_keepalive_connections))
+        self.keepalive_expiry = max(0.0, self.keepalive_expiry)
+
+    def limits(self) -> httpx.Limits:
+        """Build httpx pool limits from this config"""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeouts(self, read: Optional[float] = None) -> httpx.Timeout:
+        """Build httpx timeouts from this config (read optionally overridden per request)"""
+        return httpx.Timeout(self.timeout, connect=self.connect_timeout, read=self.timeout if read is None else read)
+
+
+@dataclass
+class LordPoolStats:
+    """Request counters for a single Lord endpoint"""
+    lord_name: str
+    base_url: str
+    requests: int = 0
+    errors: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+    total_time: float = 0.0
+    created_at: float = field(default_factory=time.time)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "lord_name": self.lord_name,
+            "base_url": self.base_url,
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "avg_latency_seconds": self.total_time / self.requests if self.requests else None,
+        }
+
+
+class LordClientPool:
+    """
+    Pooled HTTP clients for Lord MCP servers.
+
+    Usage:
+        async with LordClientPool(LordClientConfig(http2=True)) as pool:
+            response = await pool.post("architect", "http://localhost:8001", "/mcp", payload)
+    """
+
+    def __init__(
+        self,
+        config: Optional[LordClientConfig] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Initialize client pool.
+
+        Args:
+            config: Pool limits, keep-alive and HTTP/2 settings
+            transport: Optional transport shared by all clients (e.g. httpx.MockTransport for tests)
+        """
+        self.config = config or LordClientConfig()
+        self._transport = transport
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._stats: Dict[str, LordPoolStats] = {}
+        self._closed = False
+
+        if self.config.http2 and not HTTP2_AVAILABLE:
+            logger.warning("HTTP/2 requested but 'h2' is not installed - falling back to HTTP/1.1")
+
+    async def __aenter__(self) -> "LordClientPool":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def client_for(
+        self,
+        lord_name: str,
+        base_url: str,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> httpx.AsyncClient:
+        """
+        Get (or lazily create) the pooled client for a Lord endpoint.
+
+        Args:
+            lord_name: Name of Lord (used for statistics)
+            base_url: Lord origin, e.g. "http://localhost:8001"
+            transport: Endpoint-specific transport (e.g. httpx.ASGITransport for
+                in-process Lords); overrides the pool-wide transport
+
+        Returns:
+            Long-lived httpx.AsyncClient bound to base_url
+        """
+        if self._closed:
+            raise RuntimeError("LordClientPool is closed")
+
+        client = self._clients.get(base_url)
+        if client is None:
+            client = httpx.AsyncClient(
+                base_url=base_url,
+                limits=self.config.limits(),
+                timeout=self.config.timeouts(),
+                http2=self.config.http2 and HTTP2_AVAILABLE,
+                transport=transport or self._transport,
+            )
+            self._clients[base_url] = client
+            self._stats[base_url] = LordPoolStats(lord_name=lord_name, base_url=base_url)
+
+        return client
+
+    async def post(
+        self,
+        lord_name: str,
+        base_url: str,
+        path: str,
+        payload: Any,
+        timeout: Optional[float] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> httpx.Response:
+        """
+        POST a JSON payload to a Lord over its pooled connection.
+
+        Args:
+            lord_name: Name of Lord
+            base_url: Lord origin
+            path: Request path (e.g. "/mcp")
+            payload: JSON-serializable body
+            timeout: Optional per-request read timeout (seconds); connect, write
+                and pool timeouts keep the config values
+            transport: Endpoint-specific transport used when the client is first created
+
+        Returns:
+            httpx.Response (status already checked)
+        """
+        client = self.client_for(lord_name, base_url, transport)
+        stats = self._stats[base_url]
+
+        stats.requests += 1
+        stats.in_flight += 1
+        stats.max_in_flight = max(stats.max_in_flight, stats.in_flight)
+        start = time.perf_counter()
+
+        try:
+            kwargs = {"json": payload}
+            if timeout is not None:
+                kwargs["timeout"] = self.config.timeouts(read=timeout)
+            response = await client.post(path, **kwargs)
+            response.raise_for_status()
+            return response
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            stats.in_flight -= 1
+            stats.total_time += time.perf_counter() - start
+
+    async def stream(
+        self,
+        lord_name: str,
+        base_url: str,
+        path: str,
+        content: bytes,
+        timeout: Optional[float] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> httpx.Response:
+        """
+        POST an already-encoded JSON body and return the response unread.
+
+        Used for proxying: the caller iterates response.aiter_bytes() and must
+        call response.aclose() when done. Latency is measured to headers.
+
+        Returns:
+            httpx.Response with a streaming body (status already checked)
+        """
+        client = self.client_for(lord_name, base_url, transport)
+        stats = self._stats[base_url]
+
+        stats.requests += 1
+        stats.in_flight += 1
+        stats.max_in_flight = max(stats.max_in_flight, stats.in_flight)
+        start = time.perf_counter()
+
+        try:
+            request = client.build_request(
+                "POST", path, content=content, headers={"Content-Type": "application/json"},
+                timeout=self.config.timeouts(read=timeout) if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+            )
+            response = await client.send(request, stream=True)
+            if response.is_error:
+                await response.aclose()
+            response.raise_for_status()
+            return response
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            stats.in_flight -= 1
+            stats.total_time += time.perf_counter() - start
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Config summary plus per-endpoint request counters and open connections
+        """
+        endpoints = {}
+        for base_url, stats in self._stats.items():
+            entry = stats.as_dict()
+            entry["open_connections"] = self._open_connections(self._clients.get(base_url))
+            endpoints[base_url] = entry
+
+        return {
+            "closed": self._closed,
+            "http2": self.config.http2 and HTTP2_AVAILABLE,
+            "max_connections": self.config.max_connections,
+            "max_keepalive_connections": self.config.max_keepalive_connections,
+            "keepalive_expiry": self.config.keepalive_expiry,
+            "endpoints": endpoints,
+        }
+
+    @staticmethod
+    def _open_connections(client: Optional[httpx.AsyncClient]) -> Optional[int]:
+        """Best-effort count of open connections (httpcore pool internals)"""
+        if client is None:
+            return None
+        pool = getattr(getattr(client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        return len(connections) if connections is not None else None
+
+    async def aclose(self):
+        """Close every pooled client and release connections"""
+        self._closed = True
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+
+# ============================================================
+# JSON-RPC BATCHING
+# ============================================================
+
+BatchSender = Callable[[Any], Awaitable[Any]]
+
+
+@dataclass
+class _PendingBatch:
+    send: BatchSender
+    calls: List[Tuple[Dict[str, Any], asyncio.Future]] = field(default_factory=list)
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+class JsonRpcBatcher:
+    """
+    Merges concurrent JSON-RPC calls to the same endpoint into one batch.
+
+    The first call for a key opens a window; calls arriving within it are
+    sent together as a JSON-RPC 2.0 batch array. Every request gets a
+    unique id, so responses are matched regardless of order. A window with
+    a single call is sent as a plain request object.
+
+    Usage:
+        batcher = JsonRpcBatcher(window=0.002)
+        response = await batcher.call("http://localhost:8004", request, send)
+    """
+
+    def __init__(self, window: float = 0.002, max_batch_size: int = 32):
+        """
+        Initialize batcher.
+
+        Args:
+            window: Seconds to wait for more calls after the first one
+            max_batch_size: Flush immediately once this many calls are queued
+        """
+        self.window = max(0.0, window)
+        self.max_batch_size = max(1, max_batch_size)
+        self._ids = itertools.count(1)
+        self._pending: Dict[Hashable, _PendingBatch] = {}
+        self._tasks: set = set()
+
+        self.calls = 0
+        self.requests_sent = 0
+        self.batches_sent = 0
+        self.max_batch_seen = 0
+
+    def next_id(self) -> int:
+        """Unique JSON-RPC request id"""
+        return next(self._ids)
+
+    async def call(self, key: Hashable, request: Dict[str, Any], send: BatchSender) -> Dict[str, Any]:
+        """
+        Queue a request and wait for its response object.
+
+        Args:
+            key: Batch key, e.g. (endpoint URL, timeout); calls sharing a key must
+                be interchangeable in how they are sent
+            request: JSON-RPC request object (its id is replaced with a unique one)
+            send: Coroutine function posting a request object or batch array,
+                returning the decoded response body (the first caller's is used
+                for the whole batch)
+
+        Returns:
+            The JSON-RPC response object for this request (id restored)
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        original_id = request.get("id")
+        request = {**request, "id": self.next_id()}
+        self.calls += 1
+
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = _PendingBatch(send=send)
+            batch.timer = loop.call_later(self.window, self._flush, key)
+        batch.calls.append((request, future))
+        if len(batch.calls) >= self.max_batch_size:
+            self._flush(key)
+
+        response = await future
+        return {**response, "id": original_id}
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "requests_sent": self.requests_sent,
+            "batches_sent": self.batches_sent,
+            "max_batch_size": self.max_batch_seen,
+            "pending": sum(len(batch.calls) for batch in self._pending.values()),
+        }
+
+    def _flush(self, key: Hashable):
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.ensure_future(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: _PendingBatch):
+        calls = [(request, future) for request, future in batch.calls if not future.done()]
+        if not calls:
+            return
+
+        payload: Any = calls[0][0] if len(calls) == 1 else [request for request, _ in calls]
+        self.requests_sent += 1
+        if len(calls) > 1:
+            self.batches_sent += 1
+            self.max_batch_seen = max(self.max_batch_seen, len(calls))
+
+        try:
+            body = await batch.send(payload)
+        except Exception as e:
+            for _, future in calls:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        responses = body if isinstance(body, list) else [body]
+        by_id = {response.get("id"): response for response in responses if isinstance(response, dict)}
+        for request, future in calls:
+            if future.done():
+                continue
+            response = by_id.get(request["id"])
+            if response is None:
+                future.set_exception(RuntimeError(f"No JSON-RPC response for request id {request['id']}"))
+            else:
+                future.set_result(response)
@@ -10,76 +10,33 @@ Tools:
 - create_api: Build REST API endpoints
 """
 
-import json
 import asyncio
 from typing import Any, Dict
-from fastapi import FastAPI, Request
-from pydantic import BaseModel
-
-
-app = FastAPI(title="Lord Forge Master MCP Server")
-
-
-class JsonRpcRequest(BaseModel):
-    jsonrpc: str
-    method: str
-    params: Dict[str, Any]
-    id: int
-
-
-class JsonRpcResponse(BaseModel):
-    jsonrpc: str
-    result: Any = None
-    error: Any = None
-    id: int
-
-
-@app.post("/mcp")
-async def handle_jsonrpc(request: Request):
-    """Handle JSON-RPC 2.0 requests (MCP protocol)"""
-    try:
-        body = await request.json()
-        rpc_request = JsonRpcRequest(**body)
-        
-        # MCP protocol: tools/call with nested name and arguments
-        if rpc_request.method == "tools/call":
-            tool_name = rpc_request.params.get("name")
-            arguments = rpc_request.params.get("arguments", {})
-            
-            # Route to tool handler
-            if tool_name == "generate_code":
-                result = await generate_code(arguments)
-            elif tool_name == "refactor_code":
-                result = await refactor_code(arguments)
-            elif tool_name == "create_api":
-                result = await create_api(arguments)
-            else:
-                return JsonRpcResponse(
-                    jsonrpc="2.0",
-                    error={"code": -32601, "message": f"Tool not found: {tool_name}"},
-                    id=rpc_request.id
-                ).dict()
-        else:
-            return JsonRpcResponse(
-                jsonrpc="2.0",
-                error={"code": -32601, "message": f"Method not found: {rpc_request.method}"},
-                id=rpc_request.id
-            ).dict()
-        
-        return JsonRpcResponse(
-            jsonrpc="2.0",
-            result=result,
-            id=rpc_request.id
-        ).dict()
-    
-    except Exception as e:
-        return JsonRpcResponse(
-            jsonrpc="2.0",
-            error={"code": -32603, "message": str(e)},
-            id=body.get("id", 0)
-        ).dict()
 
+from lord_server import LordServer
+
+
+# MCP server (JSON-RPC dispatch, tools/list, timing - see lord_server.py)
+server = LordServer(
+    "forge_master",
+    title="Lord Forge Master MCP Server",
+    description="Code generation specialist",
+    port=8003,
+)
+app = server.app
 
+
+@server.tool(
+    "generate_code",
+    "Generate code from architecture design",
+    {
+        "type": "object",
+        "properties": {
+            "design": {"type": "string"},
+            "language": {"type": "string"},
+        },
+    },
+)
 async def generate_code(params: Dict[str, Any]) -> Dict[str, Any]:
     """
     Generate code from system design
@@ -169,6 +126,18 @@ def test_token_verification():
     }
 
 
+@server.tool(
+    "refactor_code",
+    "Improve existing code structure",
+    {
+        "type": "object",
+        "properties": {
+            "code": {"type": "string"},
+            "strategy": {"type": "string"},
+        },
+        "required": ["code"],
+    },
+)
 async def refactor_code(params: Dict[str, Any]) -> Dict[str, Any]:
     """
     Refactor existing code for better structure
@@ -201,6 +170,17 @@ async def refactor_code(params: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+@server.tool(
+    "create_api",
+    "Build REST API endpoints",
+    {
+        "type": "object",
+        "properties": {
+            "resources": {"type": "array", "items": {"type": "string"}},
+            "framework": {"type": "string"},
+        },
+    },
+)
 async def create_api(params: Dict[str, Any]) -> Dict[str, Any]:
     """
     Create REST API endpoints
@@ -243,13 +223,6 @@ async def create_api(params: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-@app.get("/health")
-async def health():
-    """Health check endpoint"""
-    return {"status": "healthy", "lord": "forge_master"}
-
-
 if __name__ == "__main__":
-    import uvicorn
     print("🔥 Lord Forge Master MCP Server starting on port 8003...")
-    uvicorn.run(app, host="127.0.0.1", port=8003)
+    server.run(host="127.0.0.1", port=8003)
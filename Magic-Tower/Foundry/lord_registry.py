@@ -0,0 +1,383 @@
+"""
+Lord Registry - Multi-replica Lord endpoints with client-side load balancing
+
+Lets QuestExecutor spread calls for a hot Lord (e.g. several lord_sentinel.py
+processes on different ports) across replicas, and route around replicas
+that are failing or slow.
+
+Architecture:
+- LordEndpoint: one replica URL plus live counters (outstanding, EWMA latency)
+- Pluggable balancing strategies: round-robin, least-outstanding, EWMA latency
+- Passive health: consecutive failures (or slow responses) eject a replica
+  for a cooldown, after which it is probed again by normal traffic
+- Panic mode: if every replica is ejected, the least recently ejected one is
+  still used so a Lord never becomes unroutable
+- Per-Lord window of successful latencies (percentiles drive request hedging)
+- Per-replica transport: "http" (port/URL) or "inproc" (the Lord's ASGI app
+  called in-process via httpx.ASGITransport - no loopback TCP)
+"""
+
+import importlib
+import itertools
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import httpx
+
+# Port, URL, "inproc", "inproc:module:attr", or an ASGI app object
+EndpointSpec = Union[int, str, Any]
+
+INPROC = "inproc"
+
+# Default in-process app for each Lord ("inproc" spec)
+INPROC_APPS = {
+    "architect": "lord_architect:app",
+    "scribe": "lord_scribe:app",
+    "forge_master": "lord_forge_master:app",
+    "sentinel": "lord_sentinel:app",
+}
+
+
+class UnknownLordError(ValueError):
+    """Raised when a Lord has no registered replicas"""
+
+
+def endpoint_url(spec: EndpointSpec) -> str:
+    """Normalize a registry entry (port number or URL) to a base URL"""
+    if isinstance(spec, int):
+        return f"http://localhost:{spec}"
+    return spec.rstrip("/")
+
+
+def load_asgi_app(target: str) -> Any:
+    """Import an ASGI app from a "module:attr" string (attr defaults to "app")"""
+    module_name, _, attr = target.partition(":")
+    return getattr(importlib.import_module(module_name), attr or "app")
+
+
+def resolve_endpoint(lord_name: str, spec: EndpointSpec) -> Tuple[str, str, Any]:
+    """
+    Resolve a registry entry.
+
+    Returns:
+        (base_url, transport, app) - app is an ASGI app or "module:attr"
+        string for "inproc" replicas, None for "http"
+    """
+    if isinstance(spec, (int, str)) and not (isinstance(spec, str) and spec.split(":", 1)[0] == INPROC):
+        return endpoint_url(spec), "http", None
+
+    if isinstance(spec, str):
+        target = spec[len(INPROC) + 1:] or INPROC_APPS.get(lord_name)
+        if not target:
+            raise ValueError(f"No in-process app known for Lord {lord_name}; use 'inproc:module:attr'")
+        module_name, _, attr = target.partition(":")
+        suffix = "" if attr in ("", "app") else f"-{attr}"
+        return f"http://{module_name.replace('_', '-')}{suffix}.inproc", INPROC, target
+
+    # ASGI app object
+    return f"http://{lord_name.replace('_', '-')}-{id(spec):x}.inproc", INPROC, spec
+
+
+@dataclass
+class LordEndpoint:
+    """A single Lord replica and its passive health state"""
+    lord_name: str
+    url: str
+    outstanding: int = 0
+    ewma_latency: Optional[float] = None
+    consecutive_failures: int = 0
+    ejected_until: float = 0.0
+    requests: int = 0
+    failures: int = 0
+    ejections: int = 0
+    created_at: float = field(default_factory=time.time)
+    transport: str = "http"
+    app: Any = field(default=None, repr=False)
+    _asgi_transport: Optional[httpx.ASGITransport] = field(default=None, repr=False)
+
+    def asgi_transport(self) -> Optional[httpx.ASGITransport]:
+        """In-process transport for "inproc" replicas (app imported on first use)"""
+        if self.transport != INPROC:
+            return None
+        if self._asgi_transport is None:
+            app = load_asgi_app(self.app) if isinstance(self.app, str) else self.app
+            self._asgi_transport = httpx.ASGITransport(app=app)
+        return self._asgi_transport
+
+    def available(self, now: Optional[float] = None) -> bool:
+        """True unless the replica is inside its ejection cooldown"""
+        return (now if now is not None else time.monotonic()) >= self.ejected_until
+
+    def as_dict(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "url": self.url,
+            "transport": self.transport,
+            "available": self.available(now),
+            "ejected_for_seconds": max(0.0, self.ejected_until - now),
+            "outstanding": self.outstanding,
+            "ewma_latency_seconds": self.ewma_latency,
+            "requests": self.requests,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "ejections": self.ejections,
+        }
+
+
+# ============================================================
+# BALANCING STRATEGIES
+# ============================================================
+
+class BalancingStrategy:
+    """Picks one replica from the currently available candidates"""
+
+    name = "base"
+
+    def choose(self, lord_name: str, candidates: List[LordEndpoint]) -> LordEndpoint:
+        raise NotImplementedError
+
+
+class RoundRobinStrategy(BalancingStrategy):
+    """Rotate through replicas in order"""
+
+    name = "round_robin"
+
+    def __init__(self):
+        self._counters: Dict[str, "itertools.count[int]"] = {}
+
+    def choose(self, lord_name: str, candidates: List[LordEndpoint]) -> LordEndpoint:
+        counter = self._counters.setdefault(lord_name, itertools.count())
+        return candidates[next(counter) % len(candidates)]
+
+
+class LeastOutstandingStrategy(BalancingStrategy):
+    """Send to the replica with the fewest in-flight requests (ties broken randomly)"""
+
+    name = "least_outstanding"
+
+    def choose(self, lord_name: str, candidates: List[LordEndpoint]) -> LordEndpoint:
+        fewest = min(endpoint.outstanding for endpoint in candidates)
+        return random.choice([endpoint for endpoint in candidates if endpoint.outstanding == fewest])
+
+
+class EWMAStrategy(BalancingStrategy):
+    """
+    Latency-weighted: score = EWMA latency * (outstanding + 1).
+
+    Replicas without samples score 0 so they get probed first.
+    """
+
+    name = "ewma"
+
+    def choose(self, lord_name: str, candidates: List[LordEndpoint]) -> LordEndpoint:
+        def score(endpoint: LordEndpoint) -> float:
+            return (endpoint.ewma_latency or 0.0) * (endpoint.outstanding + 1)
+
+        best = min(score(endpoint) for endpoint in candidates)
+        return random.choice([endpoint for endpoint in candidates if score(endpoint) == best])
+
+
+STRATEGIES = {
+    RoundRobinStrategy.name: RoundRobinStrategy,
+    LeastOutstandingStrategy.name: LeastOutstandingStrategy,
+    EWMAStrategy.name: EWMAStrategy,
+}
+
+
+# ============================================================
+# REGISTRY
+# ============================================================
+
+class LordRegistry:
+    """
+    Replica sets for every Lord.
+
+    Usage:
+        registry = LordRegistry({"architect": "inproc", "sentinel": [8004, 8014]}, strategy="ewma")
+        endpoint = registry.acquire("sentinel")
+        try:
+            ...  # call endpoint.url
+            registry.release(endpoint, latency, ok=True)
+        except Exception:
+            registry.release(endpoint, latency, ok=False)
+    """
+
+    def __init__(
+        self,
+        endpoints: Optional[Dict[str, Union[EndpointSpec, Iterable[EndpointSpec]]]] = None,
+        strategy: Union[str, BalancingStrategy] = "round_robin",
+        failure_threshold: int = 3,
+        slow_threshold: Optional[float] = None,
+        ejection_cooldown: float = 30.0,
+        ewma_alpha: float = 0.3,
+        latency_window: int = 200,
+    ):
+        """
+        Initialize registry.
+
+        Args:
+            endpoints: Lord name -> endpoint spec or list of specs (port, URL,
+                "inproc", "inproc:module:attr" or an ASGI app)
+            strategy: Strategy name (see STRATEGIES) or BalancingStrategy instance
+            failure_threshold: Consecutive failures before a replica is ejected
+            slow_threshold: Responses slower than this (seconds) count as failures (None = off)
+            ejection_cooldown: Seconds an ejected replica is skipped
+            ewma_alpha: Weight of the newest latency sample
+            latency_window: Successful latencies kept per Lord for percentiles
+        """
+        if isinstance(strategy, str):
+            if strategy not in STRATEGIES:
+                raise ValueError(f"Unknown balancing strategy: {strategy} (expected one of {sorted(STRATEGIES)})")
+            strategy = STRATEGIES[strategy]()
+        self.strategy = strategy
+        self.failure_threshold = max(1, failure_threshold)
+        self.slow_threshold = slow_threshold
+        self.ejection_cooldown = max(0.0, ejection_cooldown)
+        self.ewma_alpha = min(1.0, max(0.0, ewma_alpha))
+        self._endpoints: Dict[str, List[LordEndpoint]] = {}
+        self._latency_window = max(1, latency_window)
+        self._latencies: Dict[str, "deque[float]"] = {}
+
+        for lord_name, specs in (endpoints or {}).items():
+            if isinstance(specs, (int, str)):
+                specs = [specs]
+            for spec in specs:
+                self.add_endpoint(lord_name, spec)
+
+    def __contains__(self, lord_name: str) -> bool:
+        return bool(self._endpoints.get(lord_name))
+
+    def lord_names(self) -> List[str]:
+        return [name for name, endpoints in self._endpoints.items() if endpoints]
+
+    def endpoints(self, lord_name: str) -> List[LordEndpoint]:
+        return list(self._endpoints.get(lord_name, []))
+
+    def add_endpoint(self, lord_name: str, spec: EndpointSpec) -> LordEndpoint:
+        """Register a replica (no-op if the URL is already registered)"""
+        url, transport, app = resolve_endpoint(lord_name, spec)
+        replicas = self._endpoints.setdefault(lord_name, [])
+        for endpoint in replicas:
+            if endpoint.url == url:
+                return endpoint
+        endpoint = LordEndpoint(lord_name=lord_name, url=url, transport=transport, app=app)
+        replicas.append(endpoint)
+        return endpoint
+
+    def remove_endpoint(self, lord_name: str, spec: EndpointSpec) -> bool:
+        """Drop a replica; in-flight requests finish normally"""
+        url = resolve_endpoint(lord_name, spec)[0]
+        replicas = self._endpoints.get(lord_name, [])
+        for endpoint in replicas:
+            if endpoint.url == url:
+                replicas.remove(endpoint)
+                return True
+        return False
+
+    def has_available(self, lord_name: str, exclude: Iterable[str] = ()) -> bool:
+        """True if a replica outside exclude is available (not ejected)"""
+        now = time.monotonic()
+        excluded = set(exclude)
+        return any(e.available(now) and e.url not in excluded for e in self._endpoints.get(lord_name, []))
+
+    def acquire(self, lord_name: str, exclude: Iterable[str] = ()) -> LordEndpoint:
+        """
+        Pick a replica and count the request as outstanding.
+
+        Args:
+            lord_name: Name of Lord
+            exclude: Replica URLs to avoid if any other replica is available
+
+        Returns:
+            Chosen LordEndpoint (must be passed back to release())
+
+        Raises:
+            UnknownLordError: If the Lord has no registered replicas
+        """
+        replicas = self._endpoints.get(lord_name)
+        if not replicas:
+            raise UnknownLordError(f"Unknown Lord: {lord_name}")
+
+        now = time.monotonic()
+        excluded = set(exclude)
+        candidates = [e for e in replicas if e.available(now) and e.url not in excluded]
+        if not candidates:
+            candidates = [e for e in replicas if e.available(now)]
+        if candidates:
+            endpoint = self.strategy.choose(lord_name, candidates)
+        else:
+            # Panic mode: every replica is ejected - use the one closest to returning
+            endpoint = min(replicas, key=lambda e: e.ejected_until)
+
+        endpoint.outstanding += 1
+        endpoint.requests += 1
+        return endpoint
+
+    def release(self, endpoint: LordEndpoint, latency: float, ok: Optional[bool]):
+        """
+        Record the outcome of a request from acquire().
+
+        Args:
+            endpoint: Replica returned by acquire()
+            latency: Request duration in seconds
+            ok: True on success, False on failure, None for no health signal (e.g. cancelled)
+        """
+        endpoint.outstanding = max(0, endpoint.outstanding - 1)
+        if ok is None:
+            return
+
+        if self.slow_threshold is not None and latency > self.slow_threshold:
+            ok = False
+
+        if endpoint.ewma_latency is None:
+            endpoint.ewma_latency = latency
+        else:
+            endpoint.ewma_latency += self.ewma_alpha * (latency - endpoint.ewma_latency)
+
+        if ok:
+            endpoint.consecutive_failures = 0
+            self._latencies.setdefault(
+                endpoint.lord_name, deque(maxlen=self._latency_window)
+            ).append(latency)
+            return
+
+        endpoint.failures += 1
+        endpoint.consecutive_failures += 1
+        # A replica back from ejection is re-ejected on its first failure
+        if endpoint.consecutive_failures >= self.failure_threshold:
+            endpoint.ejected_until = time.monotonic() + self.ejection_cooldown
+            endpoint.ejections += 1
+
+    def latency_percentile(self, lord_name: str, percentile: float, min_samples: int = 1) -> Optional[float]:
+        """
+        Observed latency percentile for a Lord (successful requests only).
+
+        Args:
+            lord_name: Name of Lord
+            percentile: 0-100
+            min_samples: Return None until at least this many samples exist
+
+        Returns:
+            Latency in seconds (nearest-rank), or None without enough samples
+        """
+        samples = self._latencies.get(lord_name)
+        if not samples or len(samples) < max(1, min_samples):
+            return None
+        ordered = sorted(samples)
+        rank = min(len(ordered) - 1, max(0, int(round(percentile / 100 * len(ordered))) - 1))
+        return ordered[rank]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "strategy": self.strategy.name,
+            "failure_threshold": self.failure_threshold,
+            "slow_threshold": self.slow_threshold,
+            "ejection_cooldown": self.ejection_cooldown,
+            "lords": {
+                lord_name: [endpoint.as_dict() for endpoint in replicas]
+                for lord_name, replicas in self._endpoints.items()
+            },
+        }
@@ -5,142 +5,39 @@ Handles write_docs, create_summary, and index_knowledge quests
 Minimal MCP server implementation following JSON-RPC 2.0 protocol.
 """
 
-from fastapi import FastAPI
-from pydantic import BaseModel
-from typing import Dict, Any, Optional
+from typing import Dict, Any
 import logging
 
-# Initialize FastAPI app
-app = FastAPI(
-    title="Lord Scribe MCP Server",
-    version="0.1.0",
-    description="Documentation and knowledge management specialist"
-)
+from lord_server import LordServer
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-
-# JSON-RPC 2.0 models
-class JSONRPCRequest(BaseModel):
-    """JSON-RPC 2.0 request format"""
-    jsonrpc: str = "2.0"
-    method: str
-    params: Optional[Dict[str, Any]] = None
-    id: int
-
-
-class JSONRPCResponse(BaseModel):
-    """JSON-RPC 2.0 response format"""
-    jsonrpc: str = "2.0"
-    result: Optional[Any] = None
-    error: Optional[Dict[str, Any]] = None
-    id: int
-    
-    class Config:
-        # Exclude null fields from JSON output
-        exclude_none = True
-
-
-@app.get("/")
-async def root():
-    """Health check endpoint"""
-    return {
-        "lord": "Scribe",
-        "status": "operational",
-        "capabilities": ["write_docs", "create_summary", "index_knowledge"]
-    }
-
-
-@app.post("/mcp")
-async def handle_mcp_request(request: JSONRPCRequest):
-    """
-    Handle MCP JSON-RPC 2.0 requests.
-    
-    Supports:
-    - tools/list: List available tools
-    - tools/call: Execute a tool
-    """
-    logger.info(f"Received MCP request: method={request.method}, params={request.params}")
-    
-    try:
-        if request.method == "tools/list":
-            # Return list of available tools
-            result = {
-                "tools": [
-                    {
-                        "name": "write_docs",
-                        "description": "Write comprehensive documentation for a project or feature",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "topic": {"type": "string"},
-                                "format": {"type": "string", "enum": ["markdown", "rst", "html"]},
-                                "detail_level": {"type": "string", "enum": ["brief", "standard", "comprehensive"]}
-                            },
-                            "required": ["topic"]
-                        }
-                    },
-                    {
-                        "name": "create_summary",
-                        "description": "Create a concise summary of provided content",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "content": {"type": "string"},
-                                "max_length": {"type": "integer"}
-                            },
-                            "required": ["content"]
-                        }
-                    }
-                ]
-            }
-            
-            return JSONRPCResponse(result=result, id=request.id)
-        
-        elif request.method == "tools/call":
-            # Execute a tool
-            params = request.params or {}
-            tool_name = params.get("name")
-            arguments = params.get("arguments", {})
-            
-            if tool_name == "write_docs":
-                result = _write_docs(arguments)
-            elif tool_name == "create_summary":
-                result = _create_summary(arguments)
-            else:
-                return JSONRPCResponse(
-                    error={
-                        "code": -32601,
-                        "message": f"Tool not found: {tool_name}"
-                    },
-                    id=request.id
-                )
-            
-            return JSONRPCResponse(result=result, id=request.id)
-        
-        else:
-            # Unsupported method
-            return JSONRPCResponse(
-                error={
-                    "code": -32601,
-                    "message": f"Method not found: {request.method}"
-                },
-                id=request.id
-            )
-            
-    except Exception as e:
-        logger.error(f"Error processing request: {e}")
-        return JSONRPCResponse(
-            error={
-                "code": -32603,
-                "message": f"Internal error: {str(e)}"
-            },
-            id=request.id
-        )
-
-
+# MCP server (JSON-RPC dispatch, tools/list, timing - see lord_server.py)
+server = LordServer(
+    "scribe",
+    title="Lord Scribe MCP Server",
+    version="0.1.0",
+    description="Documentation and knowledge management specialist",
+    port=8002,
+)
+app = server.app
+
+
+@server.tool(
+    "write_docs",
+    "Write comprehensive documentation for a project or feature",
+    {
+        "type": "object",
+        "properties": {
+            "topic": {"type": "string"},
+            "format": {"type": "string", "enum": ["markdown", "rst", "html"]},
+            "detail_level": {"type": "string", "enum": ["brief", "standard", "comprehensive"]}
+        },
+        "required": ["topic"]
+    },
+)
 def _write_docs(arguments: Dict[str, Any]) -> Dict[str, Any]:
     """
     Write documentation for a topic.
@@ -263,6 +160,19 @@ MIT License - see LICENSE file for details.
     }
 
 
+@server.tool(
+    "create_summary",
+    "Create a concise summary of provided content",
+    {
+        "type": "object",
+        "properties": {
+            "content": {"type": "string"},
+            "max_length": {"type": "integer"}
+        },
+        "required": ["content"]
+    },
+    cpu_bound=True,
+)
 def _create_summary(arguments: Dict[str, Any]) -> Dict[str, Any]:
     """
     Create a summary of content.
@@ -315,7 +225,5 @@ def _create_summary(arguments: Dict[str, Any]) -> Dict[str, Any]:
 
 
 if __name__ == "__main__":
-    import uvicorn
-    
     logger.info("Starting Lord Scribe MCP Server on port 8002...")
-    uvicorn.run(app, host="0.0.0.0", port=8002)
+    server.run(port=8002)
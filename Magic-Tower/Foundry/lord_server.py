@@ -0,0 +1,453 @@
+"""
+Lord Server - Shared MCP (JSON-RPC 2.0) server base for every Lord
+
+Each Lord used to declare its own JSON-RPC models, parse requests through
+pydantic (or request.json()), dispatch with if/elif chains and log full
+params at INFO on every call. LordServer does that once:
+
+- Tool table: @server.tool(...) registers sync or async tools in a dict
+- Raw body decode/encode with orjson when installed (stdlib json otherwise)
+- tools/list response encoded once and reused
+- Uniform JSON-RPC error codes (see jsonrpc.py)
+- Batch requests dispatched concurrently
+- Per-tool timing (calls, errors, latency) at GET /stats and an
+  X-Process-Time header on every /mcp response
+- CPU-bound tools run in a process (or thread) pool instead of on the event
+  loop, with a bounded queue; when it is full the Lord answers 503 /
+  SERVER_BUSY instead of letting one large review stall every request
+
+Usage:
+    server = LordServer("scribe", title="Lord Scribe MCP Server", port=8002)
+    app = server.app
+
+    @server.tool("write_docs", "Write documentation", {"type": "object"})
+    def write_docs(arguments):
+        ...
+
+    @server.tool("create_summary", cpu_bound=True)
+    def create_summary(arguments):    # Module-level so it pickles into workers
+        ...
+
+Offload configuration (constructor args or environment):
+    LORD_EXECUTOR   - "process" (default) or "thread" (GIL-releasing work)
+    LORD_WORKERS    - Worker count (default: CPU count)
+    LORD_MAX_QUEUE  - Offloaded calls allowed to wait for a worker (default: 2 x workers)
+"""
+
+import asyncio
+import inspect
+import logging
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
+
+from jsonrpc import (
+    INTERNAL_ERROR,
+    INVALID_PARAMS,
+    INVALID_REQUEST,
+    JSONRPC_VERSION,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
+    SERVER_BUSY,
+    error_response,
+    result_response,
+)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Decode a JSON document (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(value: Any) -> bytes:
+    """Encode to compact UTF-8 JSON bytes (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=str)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+
+
+ToolHandler = Callable[[Dict[str, Any]], Union[Dict[str, Any], Awaitable[Dict[str, Any]]]]
+
+
+@dataclass
+class ToolStats:
+    """Per-tool timing counters"""
+    calls: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+    def record(self, elapsed: float, ok: bool):
+        self.calls += 1
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+        if not ok:
+            self.errors += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "avg_time_seconds": self.total_time / self.calls if self.calls else None,
+            "max_time_seconds": self.max_time,
+        }
+
+
+@dataclass
+class LordTool:
+    """A registered tool"""
+    name: str
+    handler: ToolHandler
+    description: str = ""
+    input_schema: Dict[str, Any] = field(default_factory=lambda: {"type": "object"})
+    is_async: bool = False
+    cpu_bound: bool = False
+    stats: ToolStats = field(default_factory=ToolStats)
+
+    def describe(self) -> Dict[str, Any]:
+        return {"name": self.name, "description": self.description, "inputSchema": self.input_schema}
+
+
+class ToolError(Exception):
+    """Raised by a tool to return a specific JSON-RPC error (default: invalid params)"""
+
+    def __init__(self, message: str, code: int = INVALID_PARAMS, data: Any = None):
+        super().__init__(message)
+        self.code = code
+        self.data = data
+
+
+class ServerBusyError(Exception):
+    """Raised when the offload queue is full"""
+
+
+EXECUTOR_KINDS = ("process", "thread")
+
+
+class LordServer:
+    """
+    FastAPI app + JSON-RPC dispatcher for a Lord MCP server.
+
+    Endpoints:
+        POST /mcp    - tools/list, tools/call (single request or batch)
+        GET  /       - Lord info and capabilities
+        GET  /health - Liveness probe
+        GET  /stats  - Per-tool timing and offload executor state
+    """
+
+    def __init__(
+        self,
+        name: str,
+        title: Optional[str] = None,
+        version: str = "0.1.0",
+        description: str = "",
+        port: Optional[int] = None,
+        executor: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+    ):
+        """
+        Initialize server.
+
+        Args:
+            name: Lord name as used by the executor/gateway (e.g. "sentinel")
+            title: FastAPI title
+            version: Server version
+            description: Human-readable specialty
+            port: Default port for run()
+            executor: Offload pool kind, "process" or "thread" (env LORD_EXECUTOR)
+            max_workers: Offload pool size (env LORD_WORKERS, default CPU count)
+            max_queue: Offloaded calls allowed to wait beyond max_workers
+                (env LORD_MAX_QUEUE, default 2 x max_workers)
+        """
+        self.name = name
+        self.version = version
+        self.description = description
+        self.port = port
+        self.tools: Dict[str, LordTool] = {}
+        self._tools_list_result: Optional[Dict[str, Any]] = None
+        self._started_at = time.time()
+
+        self.executor_kind = executor or os.getenv("LORD_EXECUTOR", "process")
+        if self.executor_kind not in EXECUTOR_KINDS:
+            raise ValueError(f"executor must be one of {EXECUTOR_KINDS}, got {self.executor_kind!r}")
+        self.max_workers = max(1, max_workers or int(os.getenv("LORD_WORKERS", 0)) or os.cpu_count() or 1)
+        if max_queue is None:
+            max_queue = int(os.getenv("LORD_MAX_QUEUE", 2 * self.max_workers))
+        self.max_queue = max(0, max_queue)
+        self._pool: Optional[Executor] = None
+        self._offload_inflight = 0
+        self._offload_completed = 0
+        self._offload_rejected = 0
+
+        self.app = FastAPI(title=title or f"Lord {name} MCP Server", version=version, description=description)
+        self.app.add_api_route("/mcp", self.handle_mcp, methods=["POST"])
+        self.app.add_api_route("/", self.info, methods=["GET"])
+        self.app.add_api_route("/health", self.health, methods=["GET"])
+        self.app.add_api_route("/stats", self.stats, methods=["GET"])
+        self.app.router.add_event_handler("startup", self.tools_list)
+        self.app.router.add_event_handler("shutdown", self.shutdown)
+
+    # ============================================================
+    # TOOL REGISTRATION
+    # ============================================================
+
+    def tool(
+        self,
+        name: str,
+        description: str = "",
+        input_schema: Optional[Dict[str, Any]] = None,
+        cpu_bound: bool = False,
+    ) -> Callable[[ToolHandler], ToolHandler]:
+        """
+        Decorator registering a tool.
+
+        The handler receives the call's arguments dict and returns the result
+        (plain function or coroutine function). cpu_bound handlers must be
+        plain module-level functions: they run in the offload pool.
+        """
+        def decorator(handler: ToolHandler) -> ToolHandler:
+            self.add_tool(name, handler, description, input_schema, cpu_bound)
+            return handler
+        return decorator
+
+    def add_tool(
+        self,
+        name: str,
+        handler: ToolHandler,
+        description: str = "",
+        input_schema: Optional[Dict[str, Any]] = None,
+        cpu_bound: bool = False,
+    ) -> LordTool:
+        if name in self.tools:
+            raise ValueError(f"Tool already registered on Lord {self.name}: {name}")
+        if cpu_bound and inspect.iscoroutinefunction(handler):
+            raise ValueError(f"CPU-bound tool must be a plain function: {name}")
+        tool = LordTool(
+            name=name,
+            handler=handler,
+            description=description or (inspect.getdoc(handler) or "").split("\n", 1)[0],
+            input_schema=input_schema or {"type": "object"},
+            is_async=inspect.iscoroutinefunction(handler),
+            cpu_bound=cpu_bound,
+        )
+        self.tools[name] = tool
+        self._tools_list_result = None
+        return tool
+
+    def tools_list(self) -> Dict[str, Any]:
+        """tools/list result, built once after registration"""
+        if self._tools_list_result is None:
+            self._tools_list_result = {"tools": [tool.describe() for tool in self.tools.values()]}
+        return self._tools_list_result
+
+    # ============================================================
+    # JSON-RPC DISPATCH
+    # ============================================================
+
+    async def handle_mcp(self, request: Request) -> Response:
+        """POST /mcp: decode the raw body, dispatch, encode the reply"""
+        start = time.perf_counter()
+        body = await request.body()
+
+        try:
+            message = json_loads(body)
+        except ValueError:
+            payload: Any = error_response(None, PARSE_ERROR)
+        else:
+            if isinstance(message, list):
+                if message:
+                    payload = list(await asyncio.gather(*(self.dispatch(entry) for entry in message)))
+                else:
+                    payload = error_response(None, INVALID_REQUEST)
+            else:
+                payload = await self.dispatch(message)
+
+        headers = {"X-Process-Time": f"{time.perf_counter() - start:.6f}"}
+        status_code = 200
+        if _all_busy(payload):
+            # Nothing was served: let clients and balancers back off / try another replica
+            status_code = 503
+            headers["Retry-After"] = "1"
+
+        return Response(
+            content=json_dumps(payload),
+            status_code=status_code,
+            media_type="application/json",
+            headers=headers,
+        )
+
+    async def dispatch(self, message: Any) -> Dict[str, Any]:
+        """Handle one JSON-RPC request object, always returning a response object"""
+        if (
+            not isinstance(message, dict)
+            or message.get("jsonrpc") != JSONRPC_VERSION
+            or not isinstance(message.get("method"), str)
+        ):
+            return error_response(message.get("id") if isinstance(message, dict) else None, INVALID_REQUEST)
+
+        request_id = message.get("id")
+        method = message["method"]
+        params = message.get("params") or {}
+        if not isinstance(params, dict):
+            return error_response(request_id, INVALID_PARAMS, "params must be an object")
+
+        if method == "tools/call":
+            return await self.call_tool(request_id, params)
+        if method == "tools/list":
+            return result_response(request_id, self.tools_list())
+        return error_response(request_id, METHOD_NOT_FOUND, f"Method not found: {method}")
+
+    async def call_tool(self, request_id: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+        tool = self.tools.get(params.get("name"))
+        if tool is None:
+            return error_response(request_id, METHOD_NOT_FOUND, f"Tool not found: {params.get('name')}")
+
+        arguments = params.get("arguments") or {}
+        if not isinstance(arguments, dict):
+            return error_response(request_id, INVALID_PARAMS, "arguments must be an object")
+
+        logger.debug(f"Lord {self.name}: tools/call {tool.name}")
+        start = time.perf_counter()
+        ok = False
+        try:
+            result = await self.invoke(tool, arguments)
+            ok = True
+            return result_response(request_id, result)
+        except ToolError as e:
+            return error_response(request_id, e.code, str(e), e.data)
+        except ServerBusyError as e:
+            return error_response(request_id, SERVER_BUSY, str(e))
+        except Exception as e:
+            logger.exception(f"Lord {self.name}: tool {tool.name} failed")
+            return error_response(request_id, INTERNAL_ERROR, f"Internal error: {e}")
+        finally:
+            tool.stats.record(time.perf_counter() - start, ok)
+
+    async def invoke(self, tool: LordTool, arguments: Dict[str, Any]) -> Any:
+        """Run a tool handler (CPU-bound tools go to the offload pool)"""
+        if tool.cpu_bound:
+            return await self.offload(tool.handler, arguments)
+        if tool.is_async:
+            return await tool.handler(arguments)
+        return tool.handler(arguments)
+
+    # ============================================================
+    # OFFLOAD EXECUTOR
+    # ============================================================
+
+    async def offload(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run func(*args) in the offload pool.
+
+        Async tools use this for their CPU-heavy part so the event loop keeps
+        serving other requests. With the process pool, func and args must be
+        picklable (module-level function, plain data).
+
+        Raises:
+            ServerBusyError: If max_workers + max_queue calls are already in flight
+        """
+        if self._offload_inflight >= self.max_workers + self.max_queue:
+            self._offload_rejected += 1
+            raise ServerBusyError(
+                f"Lord {self.name} busy: {self._offload_inflight} offloaded calls in flight"
+            )
+
+        self._offload_inflight += 1
+        try:
+            pool = self._get_pool()
+            try:
+                result = await asyncio.get_running_loop().run_in_executor(pool, func, *args)
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM); start a fresh pool for the next call
+                logger.error(f"Lord {self.name}: offload pool broken, recreating")
+                if self._pool is pool:
+                    self._pool = None
+                    pool.shutdown(wait=False)
+                raise
+            self._offload_completed += 1
+            return result
+        finally:
+            self._offload_inflight -= 1
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.executor_kind == "process":
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix=f"lord-{self.name}"
+                )
+        return self._pool
+
+    def shutdown(self):
+        """Stop the offload pool (app shutdown)"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def executor_stats(self) -> Dict[str, Any]:
+        return {
+            "kind": self.executor_kind,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": self._offload_inflight,
+            "completed": self._offload_completed,
+            "rejected": self._offload_rejected,
+        }
+
+    # ============================================================
+    # INFO ENDPOINTS
+    # ============================================================
+
+    async def info(self) -> Dict[str, Any]:
+        return {
+            "lord": self.name,
+            "description": self.description,
+            "version": self.version,
+            "status": "operational",
+            "capabilities": list(self.tools),
+        }
+
+    async def health(self) -> Dict[str, Any]:
+        return {"status": "healthy", "lord": self.name}
+
+    async def stats(self) -> Dict[str, Any]:
+        return {
+            "lord": self.name,
+            "uptime_seconds": time.time() - self._started_at,
+            "orjson": ORJSON_AVAILABLE,
+            "executor": self.executor_stats(),
+            "tools": {name: tool.stats.as_dict() for name, tool in self.tools.items()},
+        }
+
+    def run(self, host: str = "0.0.0.0", port: Optional[int] = None):
+        """Serve with uvicorn"""
+        import uvicorn
+        uvicorn.run(self.app, host=host, port=port or self.port)
+
+
+def _all_busy(payload: Any) -> bool:
+    """True if every response in the reply is a SERVER_BUSY error"""
+    responses = payload if isinstance(payload, list) else [payload]
+    return bool(responses) and all(
+        isinstance(item, dict) and item.get("error", {}).get("code") == SERVER_BUSY for item in responses
+    )
@@ -0,0 +1,217 @@
+"""
+Write-Behind Persistence Queue
+
+Moves QuestExecutor auto-save off the event loop: quest and Lord-run rows
+are serialized at enqueue time, pushed onto a bounded queue, and written
+by a background thread in grouped SQLite transactions.
+
+Architecture:
+- Bounded queue.Queue between the event loop and one writer thread
+- Writer drains up to batch_size operations per transaction (QuestRepository.write_batch)
+- flush(): durability barrier - resolves once everything enqueued before it is committed
+- Backpressure: when the queue is full, submitters wait (in a worker thread, not the loop)
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# Queue item kinds
+_WRITE = "write"
+_BARRIER = "barrier"
+_STOP = "stop"
+
+
+class WriteBehindQueue:
+    """
+    Asynchronous write-behind pipeline in front of a QuestRepository.
+
+    Usage:
+        queue = WriteBehindQueue(repo)
+        await queue.save_quest(quest_data)
+        await queue.flush()     # Everything above is now committed
+        await queue.aclose()
+    """
+
+    def __init__(
+        self,
+        repository: Any,
+        max_queue_size: int = 1000,
+        batch_size: int = 100,
+        batch_interval: float = 0.05,
+    ):
+        """
+        Initialize the write-behind queue (writer thread starts immediately).
+
+        Args:
+            repository: QuestRepository to write to
+            max_queue_size: Bound on pending operations before submitters block
+            batch_size: Maximum operations per transaction
+            batch_interval: Seconds the writer waits to fill a batch after the first item
+        """
+        self.repository = repository
+        self.batch_size = max(1, batch_size)
+        self.batch_interval = max(0.0, batch_interval)
+        self._queue: "queue.Queue[Tuple[str, Any]]" = queue.Queue(maxsize=max(1, max_queue_size))
+        self._closed = False
+        self._errors: List[str] = []
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.enqueued = 0
+        self.written = 0
+        self.batches = 0
+        self.failed_batches = 0
+        self.backpressure_waits = 0
+        self.max_queue_depth = 0
+
+        self._thread = threading.Thread(target=self._run, name="quest-write-behind", daemon=True)
+        self._thread.start()
+
+    # ============================================================
+    # SUBMISSION (event loop side)
+    # ============================================================
+
+    async def save_quest(self, quest_data: Any) -> None:
+        """Enqueue a point-in-time copy of the quest row"""
+        await self._submit((_WRITE, ("quest", self.repository.quest_row(quest_data))))
+
+    async def save_lord_run(self, **run: Any) -> None:
+        """Enqueue a Lord run (same arguments as QuestRepository.save_lord_run)"""
+        await self._submit((_WRITE, ("lord_run", self.repository.lord_run_row(**run))))
+
+    async def append_quest_event(self, quest_id: str, event_type: str, payload: Dict[str, Any]) -> None:
+        """Enqueue an incremental quest event (QuestRepository.append_quest_event)"""
+        row = self.repository.quest_event_row(quest_id, event_type, payload)
+        await self._submit((_WRITE, ("event", row)))
+
+    async def compact_quest(self, quest_id: str) -> None:
+        """Enqueue a compaction checkpoint, applied in order with queued events"""
+        await self._submit((_WRITE, ("compact", {"quest_id": quest_id})))
+
+    async def flush(self) -> None:
+        """
+        Durability barrier.
+
+        Resolves once every operation enqueued before this call is committed.
+
+        Raises:
+            RuntimeError: If any batch failed since the previous flush
+        """
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+        await self._submit((_BARRIER, (loop, done)), count=False)
+        await done
+
+        with self._lock:
+            errors, self._errors = self._errors, []
+        if errors:
+            raise RuntimeError(f"Write-behind persistence failed: {errors[-1]} ({len(errors)} batch(es))")
+
+    async def aclose(self) -> None:
+        """Flush pending writes and stop the writer thread"""
+        if self._closed:
+            return
+        try:
+            await self.flush()
+        finally:
+            self._closed = True
+            await asyncio.to_thread(self._queue.put, (_STOP, None))
+            await asyncio.to_thread(self._thread.join)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": self._queue.qsize(),
+            "max_queue_depth": self.max_queue_depth,
+            "queue_capacity": self._queue.maxsize,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "batches": self.batches,
+            "failed_batches": self.failed_batches,
+            "backpressure_waits": self.backpressure_waits,
+        }
+
+    async def _submit(self, item: Tuple[str, Any], count: bool = True) -> None:
+        if self._closed:
+            raise RuntimeError("WriteBehindQueue is closed")
+
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            # Backpressure: block a worker thread, never the event loop
+            self.backpressure_waits += 1
+            await asyncio.to_thread(self._queue.put, item)
+
+        if count:
+            self.enqueued += 1
+        self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+
+    # ============================================================
+    # WRITER THREAD
+    # ============================================================
+
+    def _run(self):
+        while True:
+            kind, payload = self._queue.get()
+            operations: List[Tuple[str, Dict[str, Any]]] = []
+            barriers = []
+            stop = False
+
+            # Gather a batch: first item plus whatever arrives within batch_interval
+            deadline = time.monotonic() + self.batch_interval
+            while True:
+                if kind == _WRITE:
+                    operations.append(payload)
+                elif kind == _BARRIER:
+                    barriers.append(payload)
+                else:
+                    stop = True
+
+                if stop or barriers or len(operations) >= self.batch_size:
+                    break
+                try:
+                    timeout = deadline - time.monotonic()
+                    if timeout > 0:
+                        kind, payload = self._queue.get(timeout=timeout)
+                    else:
+                        kind, payload = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if operations:
+                self._write(operations)
+
+            for loop, done in barriers:
+                try:
+                    loop.call_soon_threadsafe(self._resolve, done)
+                except RuntimeError:
+                    pass  # Waiting loop already closed
+
+            if stop:
+                return
+
+    def _write(self, operations: List[Tuple[str, Dict[str, Any]]]):
+        try:
+            self.repository.write_batch(operations)
+            self.written += len(operations)
+            self.batches += 1
+        except Exception as e:
+            logger.error(f"Write-behind batch of {len(operations)} operations failed: {e}")
+            self.failed_batches += 1
+            with self._lock:
+                self._errors.append(str(e))
+
+    @staticmethod
+    def _resolve(done: asyncio.Future):
+        if not done.done():
+            done.set_result(None)
@@ -9,15 +9,26 @@ Architecture:
 - State persistence-ready (designed for SQLite)
 - Lifecycle hooks for observability
 - Error handling with retry logic
+- Pooled keep-alive Lord connections (lord_client.LordClientPool)
 """
 
 import asyncio
+import contextvars
+import itertools
+import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Callable, Set
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Callable, Set, Tuple, Union
 from datetime import datetime
-import httpx
+
+from circuit_breaker import CircuitOpenError, CircuitState, LordCircuitBreakers
+from lord_cache import LordResultCache
+from lord_client import JsonRpcBatcher, LordClientPool, LordClientConfig
+from lord_registry import LordEndpoint, LordRegistry, UnknownLordError
+from persistence_queue import WriteBehindQueue
+from retry_policy import LordRpcError, RetryBudget, RetryPolicy
 
 try:
     from quest_persistence import QuestRepository
@@ -27,6 +38,15 @@ except ImportError:
     QuestRepository = None
 
 
+logger = logging.getLogger(__name__)
+
+
+# Per-Lord in-flight caps for the current execute_many batch (task-local)
+_LORD_LIMITS: contextvars.ContextVar[Optional[Dict[str, asyncio.Semaphore]]] = contextvars.ContextVar(
+    "lord_limits", default=None
+)
+
+
 class ExecutionStatus(str, Enum):
     """Quest/Lord execution status"""
     NEW = "new"
@@ -38,6 +58,11 @@ class ExecutionStatus(str, Enum):
     PAUSED = "paused"
     COMPLETED = "completed"
     FAILED = "failed"
+    TIMED_OUT = "timed_out"
+
+
+class DeadlineExceeded(Exception):
+    """Quest deadline has passed - the quest fails fast with TIMED_OUT"""
 
 
 class ErrorMode(str, Enum):
@@ -53,10 +78,42 @@ class LordRetryConfig:
     max_tries: int = 1
     wait_between_tries_ms: int = 0
     
+    # Exponential backoff: wait_between_tries_ms * backoff_multiplier^(retry - 1),
+    # capped at max_wait_ms and jittered ("full", "equal" or "none")
+    exponential_backoff: bool = False
+    backoff_multiplier: float = 2.0
+    max_wait_ms: int = 30000
+    jitter: str = "full"
+    
     def __post_init__(self):
         # Enforce n8n-style limits
         self.max_tries = min(5, max(1, self.max_tries))
         self.wait_between_tries_ms = min(5000, max(0, self.wait_between_tries_ms))
+        self.backoff_multiplier = max(1.0, self.backoff_multiplier)
+        self.max_wait_ms = max(self.wait_between_tries_ms, self.max_wait_ms)
+        if self.jitter not in ("full", "equal", "none"):
+            raise ValueError(f"Unknown jitter mode: {self.jitter}")
+
+
+@dataclass
+class HedgePolicy:
+    """
+    Request hedging for a Lord step (tail-latency reduction)
+    
+    If the call has not returned after the Lord's observed latency
+    percentile, a duplicate goes to another replica; first success wins.
+    """
+    percentile: float = 95.0
+    max_hedges: int = 1
+    min_delay_ms: int = 10
+    default_delay_ms: int = 1000  # Used until min_samples latencies are observed
+    min_samples: int = 20
+    
+    def __post_init__(self):
+        self.percentile = min(100.0, max(1.0, self.percentile))
+        self.max_hedges = min(3, max(1, self.max_hedges))
+        self.min_delay_ms = max(0, self.min_delay_ms)
+        self.default_delay_ms = max(self.min_delay_ms, self.default_delay_ms)
 
 
 @dataclass
@@ -67,6 +124,19 @@ class LordStep:
     on_error: ErrorMode = ErrorMode.STOP
     retry_config: LordRetryConfig = field(default_factory=LordRetryConfig)
     
+    # Graph mode: steps declaring depends_on run as a DAG (see execute_quest_graph)
+    step_id: Optional[str] = None
+    depends_on: List[str] = field(default_factory=list)
+    
+    # Result cache opt-in/opt-out (None = cache default, see lord_cache.LordResultCache)
+    cache: Optional[bool] = None
+    
+    # Per-attempt timeout in seconds (None = executor default_step_timeout)
+    timeout_s: Optional[float] = None
+    
+    # Optional duplicate request to another replica on slow calls
+    hedge: Optional[HedgePolicy] = None
+    
     # Execution metadata (set during execution)
     status: ExecutionStatus = ExecutionStatus.NEW
     start_time: Optional[float] = None
@@ -74,6 +144,11 @@ class LordStep:
     run_index: int = 0
     error: Optional[Dict[str, Any]] = None
     data: Optional[Dict[str, Any]] = None
+    
+    @property
+    def key(self) -> str:
+        """Unique step reference used by depends_on (step_id or lord:run_index)"""
+        return self.step_id or f"{self.lord_name}:{self.run_index}"
 
 
 @dataclass
@@ -111,35 +186,225 @@ class QuestExecutionData:
     
     # Final output data
     output_data: Optional[Dict[str, Any]] = None
+    
+    # Absolute deadline (epoch seconds); remaining budget is forwarded to Lords
+    deadline: Optional[float] = None
+    
+    def remaining_time(self) -> Optional[float]:
+        """Seconds left before the deadline (None if no deadline)"""
+        if self.deadline is None:
+            return None
+        return self.deadline - time.time()
+
+
+@dataclass
+class HookEventStats:
+    """Per-event hook dispatch counters"""
+    emitted: int = 0
+    callbacks_run: int = 0
+    errors: int = 0
+    dropped: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    
+    def record(self, elapsed: float):
+        self.callbacks_run += 1
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+    
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "emitted": self.emitted,
+            "callbacks_run": self.callbacks_run,
+            "errors": self.errors,
+            "dropped": self.dropped,
+            "total_time_seconds": self.total_time,
+            "avg_time_seconds": self.total_time / self.callbacks_run if self.callbacks_run else None,
+            "max_time_seconds": self.max_time,
+        }
 
 
 class ExecutionHooks:
     """
     Lifecycle hooks for observability (n8n pattern)
     
+    Callbacks are classified as sync/async once, at register time.
+    
+    Dispatch modes:
+    - async_mode="inline": async hooks are awaited in the Lord step (default)
+    - async_mode="background": async hooks go to a bounded queue drained by a
+      background task; when full, overflow="drop_new" or "drop_oldest" applies
+    - sync_mode="inline": sync hooks run in the step (default)
+    - sync_mode="thread": sync hooks run in a thread pool (awaited inline,
+      fire-and-forget in background mode)
+    
+    Background hooks see the live quest objects, which may have moved on by
+    the time they run. Call drain() to wait for queued hooks.
+    
     Future: WebSocket event emission, logging, metrics
     """
-    def __init__(self):
-        self._hooks: Dict[str, List[Callable]] = {
-            "quest_started": [],
-            "quest_finished": [],
-            "lord_invoked": [],
-            "lord_completed": [],
-            "lord_error": [],
-        }
+    EVENTS = (
+        "quest_started",
+        "quest_finished",
+        "lord_invoked",
+        "lord_completed",
+        "lord_error",
+        "breaker_state_changed",
+    )
     
-    def register(self, event: str, callback: Callable):
-        """Register a callback for an event"""
+    def __init__(
+        self,
+        async_mode: str = "inline",
+        sync_mode: str = "inline",
+        queue_size: int = 1000,
+        overflow: str = "drop_new",
+        thread_workers: int = 4,
+    ):
+        if async_mode not in ("inline", "background"):
+            raise ValueError(f"Unknown async_mode: {async_mode}")
+        if sync_mode not in ("inline", "thread"):
+            raise ValueError(f"Unknown sync_mode: {sync_mode}")
+        if overflow not in ("drop_new", "drop_oldest"):
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        
+        # event -> [(callback, is_async)]
+        self._hooks: Dict[str, List[Tuple[Callable, bool]]] = {event: [] for event in self.EVENTS}
+        self.async_mode = async_mode
+        self.sync_mode = sync_mode
+        self.overflow = overflow
+        self._queue_size = max(1, queue_size)
+        self._thread_workers = max(1, thread_workers)
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._thread_futures: Set[asyncio.Future] = set()
+        self._stats: Dict[str, HookEventStats] = {event: HookEventStats() for event in self.EVENTS}
+    
+    def register(self, event: str, callback: Optional[Callable] = None):
+        """
+        Register a callback for an event
+        
+        Can also be used as a decorator: @hooks.register("quest_started")
+        """
+        if callback is None:
+            def decorator(func: Callable) -> Callable:
+                self.register(event, func)
+                return func
+            return decorator
+        
         if event in self._hooks:
-            self._hooks[event].append(callback)
+            self._hooks[event].append((callback, asyncio.iscoroutinefunction(callback)))
+        return callback
     
     async def emit(self, event: str, *args, **kwargs):
         """Emit an event to all registered callbacks"""
-        for callback in self._hooks.get(event, []):
-            if asyncio.iscoroutinefunction(callback):
-                await callback(*args, **kwargs)
+        callbacks = self._hooks.get(event)
+        if not callbacks:
+            return
+        
+        stats = self._stats[event]
+        stats.emitted += 1
+        
+        for callback, is_async in callbacks:
+            if is_async:
+                if self.async_mode == "background":
+                    self._enqueue(event, callback, args, kwargs)
+                else:
+                    start = time.perf_counter()
+                    await callback(*args, **kwargs)
+                    stats.record(time.perf_counter() - start)
+            elif self.sync_mode == "thread":
+                future = self._run_in_thread(event, callback, args, kwargs)
+                if self.async_mode == "background":
+                    self._thread_futures.add(future)
+                    future.add_done_callback(self._thread_futures.discard)
+                else:
+                    await future
             else:
+                start = time.perf_counter()
                 callback(*args, **kwargs)
+                stats.record(time.perf_counter() - start)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hook execution time and drop counters per event type"""
+        return {
+            "async_mode": self.async_mode,
+            "sync_mode": self.sync_mode,
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "events": {event: stats.as_dict() for event, stats in self._stats.items()},
+        }
+    
+    async def drain(self):
+        """Wait until queued background hooks and thread-pool hooks have run"""
+        if self._queue is not None:
+            await self._queue.join()
+        if self._thread_futures:
+            await asyncio.gather(*self._thread_futures, return_exceptions=True)
+    
+    async def aclose(self):
+        """Drain pending hooks and stop the background worker and thread pool"""
+        await self.drain()
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+            self._queue = None
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False)
+            self._thread_pool = None
+    
+    def _enqueue(self, event: str, callback: Callable, args: tuple, kwargs: dict):
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._queue_size)
+            self._worker = asyncio.create_task(self._drain_queue())
+        
+        item = (event, callback, args, kwargs)
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            if self.overflow == "drop_oldest":
+                dropped_event = self._queue.get_nowait()[0]
+                self._queue.task_done()
+                self._stats[dropped_event].dropped += 1
+                self._queue.put_nowait(item)
+            else:
+                self._stats[event].dropped += 1
+    
+    async def _drain_queue(self):
+        queue = self._queue
+        while True:
+            event, callback, args, kwargs = await queue.get()
+            stats = self._stats[event]
+            start = time.perf_counter()
+            try:
+                await callback(*args, **kwargs)
+            except Exception as e:
+                stats.errors += 1
+                logger.warning(f"Background hook for {event} failed: {e}")
+            finally:
+                stats.record(time.perf_counter() - start)
+                queue.task_done()
+    
+    def _run_in_thread(self, event: str, callback: Callable, args: tuple, kwargs: dict) -> asyncio.Future:
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(max_workers=self._thread_workers, thread_name_prefix="quest-hooks")
+        
+        stats = self._stats[event]
+        background = self.async_mode == "background"
+        
+        def timed():
+            start = time.perf_counter()
+            try:
+                return callback(*args, **kwargs)
+            except Exception as e:
+                if not background:
+                    raise
+                stats.errors += 1
+                logger.warning(f"Threaded hook for {event} failed: {e}")
+            finally:
+                stats.record(time.perf_counter() - start)
+        
+        return asyncio.get_running_loop().run_in_executor(self._thread_pool, timed)
 
 
 class QuestExecutor:
@@ -154,7 +419,7 @@ class QuestExecutor:
     5. Repeating until stack empty
     """
     
-    # Lord registry (name -> port)
+    # Lord registry (name -> port, URL, "inproc", or list of replicas - see lord_registry.LordRegistry)
     LORD_REGISTRY = {
         "architect": 8001,
         "scribe": 8002,
@@ -162,35 +427,279 @@ class QuestExecutor:
         "sentinel": 8004,
     }
     
-    def __init__(self, hooks: Optional[ExecutionHooks] = None, repository: Optional['QuestRepository'] = None):
+    def __init__(
+        self,
+        hooks: Optional[ExecutionHooks] = None,
+        repository: Optional['QuestRepository'] = None,
+        client_pool: Optional[LordClientPool] = None,
+        client_config: Optional[LordClientConfig] = None,
+        max_step_concurrency: int = 4,
+        result_cache: Optional[LordResultCache] = None,
+        write_behind: Union[bool, WriteBehindQueue] = False,
+        incremental_state: bool = False,
+        compact_every: int = 100,
+        default_step_timeout: float = 30.0,
+        registry: Optional[LordRegistry] = None,
+        balancing: str = "round_robin",
+        circuit_breakers: Union[bool, LordCircuitBreakers] = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        batch_window: Optional[float] = None,
+    ):
+        self._owns_hooks = hooks is None
         self.hooks = hooks or ExecutionHooks()
-        self.status = ExecutionStatus.NEW
         self.repository = repository
         self._auto_save = repository is not None  # Enable auto-save if repository provided
+        
+        # Write-behind auto-save: rows go to a background writer thread instead of
+        # blocking the event loop on SQLite (pass True or a shared WriteBehindQueue)
+        self._owns_write_queue = write_behind is True
+        if isinstance(write_behind, WriteBehindQueue):
+            self.write_queue: Optional[WriteBehindQueue] = write_behind
+        elif write_behind and repository is not None:
+            self.write_queue = WriteBehindQueue(repository)
+        else:
+            self.write_queue = None
+        
+        # Incremental auto-save: append step-transition events (O(delta) per step)
+        # instead of rewriting the whole quest row; compact every N events
+        self.incremental_state = incremental_state
+        self.compact_every = max(1, compact_every)
+        self._pending_events: Dict[str, int] = {}
+        
+        # Long-lived keep-alive connections to Lords (owned unless injected)
+        self._owns_client_pool = client_pool is None
+        self.client_pool = client_pool or LordClientPool(client_config)
+        
+        # Lord replicas + load balancing (built from LORD_REGISTRY unless injected)
+        self.registry = registry or LordRegistry(self.LORD_REGISTRY, strategy=balancing)
+        self._hedge_stats: Dict[str, Dict[str, int]] = {}
+        
+        # Per-Lord circuit breakers: fail fast instead of retrying into a dead Lord
+        # (pass False to disable, or a shared LordCircuitBreakers)
+        if isinstance(circuit_breakers, LordCircuitBreakers):
+            self.breakers: Optional[LordCircuitBreakers] = circuit_breakers
+        elif circuit_breakers:
+            self.breakers = LordCircuitBreakers()
+        else:
+            self.breakers = None
+        self._breaker_events: List[Tuple[str, CircuitState, CircuitState]] = []
+        if self.breakers is not None:
+            self.breakers.add_listener(self._on_breaker_state_change)
+        
+        # Backoff, retryable/non-retryable classification and per-Lord retry budget
+        self.retry_policy = retry_policy or RetryPolicy(budget=RetryBudget())
+        
+        # JSON-RPC batching: concurrent calls to one replica within batch_window
+        # seconds share a single HTTP request (None = one request per call)
+        self.batcher = JsonRpcBatcher(window=batch_window) if batch_window is not None else None
+        self._rpc_ids = itertools.count(1)
+        
+        # Graph mode: maximum Lord steps in flight per quest
+        self.max_step_concurrency = max(1, max_step_concurrency)
+        
+        # Memoized Lord results (disabled unless a cache is provided)
+        self.result_cache = result_cache
+        
+        # Per-attempt Lord timeout when a step doesn't set timeout_s
+        self.default_step_timeout = default_step_timeout
+        
+        # Quests currently executing (quest state lives on each QuestExecutionData)
+        self._active_quests: Dict[str, QuestExecutionData] = {}
+        self._quests_executed = 0
+    
+    @property
+    def status(self) -> ExecutionStatus:
+        """Executor-level status: RUNNING while any quest is in flight"""
+        if self._active_quests:
+            return ExecutionStatus.RUNNING
+        return ExecutionStatus.COMPLETED if self._quests_executed else ExecutionStatus.NEW
+    
+    def active_quests(self) -> List[str]:
+        """IDs of quests currently executing on this executor"""
+        return list(self._active_quests)
+    
+    async def __aenter__(self) -> "QuestExecutor":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Release pooled Lord connections, hooks and the write-behind queue (if owned)"""
+        if self.breakers is not None:
+            self.breakers.remove_listener(self._on_breaker_state_change)
+        if self._owns_hooks:
+            await self.hooks.aclose()
+        if self._owns_write_queue and self.write_queue:
+            await self.write_queue.aclose()
+        if self._owns_client_pool:
+            await self.client_pool.aclose()
+    
+    def pool_stats(self) -> Dict[str, Any]:
+        """Connection pool statistics for all Lords contacted so far"""
+        return self.client_pool.stats()
+    
+    def registry_stats(self) -> Dict[str, Any]:
+        """Replica load and passive health for every Lord"""
+        return self.registry.stats()
+    
+    def hedge_stats(self) -> Dict[str, Dict[str, int]]:
+        """Per-Lord hedged requests sent and how many of them won the race"""
+        return {lord_name: dict(counters) for lord_name, counters in self._hedge_stats.items()}
+    
+    def breaker_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Circuit state and rejection counters per Lord"""
+        return self.breakers.stats() if self.breakers else {}
+    
+    def retry_stats(self) -> Dict[str, Any]:
+        """Retry budget tokens and allowed/denied retries per Lord"""
+        return self.retry_policy.stats()
+    
+    def batch_stats(self) -> Optional[Dict[str, Any]]:
+        """JSON-RPC batching counters (None if batching is disabled)"""
+        return self.batcher.stats() if self.batcher else None
+    
+    def cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Result cache hit/miss metrics (None if caching is disabled)"""
+        return self.result_cache.stats() if self.result_cache else None
     
     async def execute_quest(self, quest_data: QuestExecutionData) -> QuestExecutionData:
         """
         Execute a quest by processing the execution stack
         
+        Quests whose steps declare depends_on are executed as a DAG
+        (see execute_quest_graph); otherwise steps run one at a time.
+        
         Args:
             quest_data: Quest with pre-populated execution_stack
         
         Returns:
             Updated quest_data with run_data and output_data
         """
+        self._active_quests[quest_data.quest_id] = quest_data
+        try:
+            if any(step.depends_on for step in quest_data.execution_stack):
+                return await self.execute_quest_graph(quest_data)
+            return await self._execute_sequential(quest_data)
+        finally:
+            self._active_quests.pop(quest_data.quest_id, None)
+            self._quests_executed += 1
+    
+    async def execute_many(
+        self,
+        quests: Iterable[QuestExecutionData],
+        max_concurrency: int = 16,
+        per_lord_limits: Optional[Dict[str, int]] = None,
+    ) -> AsyncIterator[QuestExecutionData]:
+        """
+        Execute many quests concurrently, yielding each one as it finishes
+        
+        Each quest keeps its own execution context (its QuestExecutionData);
+        the batch only shares the pooled Lord connections. Quests are pulled
+        from the iterable lazily, so thousands of quests never exist as
+        tasks at once.
+        
+        Usage:
+            async for quest in executor.execute_many(quests, per_lord_limits={"sentinel": 8}):
+                print(quest.quest_id, quest.status)
+        
+        Args:
+            quests: Quests with pre-populated execution stacks (unique quest_ids)
+            max_concurrency: Maximum quests in flight
+            per_lord_limits: Maximum in-flight calls per Lord for this batch
+        
+        Yields:
+            Finished QuestExecutionData in completion order. A quest that
+            raises (e.g. an invalid graph plan) is yielded with ERROR status.
+            A quest whose quest_id is already in the batch or running is not
+            executed; an ERROR copy of it is yielded and the batch goes on.
+        """
+        limit = max(1, max_concurrency)
+        lord_limits = {
+            lord_name: asyncio.Semaphore(max(1, cap))
+            for lord_name, cap in (per_lord_limits or {}).items()
+        }
+        
+        async def run(quest: QuestExecutionData) -> QuestExecutionData:
+            _LORD_LIMITS.set(lord_limits)  # Task-local: nested graph tasks inherit it
+            try:
+                return await self.execute_quest(quest)
+            except Exception as e:
+                quest.status = ExecutionStatus.ERROR
+                quest.end_time = time.time()
+                quest.error = {"message": str(e)}
+                return quest
+        
+        pending_quests = iter(quests)
+        seen_ids: Set[str] = set()
+        running: Set[asyncio.Task] = set()
+        exhausted = False
+        
+        try:
+            while True:
+                while not exhausted and len(running) < limit:
+                    quest = next(pending_quests, None)
+                    if quest is None:
+                        exhausted = True
+                        break
+                    if quest.quest_id in seen_ids or quest.quest_id in self._active_quests:
+                        # A copy: the duplicate may be the very object that is running
+                        yield QuestExecutionData(
+                            quest_id=quest.quest_id,
+                            quest_type=quest.quest_type,
+                            input_data=quest.input_data,
+                            status=ExecutionStatus.ERROR,
+                            end_time=time.time(),
+                            error={"message": f"Duplicate quest_id in batch: {quest.quest_id}"},
+                        )
+                        continue
+                    seen_ids.add(quest.quest_id)
+                    running.add(asyncio.create_task(run(quest)))
+                
+                if not running:
+                    break
+                
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            # Consumer stopped early (or failed): cancel quests still in flight
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+    
+    async def _execute_sequential(self, quest_data: QuestExecutionData) -> QuestExecutionData:
+        """Run the execution stack one step at a time (n8n's executionLoop)"""
         quest_data.status = ExecutionStatus.RUNNING
         quest_data.start_time = time.time()
         
+        await self._checkpoint_quest_start(quest_data)
         await self.hooks.emit("quest_started", quest_data)
         
         # Main execution loop (n8n's executionLoop)
         while quest_data.execution_stack:
+            # Fail fast once the quest deadline is gone (before popping the step)
+            remaining = quest_data.remaining_time()
+            if remaining is not None and remaining <= 0:
+                self._mark_timed_out(quest_data, quest_data.execution_stack[0], "Quest deadline exceeded")
+                break
+            
             # Pop next Lord step
             current_step = quest_data.execution_stack.pop(0)
             
             # Execute Lord with retry logic
             try:
                 await self._execute_lord_step(current_step, quest_data)
+            except DeadlineExceeded as e:
+                # Deadline overrides on_error: nothing downstream can finish in time
+                self._mark_timed_out(quest_data, current_step, str(e))
+                await self._record_step(
+                    current_step,
+                    quest_data,
+                    self._get_previous_output(quest_data) or quest_data.input_data,
+                )
+                break
             except Exception as e:
                 # Handle error based on error mode
                 if current_step.on_error == ErrorMode.STOP:
@@ -200,10 +709,16 @@ class QuestExecutor:
                         "tool": current_step.tool_name,
                         "message": str(e),
                     }
-                    await self.hooks.emit("quest_finished", quest_data)
+                    # Keep the failing run in run_data, as graph mode does
+                    await self._record_step(
+                        current_step,
+                        quest_data,
+                        self._get_previous_output(quest_data) or quest_data.input_data,
+                    )
                     break
                 elif current_step.on_error == ErrorMode.CONTINUE:
                     # Skip this Lord, continue to next
+                    await self._log_step_finished(current_step, quest_data)
                     continue
                 elif current_step.on_error == ErrorMode.CONTINUE_WITH_INPUT:
                     # Pass input data as output, continue
@@ -212,33 +727,11 @@ class QuestExecutor:
             # Update quest state
             quest_data.last_lord_executed = current_step.lord_name
             
-            # Store result in run_data
-            if current_step.lord_name not in quest_data.run_data:
-                quest_data.run_data[current_step.lord_name] = {}
-            
-            quest_data.run_data[current_step.lord_name][current_step.run_index] = {
-                "status": current_step.status,
-                "start_time": current_step.start_time,
-                "execution_time": current_step.execution_time,
-                "data": current_step.data,
-                "error": current_step.error,
-            }
-            
-            # Auto-save quest state after each Lord execution
-            if self._auto_save and self.repository:
-                self.repository.save_quest(quest_data)
-                self.repository.save_lord_run(
-                    quest_id=quest_data.quest_id,
-                    lord_name=current_step.lord_name,
-                    tool_name=current_step.tool_name,
-                    run_index=current_step.run_index,
-                    status="success" if current_step.status == ExecutionStatus.SUCCESS else "error",
-                    input_data=self._get_previous_output(quest_data) or quest_data.input_data,
-                    output_data=current_step.data,
-                    error_message=current_step.error.get("message") if current_step.error else None,
-                    start_time=current_step.start_time,
-                    end_time=current_step.start_time + current_step.execution_time if current_step.execution_time else None
-                )
+            await self._record_step(
+                current_step,
+                quest_data,
+                self._get_previous_output(quest_data) or quest_data.input_data,
+            )
         
         # Quest completed
         if quest_data.status == ExecutionStatus.RUNNING:
@@ -247,48 +740,412 @@ class QuestExecutor:
         quest_data.end_time = time.time()
         quest_data.output_data = self._get_previous_output(quest_data)
         
-        # Save final quest state
+        # Save final quest state (durability barrier for write-behind)
         if self._auto_save and self.repository:
-            self.repository.save_quest(quest_data)
+            await self._save_final_state(quest_data)
         
         await self.hooks.emit("quest_finished", quest_data)
         
         return quest_data
     
-    async def _execute_lord_step(self, step: LordStep, quest_data: QuestExecutionData):
+    async def execute_quest_graph(
+        self,
+        quest_data: QuestExecutionData,
+        max_concurrency: Optional[int] = None,
+    ) -> QuestExecutionData:
+        """
+        Execute a quest as a dependency graph (parallel fan-out / fan-in)
+        
+        Every step whose dependencies have finished is started immediately,
+        up to max_concurrency steps at a time, so quest latency follows the
+        critical path instead of the sum of step times.
+        
+        Step input:
+        - Root steps (no depends_on) receive quest_data.input_data
+        - Other steps receive their upstream outputs merged in depends_on order
+        
+        Error modes:
+        - Deadline exceeded: cancel running steps, quest is TIMED_OUT
+        - STOP: cancel running steps and fail the quest
+        - CONTINUE: dependents run without this step's output
+        - CONTINUE_WITH_INPUT: the step's input is passed through as its output
+        
+        Args:
+            quest_data: Quest whose execution_stack steps declare depends_on
+            max_concurrency: Maximum steps in flight (default: executor setting)
+        
+        Returns:
+            Updated quest_data; output_data is the sink step's output, or a
+            dict of {step key: output} when the graph has several sinks
+        """
+        limit = max(1, max_concurrency or self.max_step_concurrency)
+        pending = self._plan_graph(quest_data)
+        sinks = self._graph_sinks(quest_data.execution_stack)
+        outputs = self._completed_graph_outputs(quest_data)
+        
+        quest_data.status = ExecutionStatus.RUNNING
+        quest_data.start_time = time.time()
+        
+        await self._checkpoint_quest_start(quest_data)
+        await self.hooks.emit("quest_started", quest_data)
+        
+        running: Dict[asyncio.Task, LordStep] = {}
+        step_inputs: Dict[str, Dict[str, Any]] = {}
+        
+        try:
+            while pending or running:
+                # Launch every ready step (all dependencies finished)
+                for key in list(pending):
+                    if len(running) >= limit:
+                        break
+                    step = pending[key]
+                    if any(dep not in outputs for dep in step.depends_on):
+                        continue
+                    
+                    del pending[key]
+                    step_inputs[key] = self._merge_graph_inputs(step, outputs, quest_data)
+                    task = asyncio.create_task(
+                        self._execute_lord_step(step, quest_data, step_inputs[key])
+                    )
+                    running[task] = step
+                
+                if not running:
+                    # Nothing runnable but steps remain: their dependencies can never finish
+                    raise ValueError(f"Unsatisfiable dependencies for steps: {sorted(pending)}")
+                
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                
+                for task in done:
+                    step = running.pop(task)
+                    error = task.exception()
+                    
+                    if error is not None:
+                        if isinstance(error, DeadlineExceeded):
+                            self._mark_timed_out(quest_data, step, str(error))
+                        elif step.on_error == ErrorMode.STOP:
+                            quest_data.status = ExecutionStatus.ERROR
+                            quest_data.error = {
+                                "lord": step.lord_name,
+                                "tool": step.tool_name,
+                                "step": step.key,
+                                "message": str(error),
+                            }
+                        elif step.on_error == ErrorMode.CONTINUE_WITH_INPUT:
+                            step.data = step_inputs[step.key]
+                    
+                    outputs[step.key] = step.data
+                    quest_data.execution_stack.remove(step)
+                    quest_data.last_lord_executed = step.lord_name
+                    await self._record_step(step, quest_data, step_inputs[step.key])
+                
+                if quest_data.status in (ExecutionStatus.ERROR, ExecutionStatus.TIMED_OUT):
+                    break
+        finally:
+            # STOP error (or caller cancellation): don't leave orphaned Lord calls
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+        
+        if quest_data.status == ExecutionStatus.RUNNING:
+            quest_data.status = ExecutionStatus.COMPLETED
+        
+        quest_data.end_time = time.time()
+        if len(sinks) == 1:
+            quest_data.output_data = outputs.get(sinks[0])
+        else:
+            quest_data.output_data = {key: outputs.get(key) for key in sinks}
+        
+        if self._auto_save and self.repository:
+            await self._save_final_state(quest_data)
+        
+        await self.hooks.emit("quest_finished", quest_data)
+        
+        return quest_data
+    
+    def _plan_graph(self, quest_data: QuestExecutionData) -> Dict[str, LordStep]:
+        """
+        Validate the quest graph and index pending steps by key
+        
+        Steps with an explicit step_id that share a Lord get distinct
+        run_index values so their run_data entries never overwrite each other.
+        
+        Raises:
+            ValueError: On duplicate keys, unknown dependencies or cycles
+        """
+        used_indexes: Dict[str, Set[int]] = {
+            lord_name: {int(index) for index in runs}
+            for lord_name, runs in quest_data.run_data.items()
+        }
+        
+        pending: Dict[str, LordStep] = {}
+        for step in quest_data.execution_stack:
+            lord_indexes = used_indexes.setdefault(step.lord_name, set())
+            if step.step_id and step.run_index in lord_indexes:
+                step.run_index = max(lord_indexes) + 1
+            lord_indexes.add(step.run_index)
+            
+            if step.key in pending:
+                raise ValueError(f"Duplicate step key in quest graph: {step.key}")
+            pending[step.key] = step
+        
+        completed = set(self._completed_graph_outputs(quest_data))
+        for step in pending.values():
+            for dep in step.depends_on:
+                if dep not in pending and dep not in completed:
+                    raise ValueError(f"Step {step.key} depends on unknown step: {dep}")
+        
+        # Cycle check (Kahn's algorithm over pending steps)
+        indegree = {key: sum(1 for dep in step.depends_on if dep in pending) for key, step in pending.items()}
+        ready = [key for key, degree in indegree.items() if degree == 0]
+        visited = 0
+        while ready:
+            key = ready.pop()
+            visited += 1
+            for other_key, other in pending.items():
+                if key in other.depends_on:
+                    indegree[other_key] -= 1
+                    if indegree[other_key] == 0:
+                        ready.append(other_key)
+        if visited != len(pending):
+            raise ValueError("Quest graph contains a dependency cycle")
+        
+        return pending
+    
+    @staticmethod
+    def _graph_sinks(steps: List[LordStep]) -> List[str]:
+        """Keys of steps nothing else depends on (the quest's final outputs)"""
+        upstream = {dep for step in steps for dep in step.depends_on}
+        return [step.key for step in steps if step.key not in upstream]
+    
+    @staticmethod
+    def _completed_graph_outputs(quest_data: QuestExecutionData) -> Dict[str, Any]:
+        """Outputs of graph steps already recorded in run_data (resumed quests)"""
+        outputs = {}
+        for runs in quest_data.run_data.values():
+            for run in runs.values():
+                if isinstance(run, dict) and run.get("step_id"):
+                    outputs[run["step_id"]] = run.get("data", run.get("output"))
+        return outputs
+    
+    @staticmethod
+    def _merge_graph_inputs(
+        step: LordStep,
+        outputs: Dict[str, Any],
+        quest_data: QuestExecutionData,
+    ) -> Dict[str, Any]:
+        """Build a step's input: quest input for roots, merged upstream outputs for joins"""
+        if not step.depends_on:
+            return dict(quest_data.input_data)
+        
+        merged: Dict[str, Any] = {}
+        for dep in step.depends_on:
+            upstream = outputs.get(dep)
+            if isinstance(upstream, dict):
+                merged.update(upstream)
+        return merged
+    
+    async def _record_step(self, step: LordStep, quest_data: QuestExecutionData, input_data: Optional[Dict[str, Any]]):
+        """Store a finished step in run_data and auto-save it"""
+        if step.lord_name not in quest_data.run_data:
+            quest_data.run_data[step.lord_name] = {}
+        
+        run = {
+            "status": step.status,
+            "start_time": step.start_time,
+            "execution_time": step.execution_time,
+            "data": step.data,
+            "error": step.error,
+        }
+        if step.depends_on or step.step_id:
+            run["step_id"] = step.key
+        quest_data.run_data[step.lord_name][step.run_index] = run
+        
+        # Auto-save quest state after each Lord execution
+        if self._auto_save and self.repository:
+            if self.incremental_state:
+                await self._log_step_finished(step, quest_data)
+            else:
+                await self._save_quest_state(quest_data)
+            await self._save_lord_run(
+                quest_id=quest_data.quest_id,
+                lord_name=step.lord_name,
+                tool_name=step.tool_name,
+                run_index=step.run_index,
+                status="success" if step.status == ExecutionStatus.SUCCESS else "error",
+                input_data=input_data or {},
+                output_data=step.data,
+                error_message=step.error.get("message") if step.error else None,
+                start_time=step.start_time,
+                end_time=step.start_time + step.execution_time if step.execution_time else None,
+                step_id=run.get("step_id")
+            )
+    
+    async def _log_step_finished(self, step: LordStep, quest_data: QuestExecutionData):
+        """
+        Incremental mode: record that a step left the execution stack
+        
+        Called for every recorded step and for steps skipped via CONTINUE,
+        which are not kept in run_data.
+        """
+        if self._auto_save and self.repository and self.incremental_state:
+            await self._append_event(quest_data, "step_finished", {
+                "step_key": step.key,
+                "lord_name": step.lord_name,
+                "run_index": step.run_index,
+                "status": step.status.value,
+            })
+    
+    async def _save_quest_state(self, quest_data: QuestExecutionData):
+        """Persist quest state (queued when write-behind is enabled)"""
+        if self.write_queue:
+            await self.write_queue.save_quest(quest_data)
+        else:
+            self.repository.save_quest(quest_data)
+    
+    async def _save_lord_run(self, **run: Any):
+        """Persist a Lord run (queued when write-behind is enabled)"""
+        if self.write_queue:
+            await self.write_queue.save_lord_run(**run)
+        else:
+            self.repository.save_lord_run(**run)
+    
+    async def _checkpoint_quest_start(self, quest_data: QuestExecutionData):
+        """Incremental mode: write the base checkpoint row events will apply to"""
+        if self._auto_save and self.repository and self.incremental_state:
+            self._pending_events[quest_data.quest_id] = 0
+            await self._save_quest_state(quest_data)
+    
+    async def _save_final_state(self, quest_data: QuestExecutionData):
+        """Persist the finished quest and wait until it is durable"""
+        if self.incremental_state:
+            await self._append_event(quest_data, "quest_finished", {
+                "status": quest_data.status.value,
+                "end_time": quest_data.end_time,
+                "output_ref": self._output_ref(quest_data),
+            })
+            self._pending_events.pop(quest_data.quest_id, None)
+        else:
+            await self._save_quest_state(quest_data)
+        await self._flush_writes()
+    
+    async def _append_event(self, quest_data: QuestExecutionData, event_type: str, payload: Dict[str, Any]):
+        """Append an incremental state event, compacting every compact_every events"""
+        if self.write_queue:
+            await self.write_queue.append_quest_event(quest_data.quest_id, event_type, payload)
+        else:
+            self.repository.append_quest_event(quest_data.quest_id, event_type, payload)
+        
+        count = self._pending_events.get(quest_data.quest_id, 0) + 1
+        if count >= self.compact_every:
+            count = 0
+            if self.write_queue:
+                await self.write_queue.compact_quest(quest_data.quest_id)
+            else:
+                self.repository.compact_quest(quest_data.quest_id)
+        self._pending_events[quest_data.quest_id] = count
+    
+    @staticmethod
+    def _output_ref(quest_data: QuestExecutionData) -> Dict[str, Any]:
+        """
+        Reference the run(s) holding output_data instead of copying it
+        
+        Returns:
+            {"lord_name", "run_index"}, {"sinks": {key: ref}} for multi-sink
+            graphs, or {"output": data} when no run holds the data
+        """
+        def find(data: Any) -> Dict[str, Any]:
+            if data is None:
+                return {"output": None}
+            for lord_name, runs in quest_data.run_data.items():
+                for run_index, run in runs.items():
+                    if isinstance(run, dict) and run.get("data") is data:
+                        return {"lord_name": lord_name, "run_index": run_index}
+            return {"output": data}
+        
+        output = quest_data.output_data
+        ref = find(output)
+        if "output" in ref and isinstance(output, dict) and output:
+            sinks = {key: find(value) for key, value in output.items()}
+            if all("output" not in sink for sink in sinks.values()):
+                return {"sinks": sinks}
+        return ref
+    
+    async def _flush_writes(self):
+        """Wait until queued writes are committed (no-op without write-behind)"""
+        if self.write_queue:
+            await self.write_queue.flush()
+    
+    async def _execute_lord_step(
+        self,
+        step: LordStep,
+        quest_data: QuestExecutionData,
+        input_data: Optional[Dict[str, Any]] = None,
+    ):
         """
         Execute a single Lord step with retry logic (n8n pattern)
         
         Args:
             step: Lord step to execute
             quest_data: Current quest execution state
+            input_data: Explicit step input (graph mode); defaults to previous Lord's output
         """
         step.start_time = time.time()
         step.status = ExecutionStatus.RUNNING
         
         await self.hooks.emit("lord_invoked", step, quest_data)
         
-        # Get input data from previous Lord
-        input_data = self._get_previous_output(quest_data)
-        
-        # Merge with quest input for first Lord
-        if not quest_data.run_data:
-            input_data = {**quest_data.input_data, **(input_data or {})}
+        if input_data is None:
+            # Get input data from previous Lord
+            input_data = self._get_previous_output(quest_data)
+            
+            # Merge with quest input for first Lord
+            if not quest_data.run_data:
+                input_data = {**quest_data.input_data, **(input_data or {})}
         
-        # Retry loop (n8n pattern)
+        # Retry loop (n8n pattern, with backoff/classification/budget from retry_policy)
         last_error = None
+        attempts = 0
+        self.retry_policy.record_request(step.lord_name)
         for attempt in range(step.retry_config.max_tries):
             try:
                 # Delay before retry (skip on first attempt)
-                if attempt > 0 and step.retry_config.wait_between_tries_ms > 0:
-                    await asyncio.sleep(step.retry_config.wait_between_tries_ms / 1000)
+                wait = self.retry_policy.backoff_seconds(step.retry_config, attempt)
+                if wait > 0:
+                    remaining = quest_data.remaining_time()
+                    if remaining is not None and remaining <= wait:
+                        # No budget left for another attempt - don't sleep into the deadline
+                        raise DeadlineExceeded(
+                            f"Quest deadline exceeded before retry {attempt + 1} of {step.lord_name}.{step.tool_name}"
+                        )
+                    await asyncio.sleep(wait)
                 
-                # Invoke Lord via JSON-RPC
-                result = await self._call_lord_jsonrpc(
-                    step.lord_name,
-                    step.tool_name,
-                    input_data or {}
-                )
+                # Per-attempt timeout, clipped to the remaining quest budget
+                step_timeout = step.timeout_s or self.default_step_timeout
+                timeout = step_timeout
+                remaining = quest_data.remaining_time()
+                if remaining is not None:
+                    if remaining <= 0:
+                        raise DeadlineExceeded(f"Quest deadline exceeded before {step.lord_name}.{step.tool_name}")
+                    timeout = min(timeout, remaining)
+                
+                # Invoke Lord via JSON-RPC (or serve from result cache). The transport
+                # gets the Lord's own timeout, so only the attempt timeout enforces the
+                # quest budget; it bounds the Lord call, not cache lookups and stores.
+                attempts += 1
+                try:
+                    result = await self._call_lord_cached(
+                        step, input_data or {}, step_timeout, quest_data.deadline, timeout
+                    )
+                except asyncio.TimeoutError:
+                    if timeout < step_timeout:
+                        # The quest ran out of budget - not a sign the Lord is unhealthy
+                        raise DeadlineExceeded(
+                            f"Quest deadline exceeded during {step.lord_name}.{step.tool_name} "
+                            f"({timeout:.2f}s of budget left)"
+                        )
+                    await self._record_breaker(step.lord_name, False)
+                    raise TimeoutError(f"Lord {step.lord_name} timed out after {timeout:.2f}s")
                 
                 # Success!
                 step.status = ExecutionStatus.SUCCESS
@@ -298,28 +1155,87 @@ class QuestExecutor:
                 await self.hooks.emit("lord_completed", step, quest_data)
                 return
             
+            except (DeadlineExceeded, CircuitOpenError) as e:
+                # Budget is gone / Lord is known to be down: skip remaining retries
+                last_error = e
+                break
+            
             except Exception as e:
                 last_error = e
-                if attempt < step.retry_config.max_tries - 1:
-                    # Not final attempt, will retry
-                    continue
+                remaining = quest_data.remaining_time()
+                if remaining is not None and remaining <= 0:
+                    # Transport timed out on the clipped budget - report as deadline
+                    last_error = DeadlineExceeded(
+                        f"Quest deadline exceeded during {step.lord_name}.{step.tool_name}: {e}"
+                    )
+                    break
+                if attempt == step.retry_config.max_tries - 1:
+                    break
+                if not self.retry_policy.is_retryable(e):
+                    # Will never succeed (bad params, unknown tool/Lord)
+                    break
+                if not self.retry_policy.allow_retry(step.lord_name):
+                    logger.warning(f"Retry budget exhausted for Lord {step.lord_name}, not retrying: {e}")
+                    break
         
         # All retries failed
         step.status = ExecutionStatus.ERROR
         step.execution_time = time.time() - step.start_time
         step.error = {
             "message": str(last_error),
-            "attempts": step.retry_config.max_tries,
+            "attempts": attempts,
         }
+        if isinstance(last_error, LordRpcError):
+            step.error["code"] = last_error.code
         
         await self.hooks.emit("lord_error", step, quest_data)
         raise last_error
     
+    async def _call_lord_cached(
+        self,
+        step: LordStep,
+        params: Dict[str, Any],
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        attempt_timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Memoization layer in front of _call_lord_jsonrpc
+        
+        Only successful results are cached; errors always reach the retry loop.
+        attempt_timeout (asyncio.TimeoutError) bounds the Lord call only, so
+        slow cache I/O never turns a successful call into a timeout. A failed
+        store is logged, not raised.
+        """
+        cache = self.result_cache
+        if cache is None or not cache.enabled_for(step.cache):
+            return await asyncio.wait_for(
+                self._call_lord_jsonrpc(step.lord_name, step.tool_name, params, timeout, deadline, step.hedge),
+                attempt_timeout,
+            )
+        
+        hit, result = await cache.get(step.lord_name, step.tool_name, params)
+        if hit:
+            return result
+        
+        result = await asyncio.wait_for(
+            self._call_lord_jsonrpc(step.lord_name, step.tool_name, params, timeout, deadline, step.hedge),
+            attempt_timeout,
+        )
+        try:
+            await cache.put(step.lord_name, step.tool_name, params, result)
+        except Exception as e:
+            logger.warning(f"Result cache store failed for {step.lord_name}.{step.tool_name}: {e}")
+        return result
+    
     async def _call_lord_jsonrpc(
         self,
         lord_name: str,
         tool_name: str,
-        params: Dict[str, Any]
+        params: Dict[str, Any],
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        hedge: Optional[HedgePolicy] = None,
     ) -> Dict[str, Any]:
         """
         Call a Lord's tool via JSON-RPC 2.0 (MCP protocol)
@@ -328,6 +1244,10 @@ class QuestExecutor:
             lord_name: Name of Lord (e.g., "architect")
             tool_name: Tool to invoke (e.g., "design_system")
             params: Tool parameters
+            timeout: HTTP read timeout in seconds (default: executor default_step_timeout);
+                connect/write/pool timeouts come from the pool's LordClientConfig
+            deadline: Quest deadline; remaining budget is sent as params._meta.deadline_ms
+            hedge: Optional hedging policy for slow responses
         
         Returns:
             Tool result
@@ -335,11 +1255,15 @@ class QuestExecutor:
         Raises:
             Exception: If Lord returns error or unreachable
         """
-        port = self.LORD_REGISTRY.get(lord_name)
-        if not port:
-            raise ValueError(f"Unknown Lord: {lord_name}")
+        if lord_name not in self.registry:
+            raise UnknownLordError(f"Unknown Lord: {lord_name}")
         
-        url = f"http://localhost:{port}/mcp"
+        breaker = self.breakers.for_lord(lord_name) if self.breakers else None
+        if breaker is not None:
+            try:
+                breaker.acquire()
+            finally:
+                await self._emit_breaker_events()
         
         # MCP protocol format: tools/call with nested tool name and arguments
         request_payload = {
@@ -349,21 +1273,190 @@ class QuestExecutor:
                 "name": tool_name,
                 "arguments": params,
             },
-            "id": 1,
+            "id": next(self._rpc_ids),
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=request_payload, timeout=30.0)
-            response.raise_for_status()
-            
-            rpc_response = response.json()
-            
-            # Check for JSON-RPC error
-            if "error" in rpc_response and rpc_response["error"] is not None:
-                error = rpc_response["error"]
-                raise Exception(f"Lord {lord_name} error: {error.get('message', 'Unknown error')}")
+        # Forward remaining budget so Lords can shed work that can't finish in time
+        if deadline is not None:
+            request_payload["params"]["_meta"] = {
+                "deadline_ms": max(0, int((deadline - time.time()) * 1000)),
+            }
+        
+        timeout = timeout or self.default_step_timeout
+        
+        # Reuse the pooled keep-alive connection for this Lord,
+        # capped by the current batch's per-Lord limit (execute_many)
+        lord_limits = _LORD_LIMITS.get()
+        semaphore = lord_limits.get(lord_name) if lord_limits else None
+        healthy: Optional[bool] = None
+        try:
+            if semaphore is None:
+                rpc_response = await self._post_to_replica(lord_name, request_payload, timeout, hedge)
+            else:
+                async with semaphore:
+                    rpc_response = await self._post_to_replica(lord_name, request_payload, timeout, hedge)
+            healthy = True
+        except Exception:
+            healthy = False
+            raise
+        finally:
+            # Cancellation (step timeout) records nothing here; the retry loop reports it
+            if breaker is not None:
+                await self._record_breaker(lord_name, healthy)
+        
+        # Check for JSON-RPC error
+        if "error" in rpc_response and rpc_response["error"] is not None:
+            error = rpc_response["error"]
+            raise LordRpcError(lord_name, error.get("code"), error.get("message", "Unknown error"), error.get("data"))
+        
+        return rpc_response.get("result", {})
+    
+    async def _post_to_replica(
+        self,
+        lord_name: str,
+        request_payload: Dict[str, Any],
+        timeout: float,
+        hedge: Optional[HedgePolicy] = None,
+    ) -> Dict[str, Any]:
+        """
+        POST to one replica chosen by the registry, feeding back latency and health
+        
+        Transport/HTTP failures count against the replica; cancellation
+        (step timeout, quest teardown, losing hedge) releases it without a
+        health signal.
+        """
+        if hedge is not None:
+            return await self._post_hedged(lord_name, request_payload, timeout, hedge)
+        return await self._post_to_endpoint(self.registry.acquire(lord_name), request_payload, timeout)
+    
+    async def _post_hedged(
+        self,
+        lord_name: str,
+        request_payload: Dict[str, Any],
+        timeout: float,
+        hedge: HedgePolicy,
+    ) -> Dict[str, Any]:
+        """
+        Hedged POST: duplicate a slow call to another replica, first success wins
+        
+        The hedge delay is the Lord's observed latency percentile
+        (hedge.default_delay_ms until enough samples exist). Hedges only go
+        to replicas not tried yet; with none available the call just waits.
+        Losers are cancelled; if every attempt fails the last error is raised.
+        """
+        delay = self.registry.latency_percentile(lord_name, hedge.percentile, hedge.min_samples)
+        delay = hedge.default_delay_ms / 1000 if delay is None else delay
+        delay = max(hedge.min_delay_ms / 1000, delay)
+        
+        counters = self._hedge_stats.setdefault(lord_name, {"sent": 0, "won": 0})
+        endpoint = self.registry.acquire(lord_name)
+        used = [endpoint.url]
+        primary = asyncio.create_task(self._post_to_endpoint(endpoint, request_payload, timeout))
+        pending = {primary}
+        hedges_sent = 0
+        max_hedges = hedge.max_hedges
+        last_error: Optional[BaseException] = None
+        
+        try:
+            while pending:
+                wait = delay if hedges_sent < max_hedges else None
+                done, pending = await asyncio.wait(pending, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+                
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            counters["won"] += 1
+                        return task.result()
+                    last_error = task.exception()
+                
+                if not done and hedges_sent < max_hedges:
+                    if not self.registry.has_available(lord_name, exclude=used):
+                        # A duplicate would land on a replica already busy with this call
+                        max_hedges = hedges_sent
+                        continue
+                    # Still slow after the percentile delay: send a duplicate elsewhere
+                    endpoint = self.registry.acquire(lord_name, exclude=used)
+                    used.append(endpoint.url)
+                    pending.add(asyncio.create_task(self._post_to_endpoint(endpoint, request_payload, timeout)))
+                    hedges_sent += 1
+                    counters["sent"] += 1
             
-            return rpc_response.get("result", {})
+            raise last_error
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+    
+    async def _post_to_endpoint(
+        self,
+        endpoint: LordEndpoint,
+        request_payload: Dict[str, Any],
+        timeout: float,
+    ) -> Dict[str, Any]:
+        """
+        POST to a replica from registry.acquire() and release it with the outcome
+        
+        With batching enabled, concurrent calls to the same replica with the
+        same timeout share one JSON-RPC batch request.
+        
+        Returns:
+            Decoded JSON-RPC response object
+        """
+        start = time.perf_counter()
+        ok: Optional[bool] = None
+        try:
+            if self.batcher is None:
+                rpc_response = await self._send_rpc(endpoint, request_payload, timeout)
+            else:
+                # Only calls with the same timeout share a batch: it is sent with one timeout
+                rpc_response = await self.batcher.call(
+                    (endpoint.url, timeout),
+                    request_payload,
+                    lambda payload: self._send_rpc(endpoint, payload, timeout),
+                )
+            ok = True
+            return rpc_response
+        except Exception:
+            ok = False
+            raise
+        finally:
+            self.registry.release(endpoint, time.perf_counter() - start, ok)
+    
+    async def _send_rpc(self, endpoint: LordEndpoint, payload: Any, timeout: float) -> Any:
+        """POST a JSON-RPC request object or batch array and decode the body"""
+        response = await self.client_pool.post(
+            endpoint.lord_name, endpoint.url, "/mcp", payload,
+            timeout=timeout, transport=endpoint.asgi_transport(),
+        )
+        return response.json()
+    
+    async def _record_breaker(self, lord_name: str, ok: Optional[bool]):
+        """Feed a call outcome to the Lord's breaker and publish any state change"""
+        if self.breakers is None:
+            return
+        self.breakers.for_lord(lord_name).record(ok)
+        await self._emit_breaker_events()
+    
+    def _on_breaker_state_change(self, lord_name: str, old_state: CircuitState, new_state: CircuitState):
+        logger.warning(f"Circuit for Lord {lord_name}: {old_state.value} -> {new_state.value}")
+        self._breaker_events.append((lord_name, old_state, new_state))
+    
+    async def _emit_breaker_events(self):
+        while self._breaker_events:
+            lord_name, old_state, new_state = self._breaker_events.pop(0)
+            await self.hooks.emit("breaker_state_changed", lord_name, old_state, new_state)
+    
+    @staticmethod
+    def _mark_timed_out(quest_data: QuestExecutionData, step: LordStep, message: str):
+        """Fail the quest with the distinct TIMED_OUT status"""
+        quest_data.status = ExecutionStatus.TIMED_OUT
+        quest_data.error = {
+            "lord": step.lord_name,
+            "tool": step.tool_name,
+            "message": message,
+            "deadline": quest_data.deadline,
+        }
     
     def _get_previous_output(self, quest_data: QuestExecutionData) -> Optional[Dict[str, Any]]:
         """
@@ -406,6 +1499,9 @@ class QuestExecutor:
         if not self.repository:
             raise RuntimeError("Cannot pause quest: no repository configured")
         
+        # Pause point is a durability barrier: snapshot must see every queued write
+        await self._flush_writes()
+        
         # Load current quest state
         quest_data = self.repository.load_quest(quest_id)
         if not quest_data:
@@ -441,6 +1537,8 @@ class QuestExecutor:
         if not self.repository:
             raise RuntimeError("Cannot resume quest: no repository configured")
         
+        await self._flush_writes()
+        
         # Load quest and snapshot
         quest_data = self.repository.load_quest(quest_id)
         if not quest_data:
@@ -478,6 +1576,8 @@ class QuestExecutor:
         if not self.repository:
             raise RuntimeError("Cannot replay quest: no repository configured")
         
+        await self._flush_writes()
+        
         # Load original quest
         original_quest = self.repository.load_quest(quest_id)
         if not original_quest:
@@ -510,12 +1610,18 @@ class QuestExecutor:
             execution_stack = list(original_quest.execution_stack)
             run_data = {}
         
+        # A replay gets the original quest's time budget, starting now
+        deadline = None
+        if original_quest.deadline is not None and original_quest.start_time:
+            deadline = time.time() + max(0.0, original_quest.deadline - original_quest.start_time)
+        
         replay_quest_data = QuestExecutionData(
             quest_id=new_quest_id,
             quest_type=original_quest.quest_type,
             input_data=original_quest.input_data,
             execution_stack=execution_stack,
-            run_data=run_data
+            run_data=run_data,
+            deadline=deadline
         )
         
         # Execute replay
@@ -576,6 +1682,37 @@ def build_microservice_design_quest(requirements: str) -> QuestExecutionData:
     return quest_data
 
 
+# Example: Build a parallel (DAG) quest
+def build_parallel_review_quest(requirements: str) -> QuestExecutionData:
+    """
+    Build a graph quest: Architect -> Forge Master -> (Security || Quality) -> Scribe
+    
+    Quest flow:
+    1. Architect designs system architecture
+    2. Forge Master generates code from design
+    3. Sentinel security analysis and quality check run side by side
+    4. Scribe documents the merged review results (join step)
+    """
+    return QuestExecutionData(
+        quest_id="q-002",
+        quest_type="parallel_review",
+        input_data={"requirements": requirements},
+        execution_stack=[
+            LordStep(lord_name="architect", tool_name="design_system", step_id="design"),
+            LordStep(lord_name="forge_master", tool_name="generate_code", step_id="code", depends_on=["design"]),
+            LordStep(lord_name="sentinel", tool_name="analyze_security", step_id="security", depends_on=["code"]),
+            LordStep(lord_name="sentinel", tool_name="check_quality", step_id="quality", depends_on=["code"]),
+            LordStep(
+                lord_name="scribe",
+                tool_name="write_docs",
+                step_id="docs",
+                depends_on=["security", "quality"],
+                on_error=ErrorMode.CONTINUE,
+            ),
+        ],
+    )
+
+
 # Example: Execution with hooks
 async def main():
     """Demo: Execute a multi-Lord quest with observability"""
@@ -614,8 +1751,8 @@ async def main():
     )
     
     # Execute quest
-    executor = QuestExecutor(hooks=hooks)
-    result = await executor.execute_quest(quest)
+    async with QuestExecutor(hooks=hooks) as executor:
+        result = await executor.execute_quest(quest)
     
     # Print results
     print("\n📊 Quest Results:")
@@ -9,6 +9,7 @@ Based on n8n workflow execution storage patterns.
 
 import sqlite3
 import json
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Tuple
@@ -18,8 +19,8 @@ from contextlib import contextmanager
 from quest_executor import QuestExecutionData, ExecutionStatus, LordStep
 
 
-# Database schema version for migrations
-SCHEMA_VERSION = 1
+# Database schema version for migrations (2: quest_executions.deadline, 3: lord_runs.step_id)
+SCHEMA_VERSION = 3
 
 
 class QuestRepository:
@@ -59,6 +60,7 @@ class QuestRepository:
                     start_time REAL,
                     end_time REAL,
                     duration_seconds REAL,
+                    deadline REAL,  -- Absolute quest deadline (epoch seconds)
                     
                     -- Data
                     input_data TEXT NOT NULL,  -- JSON
@@ -74,6 +76,11 @@ class QuestRepository:
                 )
             """)
             
+            # Schema 1 databases predate the deadline column
+            columns = {column["name"] for column in cursor.execute("PRAGMA table_info(quest_executions)")}
+            if "deadline" not in columns:
+                cursor.execute("ALTER TABLE quest_executions ADD COLUMN deadline REAL")
+            
             # Lord runs table (one row per Lord invocation)
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS lord_runs (
@@ -84,6 +91,7 @@ class QuestRepository:
                     lord_name TEXT NOT NULL,
                     tool_name TEXT NOT NULL,
                     run_index INTEGER NOT NULL,  -- Multiple runs of same Lord
+                    step_id TEXT,                -- Graph step key (graph quests only)
                     
                     -- Execution
                     status TEXT NOT NULL,        -- success, error, skipped
@@ -107,6 +115,11 @@ class QuestRepository:
                 )
             """)
             
+            # Schema 2 databases predate lord_runs.step_id
+            columns = {column["name"] for column in cursor.execute("PRAGMA table_info(lord_runs)")}
+            if "step_id" not in columns:
+                cursor.execute("ALTER TABLE lord_runs ADD COLUMN step_id TEXT")
+            
             # Quest state snapshots (for pause/resume)
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS quest_snapshots (
@@ -125,6 +138,31 @@ class QuestRepository:
                 )
             """)
             
+            # Append-only quest state log (incremental persistence)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS quest_events (
+                    event_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    quest_id TEXT NOT NULL,
+                    event_type TEXT NOT NULL,    -- step_finished, quest_finished
+                    payload TEXT NOT NULL,       -- JSON (small: keys and output references)
+                    created_at TEXT NOT NULL,
+                    
+                    FOREIGN KEY (quest_id) REFERENCES quest_executions(quest_id)
+                )
+            """)
+            
+            # Lord result cache (persistent tier for lord_cache.LordResultCache)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS lord_result_cache (
+                    cache_key TEXT PRIMARY KEY,  -- SHA-256 of (lord, tool, arguments)
+                    lord_name TEXT NOT NULL,
+                    tool_name TEXT NOT NULL,
+                    result TEXT NOT NULL,        -- JSON
+                    created_at REAL NOT NULL,
+                    expires_at REAL              -- NULL = never expires
+                )
+            """)
+            
             # Indexes for performance
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_quest_status 
@@ -141,6 +179,11 @@ class QuestRepository:
                 ON lord_runs(quest_id, run_index)
             """)
             
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_quest_events_quest 
+                ON quest_events(quest_id, event_id)
+            """)
+            
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_lord_runs_lord 
                 ON lord_runs(lord_name, created_at DESC)
@@ -169,72 +212,105 @@ class QuestRepository:
         Args:
             quest_data: Quest execution data to persist
         """
-        now = datetime.now().isoformat()
+        row = self.quest_row(quest_data)
+        
+        with self._get_connection() as conn:
+            self._upsert_quest(conn.cursor(), row)
+            conn.commit()
+    
+    def quest_row(self, quest_data: QuestExecutionData) -> Dict[str, Any]:
+        """
+        Serialize quest state into a row for quest_executions.
         
-        # Serialize complex fields
-        input_json = json.dumps(quest_data.input_data)
-        output_json = json.dumps(quest_data.output_data) if quest_data.output_data else None
-        stack_json = json.dumps([self._serialize_lord_step(step) for step in quest_data.execution_stack])
+        The row is a point-in-time copy, so it can be written later
+        (write-behind) while the quest keeps mutating.
         
+        Args:
+            quest_data: Quest execution data
+            
+        Returns:
+            Column values keyed by column name
+        """
         # Calculate duration if finished
         duration = None
         if quest_data.start_time and quest_data.end_time:
             duration = quest_data.end_time - quest_data.start_time
         
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Check if quest exists
-            cursor.execute("SELECT quest_id FROM quest_executions WHERE quest_id = ?", 
-                          (quest_data.quest_id,))
-            exists = cursor.fetchone()
-            
-            if exists:
-                # Update existing quest
-                cursor.execute("""
-                    UPDATE quest_executions
-                    SET status = ?,
-                        end_time = ?,
-                        duration_seconds = ?,
-                        output_data = ?,
-                        execution_stack = ?,
-                        updated_at = ?
-                    WHERE quest_id = ?
-                """, (
-                    quest_data.status.value,
-                    quest_data.end_time,
-                    duration,
-                    output_json,
-                    stack_json,
-                    now,
-                    quest_data.quest_id
-                ))
-            else:
-                # Insert new quest
-                cursor.execute("""
-                    INSERT INTO quest_executions (
-                        quest_id, quest_type, status,
-                        start_time, end_time, duration_seconds,
-                        input_data, output_data,
-                        execution_stack,
-                        created_at, updated_at, schema_version
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    quest_data.quest_id,
-                    quest_data.quest_type,
-                    quest_data.status.value,
-                    quest_data.start_time,
-                    quest_data.end_time,
-                    duration,
-                    input_json,
-                    output_json,
-                    stack_json,
-                    now,
-                    now,
-                    SCHEMA_VERSION
-                ))
-            
-            conn.commit()
+        return {
+            "quest_id": quest_data.quest_id,
+            "quest_type": quest_data.quest_type,
+            "status": quest_data.status.value,
+            "start_time": quest_data.start_time,
+            "end_time": quest_data.end_time,
+            "duration_seconds": duration,
+            "deadline": quest_data.deadline,
+            "input_data": json.dumps(quest_data.input_data),
+            "output_data": json.dumps(quest_data.output_data) if quest_data.output_data else None,
+            "execution_stack": json.dumps([self._serialize_lord_step(step) for step in quest_data.execution_stack]),
+            "updated_at": datetime.now().isoformat(),
+        }
+    
+    def _upsert_quest(self, cursor: sqlite3.Cursor, row: Dict[str, Any]) -> None:
+        """
+        Insert or update a quest_executions row (caller commits).
+        
+        A full row is a checkpoint: pending quest_events are folded into it,
+        so they are cleared here.
+        """
+        cursor.execute("DELETE FROM quest_events WHERE quest_id = ?", (row["quest_id"],))
+        
+        # Check if quest exists
+        cursor.execute("SELECT quest_id FROM quest_executions WHERE quest_id = ?", 
+                      (row["quest_id"],))
+        exists = cursor.fetchone()
+        
+        if exists:
+            # Update existing quest
+            cursor.execute("""
+                UPDATE quest_executions
+                SET status = ?,
+                    end_time = ?,
+                    duration_seconds = ?,
+                    deadline = ?,
+                    output_data = ?,
+                    execution_stack = ?,
+                    updated_at = ?
+                WHERE quest_id = ?
+            """, (
+                row["status"],
+                row["end_time"],
+                row["duration_seconds"],
+                row["deadline"],
+                row["output_data"],
+                row["execution_stack"],
+                row["updated_at"],
+                row["quest_id"]
+            ))
+        else:
+            # Insert new quest
+            cursor.execute("""
+                INSERT INTO quest_executions (
+                    quest_id, quest_type, status,
+                    start_time, end_time, duration_seconds, deadline,
+                    input_data, output_data,
+                    execution_stack,
+                    created_at, updated_at, schema_version
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                row["quest_id"],
+                row["quest_type"],
+                row["status"],
+                row["start_time"],
+                row["end_time"],
+                row["duration_seconds"],
+                row["deadline"],
+                row["input_data"],
+                row["output_data"],
+                row["execution_stack"],
+                row["updated_at"],
+                row["updated_at"],
+                SCHEMA_VERSION
+            ))
     
     def load_quest(self, quest_id: str) -> Optional[QuestExecutionData]:
         """
@@ -247,41 +323,49 @@ class QuestRepository:
             QuestExecutionData if found, None otherwise
         """
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT quest_id, quest_type, status,
-                       start_time, end_time,
-                       input_data, output_data, execution_stack
-                FROM quest_executions
-                WHERE quest_id = ?
-            """, (quest_id,))
-            
-            row = cursor.fetchone()
-            if not row:
-                return None
-            
-            # Deserialize JSON fields
-            input_data = json.loads(row["input_data"])
-            output_data = json.loads(row["output_data"]) if row["output_data"] else None
-            stack_data = json.loads(row["execution_stack"])
-            
-            # Reconstruct execution stack
-            execution_stack = [self._deserialize_lord_step(step) for step in stack_data]
-            
-            # Load run_data from lord_runs table
-            run_data = self._load_run_data(quest_id, conn)
-            
-            return QuestExecutionData(
-                quest_id=row["quest_id"],
-                quest_type=row["quest_type"],
-                status=ExecutionStatus(row["status"]),
-                start_time=row["start_time"],
-                end_time=row["end_time"],
-                input_data=input_data,
-                output_data=output_data,
-                execution_stack=execution_stack,
-                run_data=run_data
-            )
+            return self._load_quest(conn, quest_id)
+    
+    def _load_quest(self, conn: sqlite3.Connection, quest_id: str) -> Optional[QuestExecutionData]:
+        """Load checkpoint row, run_data and replay pending quest_events."""
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT quest_id, quest_type, status,
+                   start_time, end_time, deadline,
+                   input_data, output_data, execution_stack
+            FROM quest_executions
+            WHERE quest_id = ?
+        """, (quest_id,))
+        
+        row = cursor.fetchone()
+        if not row:
+            return None
+        
+        # Deserialize JSON fields
+        input_data = json.loads(row["input_data"])
+        output_data = json.loads(row["output_data"]) if row["output_data"] else None
+        stack_data = json.loads(row["execution_stack"])
+        
+        # Reconstruct execution stack
+        execution_stack = [self._deserialize_lord_step(step) for step in stack_data]
+        
+        # Load run_data from lord_runs table
+        run_data = self._load_run_data(quest_id, conn)
+        
+        quest_data = QuestExecutionData(
+            quest_id=row["quest_id"],
+            quest_type=row["quest_type"],
+            status=ExecutionStatus(row["status"]),
+            start_time=row["start_time"],
+            end_time=row["end_time"],
+            deadline=row["deadline"],
+            input_data=input_data,
+            output_data=output_data,
+            execution_stack=execution_stack,
+            run_data=run_data
+        )
+        
+        self._apply_quest_events(conn, quest_data)
+        return quest_data
     
     def delete_quest(self, quest_id: str) -> bool:
         """
@@ -298,6 +382,7 @@ class QuestRepository:
             
             # Delete lord runs first (foreign key)
             cursor.execute("DELETE FROM lord_runs WHERE quest_id = ?", (quest_id,))
+            cursor.execute("DELETE FROM quest_events WHERE quest_id = ?", (quest_id,))
             cursor.execute("DELETE FROM quest_snapshots WHERE quest_id = ?", (quest_id,))
             
             # Delete quest
@@ -307,6 +392,114 @@ class QuestRepository:
             conn.commit()
             return deleted
     
+    # ============================================================
+    # INCREMENTAL STATE LOG
+    # ============================================================
+    
+    def append_quest_event(self, quest_id: str, event_type: str, payload: Dict[str, Any]) -> None:
+        """
+        Append a small step-transition record instead of rewriting the quest row.
+        
+        Event types:
+        - step_finished: {"step_key", "lord_name", "run_index", "status"} - step leaves the stack
+        - quest_finished: {"status", "end_time", "output_ref"} - final state; output_ref
+          points at lord_runs rows rather than copying the output
+        
+        Args:
+            quest_id: Quest identifier (its checkpoint row must already exist)
+            event_type: Event type
+            payload: JSON-serializable event payload
+        """
+        row = self.quest_event_row(quest_id, event_type, payload)
+        
+        with self._get_connection() as conn:
+            self._insert_quest_event(conn.cursor(), row)
+            conn.commit()
+    
+    def quest_event_row(self, quest_id: str, event_type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Serialize a quest event into a row for quest_events."""
+        return {
+            "quest_id": quest_id,
+            "event_type": event_type,
+            "payload": json.dumps(payload),
+            "created_at": datetime.now().isoformat(),
+        }
+    
+    def _insert_quest_event(self, cursor: sqlite3.Cursor, row: Dict[str, Any]) -> None:
+        """Insert a quest_events row (caller commits)."""
+        cursor.execute("""
+            INSERT INTO quest_events (quest_id, event_type, payload, created_at)
+            VALUES (?, ?, ?, ?)
+        """, (row["quest_id"], row["event_type"], row["payload"], row["created_at"]))
+    
+    def count_quest_events(self, quest_id: str) -> int:
+        """Number of events not yet folded into the quest checkpoint row."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM quest_events WHERE quest_id = ?", (quest_id,))
+            return cursor.fetchone()[0]
+    
+    def compact_quest(self, quest_id: str) -> bool:
+        """
+        Fold pending events into a full checkpoint row.
+        
+        Args:
+            quest_id: Quest identifier
+            
+        Returns:
+            True if the quest exists and was compacted
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")  # No appends between replay and rewrite
+            compacted = self._compact_quest(cursor, conn, quest_id)
+            conn.commit()
+            return compacted
+    
+    def _compact_quest(self, cursor: sqlite3.Cursor, conn: sqlite3.Connection, quest_id: str) -> bool:
+        quest_data = self._load_quest(conn, quest_id)
+        if quest_data is None:
+            return False
+        self._upsert_quest(cursor, self.quest_row(quest_data))
+        return True
+    
+    def _apply_quest_events(self, conn: sqlite3.Connection, quest_data: QuestExecutionData) -> None:
+        """Replay pending quest_events onto a loaded checkpoint."""
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT event_type, payload
+            FROM quest_events
+            WHERE quest_id = ?
+            ORDER BY event_id ASC
+        """, (quest_data.quest_id,))
+        
+        for row in cursor.fetchall():
+            payload = json.loads(row["payload"])
+            
+            if row["event_type"] == "step_finished":
+                for i, step in enumerate(quest_data.execution_stack):
+                    if step.key == payload["step_key"]:
+                        del quest_data.execution_stack[i]
+                        break
+            
+            elif row["event_type"] == "quest_finished":
+                quest_data.status = ExecutionStatus(payload["status"])
+                quest_data.end_time = payload.get("end_time")
+                quest_data.output_data = self._resolve_output_ref(quest_data, payload.get("output_ref"))
+    
+    @staticmethod
+    def _resolve_output_ref(quest_data: QuestExecutionData, ref: Optional[Dict[str, Any]]) -> Any:
+        """Turn an output reference into data using the already-loaded run_data."""
+        if not ref:
+            return None
+        if "output" in ref:
+            return ref["output"]
+        if "sinks" in ref:
+            return {key: QuestRepository._resolve_output_ref(quest_data, sink) for key, sink in ref["sinks"].items()}
+        
+        run = quest_data.run_data.get(ref["lord_name"], {}).get(ref["run_index"])
+        return run.get("output") if run else None
+    
     # ============================================================
     # LORD RUN TRACKING
     # ============================================================
@@ -324,7 +517,8 @@ class QuestRepository:
         start_time: Optional[float] = None,
         end_time: Optional[float] = None,
         attempt_number: int = 1,
-        max_attempts: int = 3
+        max_attempts: int = 3,
+        step_id: Optional[str] = None
     ) -> int:
         """
         Save Lord execution run to database.
@@ -342,46 +536,144 @@ class QuestRepository:
             end_time: End timestamp
             attempt_number: Current attempt (for retries)
             max_attempts: Maximum retry attempts
+            step_id: Graph step key, so resumed graph quests find completed steps
             
         Returns:
             run_id: Database ID of saved run
         """
-        now = datetime.now().isoformat()
+        row = self.lord_run_row(
+            quest_id=quest_id,
+            lord_name=lord_name,
+            tool_name=tool_name,
+            run_index=run_index,
+            status=status,
+            input_data=input_data,
+            output_data=output_data,
+            error_message=error_message,
+            start_time=start_time,
+            end_time=end_time,
+            attempt_number=attempt_number,
+            max_attempts=max_attempts,
+            step_id=step_id
+        )
         
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            self._insert_lord_run(cursor, row)
+            run_id = cursor.lastrowid
+            conn.commit()
+            return run_id
+    
+    def lord_run_row(
+        self,
+        quest_id: str,
+        lord_name: str,
+        tool_name: str,
+        run_index: int,
+        status: str,
+        input_data: Dict[str, Any],
+        output_data: Optional[Dict[str, Any]] = None,
+        error_message: Optional[str] = None,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+        attempt_number: int = 1,
+        max_attempts: int = 3,
+        step_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Serialize a Lord run into a row for lord_runs.
+        
+        Arguments match save_lord_run.
+        
+        Returns:
+            Column values keyed by column name
+        """
         # Calculate duration
         duration = None
         if start_time and end_time:
             duration = end_time - start_time
         
+        return {
+            "quest_id": quest_id,
+            "lord_name": lord_name,
+            "tool_name": tool_name,
+            "run_index": run_index,
+            "step_id": step_id,
+            "status": status,
+            "start_time": start_time,
+            "end_time": end_time,
+            "duration_seconds": duration,
+            "input_data": json.dumps(input_data),
+            "output_data": json.dumps(output_data) if output_data else None,
+            "error_message": error_message,
+            "attempt_number": attempt_number,
+            "max_attempts": max_attempts,
+            "created_at": datetime.now().isoformat(),
+        }
+    
+    def _insert_lord_run(self, cursor: sqlite3.Cursor, row: Dict[str, Any]) -> None:
+        """Insert a lord_runs row (caller commits)."""
+        cursor.execute("""
+            INSERT INTO lord_runs (
+                quest_id, lord_name, tool_name, run_index, step_id,
+                status, start_time, end_time, duration_seconds,
+                input_data, output_data, error_message,
+                attempt_number, max_attempts, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            row["quest_id"],
+            row["lord_name"],
+            row["tool_name"],
+            row["run_index"],
+            row["step_id"],
+            row["status"],
+            row["start_time"],
+            row["end_time"],
+            row["duration_seconds"],
+            row["input_data"],
+            row["output_data"],
+            row["error_message"],
+            row["attempt_number"],
+            row["max_attempts"],
+            row["created_at"]
+        ))
+    
+    def write_batch(self, operations: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        Apply many pre-serialized writes in a single transaction.
+        
+        Used by persistence_queue.WriteBehindQueue. Operations are applied
+        in order; a quest row superseded by a later row for the same quest
+        in this batch is skipped (the later checkpoint contains it).
+        
+        Args:
+            operations: ("quest", quest_row), ("lord_run", lord_run_row),
+                ("event", quest_event_row) or ("compact", {"quest_id": ...}) tuples
+        """
+        last_quest_row = {}
+        for index, (kind, row) in enumerate(operations):
+            if kind == "quest":
+                last_quest_row[row["quest_id"]] = index
+        
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO lord_runs (
-                    quest_id, lord_name, tool_name, run_index,
-                    status, start_time, end_time, duration_seconds,
-                    input_data, output_data, error_message,
-                    attempt_number, max_attempts, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                quest_id,
-                lord_name,
-                tool_name,
-                run_index,
-                status,
-                start_time,
-                end_time,
-                duration,
-                json.dumps(input_data),
-                json.dumps(output_data) if output_data else None,
-                error_message,
-                attempt_number,
-                max_attempts,
-                now
-            ))
-            
-            run_id = cursor.lastrowid
-            conn.commit()
-            return run_id
+            try:
+                for index, (kind, row) in enumerate(operations):
+                    if kind == "quest":
+                        if last_quest_row[row["quest_id"]] == index:
+                            self._upsert_quest(cursor, row)
+                    elif kind == "lord_run":
+                        self._insert_lord_run(cursor, row)
+                    elif kind == "event":
+                        self._insert_quest_event(cursor, row)
+                    elif kind == "compact":
+                        self._compact_quest(cursor, conn, row["quest_id"])
+                    else:
+                        raise ValueError(f"Unknown write operation: {kind}")
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
     
     def _load_run_data(self, quest_id: str, conn: sqlite3.Connection) -> Dict[str, Dict[int, Dict[str, Any]]]:
         """
@@ -396,7 +688,7 @@ class QuestRepository:
         """
         cursor = conn.cursor()
         cursor.execute("""
-            SELECT lord_name, run_index, 
+            SELECT lord_name, run_index, step_id,
                    input_data, output_data, error_message,
                    start_time, end_time, duration_seconds, status
             FROM lord_runs
@@ -422,6 +714,8 @@ class QuestRepository:
                 "duration": row["duration_seconds"],
                 "status": row["status"]
             }
+            if row["step_id"]:
+                run_data[lord_name][run_index]["step_id"] = row["step_id"]
         
         return run_data
     
@@ -499,6 +793,105 @@ class QuestRepository:
             
             return (run_data, execution_stack)
     
+    # ============================================================
+    # LORD RESULT CACHE (persistent tier)
+    # ============================================================
+    
+    def get_cached_result(self, cache_key: str) -> Optional[str]:
+        """
+        Load a cached Lord result.
+        
+        Args:
+            cache_key: Content hash of (lord, tool, arguments)
+            
+        Returns:
+            Result JSON text, or None if missing or expired
+        """
+        entry = self.get_cached_entry(cache_key)
+        return entry[0] if entry else None
+    
+    def get_cached_entry(self, cache_key: str) -> Optional[Tuple[str, Optional[float]]]:
+        """
+        Load a cached Lord result with its expiry.
+        
+        Args:
+            cache_key: Content hash of (lord, tool, arguments)
+            
+        Returns:
+            (result JSON text, expires_at) or None if missing or expired
+        """
+        now = time.time()
+        
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT result, expires_at
+                FROM lord_result_cache
+                WHERE cache_key = ?
+            """, (cache_key,))
+            
+            row = cursor.fetchone()
+            if not row:
+                return None
+            
+            if row["expires_at"] is not None and row["expires_at"] <= now:
+                cursor.execute("DELETE FROM lord_result_cache WHERE cache_key = ?", (cache_key,))
+                conn.commit()
+                return None
+            
+            return row["result"], row["expires_at"]
+    
+    def put_cached_result(
+        self,
+        cache_key: str,
+        lord_name: str,
+        tool_name: str,
+        result_json: str,
+        expires_at: Optional[float] = None
+    ) -> None:
+        """
+        Store a Lord result in the persistent cache.
+        
+        Args:
+            cache_key: Content hash of (lord, tool, arguments)
+            lord_name: Lord that produced the result
+            tool_name: Tool that produced the result
+            result_json: Result as JSON text
+            expires_at: Expiry timestamp (None = never expires)
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT OR REPLACE INTO lord_result_cache (
+                    cache_key, lord_name, tool_name, result, created_at, expires_at
+                ) VALUES (?, ?, ?, ?, ?, ?)
+            """, (cache_key, lord_name, tool_name, result_json, time.time(), expires_at))
+            conn.commit()
+    
+    def purge_cached_results(self, expired_only: bool = True) -> int:
+        """
+        Remove persistent cache entries.
+        
+        Args:
+            expired_only: Only remove expired entries (False clears the cache)
+            
+        Returns:
+            Number of entries removed
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            if expired_only:
+                cursor.execute("""
+                    DELETE FROM lord_result_cache
+                    WHERE expires_at IS NOT NULL AND expires_at <= ?
+                """, (time.time(),))
+            else:
+                cursor.execute("DELETE FROM lord_result_cache")
+            
+            removed = cursor.rowcount
+            conn.commit()
+            return removed
+    
     # ============================================================
     # QUERY INTERFACE
     # ============================================================
@@ -658,24 +1051,44 @@ class QuestRepository:
             "retry_config": {
                 "max_tries": step.retry_config.max_tries,
                 "wait_between_tries_ms": step.retry_config.wait_between_tries_ms,
-                "exponential_backoff": getattr(step.retry_config, "exponential_backoff", False)
-            }
+                "exponential_backoff": step.retry_config.exponential_backoff,
+                "backoff_multiplier": step.retry_config.backoff_multiplier,
+                "max_wait_ms": step.retry_config.max_wait_ms,
+                "jitter": step.retry_config.jitter,
+            },
+            "step_id": step.step_id,
+            "depends_on": list(step.depends_on),
+            "run_index": step.run_index,
+            "cache": step.cache,
+            "timeout_s": step.timeout_s,
+            "hedge": asdict(step.hedge) if step.hedge else None,
         }
     
     def _deserialize_lord_step(self, data: Dict[str, Any]) -> LordStep:
         """Convert dict to LordStep."""
-        from quest_executor import ErrorMode, LordRetryConfig
+        from quest_executor import ErrorMode, HedgePolicy, LordRetryConfig
         
+        retry = data["retry_config"]
         retry_config = LordRetryConfig(
-            max_tries=data["retry_config"]["max_tries"],
-            wait_between_tries_ms=data["retry_config"]["wait_between_tries_ms"]
+            max_tries=retry["max_tries"],
+            wait_between_tries_ms=retry["wait_between_tries_ms"],
+            exponential_backoff=retry.get("exponential_backoff", False),
+            backoff_multiplier=retry.get("backoff_multiplier", 2.0),
+            max_wait_ms=retry.get("max_wait_ms", 30000),
+            jitter=retry.get("jitter", "full")
         )
         
         return LordStep(
             lord_name=data["lord_name"],
             tool_name=data["tool_name"],
             on_error=ErrorMode(data["on_error"]),
-            retry_config=retry_config
+            retry_config=retry_config,
+            step_id=data.get("step_id"),
+            depends_on=data.get("depends_on", []),
+            run_index=data.get("run_index", 0),
+            cache=data.get("cache"),
+            timeout_s=data.get("timeout_s"),
+            hedge=HedgePolicy(**data["hedge"]) if data.get("hedge") else None
         )
 
 
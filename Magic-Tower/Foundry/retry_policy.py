@@ -0,0 +1,197 @@
+"""
+Retry Policy - Backoff, error classification and retry budgets for Lord calls
+
+QuestExecutor used to retry every exception after a fixed wait. During an
+incident that multiplies load on Lords that are already struggling, and it
+wastes attempts on errors that can never succeed.
+
+Components:
+- backoff_seconds(): fixed or exponential backoff with full/equal jitter
+- Error classification: malformed requests, unknown tools/Lords and 4xx
+  responses are final; transport errors, timeouts, 5xx and internal Lord
+  errors are retried
+- RetryBudget: token bucket per Lord; every first attempt deposits a fraction
+  of a token, every retry withdraws one, so retries stay a bounded share
+  of traffic no matter how many quests fail at once
+"""
+
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+
+import httpx
+
+from jsonrpc import INVALID_PARAMS, INVALID_REQUEST, METHOD_NOT_FOUND, PARSE_ERROR
+from lord_registry import UnknownLordError
+
+
+# JSON-RPC 2.0 codes that mean the request itself is wrong
+NON_RETRYABLE_RPC_CODES = frozenset({PARSE_ERROR, INVALID_REQUEST, METHOD_NOT_FOUND, INVALID_PARAMS})
+
+# HTTP statuses worth retrying even though they are 4xx
+RETRYABLE_HTTP_STATUSES = frozenset({408, 425, 429})
+
+
+class LordRpcError(Exception):
+    """JSON-RPC error object returned by a Lord"""
+
+    def __init__(self, lord_name: str, code: Optional[int], message: str, data: Any = None):
+        super().__init__(f"Lord {lord_name} error: {message}")
+        self.lord_name = lord_name
+        self.code = code
+        self.data = data
+
+
+def backoff_seconds(retry_config: Any, attempt: int, rng: Optional[random.Random] = None) -> float:
+    """
+    Delay before a retry.
+
+    Args:
+        retry_config: LordRetryConfig (wait_between_tries_ms, exponential_backoff,
+            backoff_multiplier, max_wait_ms, jitter)
+        attempt: Index of the attempt about to run (1 = first retry)
+        rng: Optional random source (tests)
+
+    Returns:
+        Seconds to wait. Fixed waits are deterministic (n8n semantics);
+        exponential waits are capped at max_wait_ms and jittered.
+    """
+    base_ms = retry_config.wait_between_tries_ms
+    if attempt <= 0 or base_ms <= 0:
+        return 0.0
+    if not getattr(retry_config, "exponential_backoff", False):
+        return base_ms / 1000
+
+    multiplier = getattr(retry_config, "backoff_multiplier", 2.0)
+    cap_ms = getattr(retry_config, "max_wait_ms", 30000)
+    wait_ms = min(cap_ms, base_ms * multiplier ** (attempt - 1))
+
+    jitter = getattr(retry_config, "jitter", "full")
+    rng = rng or random
+    if jitter == "full":
+        wait_ms = rng.uniform(0, wait_ms)
+    elif jitter == "equal":
+        wait_ms = wait_ms / 2 + rng.uniform(0, wait_ms / 2)
+    return wait_ms / 1000
+
+
+@dataclass
+class _Bucket:
+    tokens: float
+    updated_at: float
+    retries_allowed: int = 0
+    retries_denied: int = 0
+
+
+class RetryBudget:
+    """
+    Token-bucket retry budget per Lord.
+
+    Usage:
+        budget.record_request("sentinel")      # On each first attempt
+        if budget.try_acquire("sentinel"):      # Before each retry
+            ...retry...
+    """
+
+    def __init__(
+        self,
+        capacity: float = 10.0,
+        deposit_ratio: float = 0.2,
+        refill_per_second: float = 1.0,
+    ):
+        """
+        Initialize budget.
+
+        Args:
+            capacity: Maximum stored retry tokens (burst of retries)
+            deposit_ratio: Tokens earned per first attempt (0.2 = retries <= ~20% of traffic)
+            refill_per_second: Baseline tokens added per second so quiet Lords can still retry
+        """
+        self.capacity = max(1.0, capacity)
+        self.deposit_ratio = max(0.0, deposit_ratio)
+        self.refill_per_second = max(0.0, refill_per_second)
+        self._buckets: Dict[str, _Bucket] = {}
+
+    def record_request(self, lord_name: str):
+        bucket = self._refill(lord_name)
+        bucket.tokens = min(self.capacity, bucket.tokens + self.deposit_ratio)
+
+    def try_acquire(self, lord_name: str) -> bool:
+        """Withdraw one token for a retry (False = budget exhausted, don't retry)"""
+        bucket = self._refill(lord_name)
+        if bucket.tokens >= 1.0:
+            bucket.tokens -= 1.0
+            bucket.retries_allowed += 1
+            return True
+        bucket.retries_denied += 1
+        return False
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            lord_name: {
+                "tokens": round(self._refill(lord_name).tokens, 3),
+                "retries_allowed": bucket.retries_allowed,
+                "retries_denied": bucket.retries_denied,
+            }
+            for lord_name, bucket in list(self._buckets.items())
+        }
+
+    def _refill(self, lord_name: str) -> _Bucket:
+        now = time.monotonic()
+        bucket = self._buckets.get(lord_name)
+        if bucket is None:
+            bucket = self._buckets[lord_name] = _Bucket(tokens=self.capacity, updated_at=now)
+            return bucket
+        bucket.tokens = min(self.capacity, bucket.tokens + (now - bucket.updated_at) * self.refill_per_second)
+        bucket.updated_at = now
+        return bucket
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed Lord call is retried.
+
+    Args:
+        budget: RetryBudget shared across quests (None = unlimited retries)
+        non_retryable_codes: JSON-RPC error codes that are final
+        retryable_statuses: 4xx HTTP statuses that are still retried
+        rng: Optional random source for jitter
+    """
+
+    def __init__(
+        self,
+        budget: Optional[RetryBudget] = None,
+        non_retryable_codes: Iterable[int] = NON_RETRYABLE_RPC_CODES,
+        retryable_statuses: Iterable[int] = RETRYABLE_HTTP_STATUSES,
+        rng: Optional[random.Random] = None,
+    ):
+        self.budget = budget
+        self.non_retryable_codes = frozenset(non_retryable_codes)
+        self.retryable_statuses = frozenset(retryable_statuses)
+        self._rng = rng
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """Classify an attempt failure"""
+        if isinstance(error, UnknownLordError):
+            return False
+        if isinstance(error, LordRpcError):
+            return error.code not in self.non_retryable_codes
+        if isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            return status >= 500 or status in self.retryable_statuses
+        # Transport errors, timeouts and anything unrecognized keep the old behavior
+        return True
+
+    def backoff_seconds(self, retry_config: Any, attempt: int) -> float:
+        return backoff_seconds(retry_config, attempt, self._rng)
+
+    def record_request(self, lord_name: str):
+        if self.budget is not None:
+            self.budget.record_request(lord_name)
+
+    def allow_retry(self, lord_name: str) -> bool:
+        return self.budget is None or self.budget.try_acquire(lord_name)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"budget": self.budget.stats() if self.budget else None}
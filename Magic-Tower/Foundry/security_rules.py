@@ -0,0 +1,145 @@
+"""
+Security Rules - Declarative vulnerability rules compiled into one regex
+
+analyze_security used hand-written substring tests ("eval(" in code,
+"password" in code.lower(), ...): one scan per test plus a lowered copy of
+the whole input.
+
+Rules here are data (patterns, severity, type, message). A SecurityRuleSet
+compiles every distinct pattern of every rule into a single alternation
+with one named group per pattern, once, at import. Scanning a source is
+one finditer pass; line numbers come from counting newlines between
+consecutive matches, so no line index is built.
+
+Rule semantics (evaluated per source):
+- patterns: a match is a finding; its line is reported
+- requires: at least one of these must also match somewhere in the source
+- unless:   the rule is suppressed if any of these matches anywhere
+
+Limitation: alternatives are tried in order at each position, so when two
+patterns would match at the same position only the first one listed is
+recorded. Keep patterns distinct (the default rules are).
+
+Usage:
+    for path, findings in DEFAULT_RULESET.scan_files(sources):
+        ...
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+
+@dataclass(frozen=True)
+class SecurityRule:
+    """One vulnerability rule"""
+    type: str
+    severity: str
+    message: str
+    patterns: Tuple[str, ...]
+    requires: Tuple[str, ...] = ()
+    unless: Tuple[str, ...] = ()
+    ignore_case: bool = False
+
+
+DEFAULT_RULES: Tuple[SecurityRule, ...] = (
+    SecurityRule(
+        type="code-injection",
+        severity="critical",
+        message="Use of eval() or exec() detected - major security risk",
+        patterns=(r"eval\(", r"exec\("),
+    ),
+    SecurityRule(
+        type="weak-crypto",
+        severity="high",
+        message="Password handling without hashing detected",
+        patterns=(r"password",),
+        unless=(r"hash",),
+        ignore_case=True,
+    ),
+    SecurityRule(
+        type="sql-injection",
+        severity="critical",
+        message="Potential SQL injection vulnerability - use parameterized queries",
+        patterns=(r"execute\(",),
+        requires=(r"SQL", r"SELECT"),
+        unless=(r"\?",),
+    ),
+)
+
+
+class SecurityRuleSet:
+    """A set of rules compiled into one combined pattern"""
+
+    def __init__(self, rules: Iterable[SecurityRule] = DEFAULT_RULES):
+        self.rules = tuple(rules)
+
+        # (pattern, ignore_case) -> group name, shared by rules using the same pattern
+        groups: Dict[Tuple[str, bool], str] = {}
+        for rule in self.rules:
+            for pattern in rule.patterns + rule.requires + rule.unless:
+                groups.setdefault((pattern, rule.ignore_case), f"p{len(groups)}")
+
+        alternatives = [
+            f"(?P<{name}>{'(?i:' + pattern + ')' if ignore_case else pattern})"
+            for (pattern, ignore_case), name in groups.items()
+        ]
+        self.pattern = re.compile("|".join(alternatives)) if alternatives else None
+
+        # Per rule: group names for patterns / requires / unless
+        self._compiled: List[Tuple[SecurityRule, List[str], List[str], List[str]]] = [
+            (
+                rule,
+                [groups[(pattern, rule.ignore_case)] for pattern in rule.patterns],
+                [groups[(pattern, rule.ignore_case)] for pattern in rule.requires],
+                [groups[(pattern, rule.ignore_case)] for pattern in rule.unless],
+            )
+            for rule in self.rules
+        ]
+
+    def scan(self, code: str) -> List[Dict[str, Any]]:
+        """
+        Scan one source.
+
+        Returns:
+            One finding per triggered rule:
+            {"severity", "type", "message", "line" (first), "lines"}
+        """
+        if self.pattern is None:
+            return []
+
+        # group name -> lines it matched on (in order)
+        hits: Dict[str, List[int]] = {}
+        line = 1
+        position = 0
+        for match in self.pattern.finditer(code):
+            start = match.start()
+            line += code.count("\n", position, start)
+            position = start
+            hits.setdefault(match.lastgroup, []).append(line)
+
+        findings = []
+        for rule, patterns, requires, unless in self._compiled:
+            if any(name in hits for name in unless):
+                continue
+            if requires and not any(name in hits for name in requires):
+                continue
+            lines = sorted({line for name in patterns for line in hits.get(name, ())})
+            if lines:
+                findings.append({
+                    "severity": rule.severity,
+                    "type": rule.type,
+                    "message": rule.message,
+                    "line": lines[0],
+                    "lines": lines,
+                })
+        return findings
+
+    def scan_files(self, sources: Iterable[Tuple[str, str]]) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """Scan (path, code) pairs lazily, one source at a time"""
+        for path, code in sources:
+            yield path, self.scan(code)
+
+
+# Compiled once at import
+DEFAULT_RULESET = SecurityRuleSet(DEFAULT_RULES)
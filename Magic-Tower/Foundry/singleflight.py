@@ -0,0 +1,76 @@
+"""
+Single Flight - Coalesce identical concurrent calls into one execution
+
+During bursts many clients send the same quest at the same moment and the
+gateway used to forward every copy. With SingleFlight the first caller for
+a key runs the call; callers arriving while it is in flight wait for that
+same call and receive its result, or its exception.
+
+The call runs in its own task and waiters are shielded from it, so a
+caller that disconnects (is cancelled) does not cancel the call for the
+others. Nothing is kept once the call finishes - pair with a cache for
+reuse over time.
+
+Usage:
+    flight = SingleFlight()
+    result = await flight.do(key, lambda: fetch(...))
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class SingleFlight:
+    """In-flight call deduplication by key"""
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Task] = {}
+
+        # Metrics
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run func once for all concurrent callers with the same key.
+
+        Args:
+            key: Identity of the call (callers with equal keys share it)
+            func: Coroutine function performing the call
+
+        Returns:
+            func's result (exceptions are raised in every waiting caller)
+        """
+        self.calls += 1
+        task = self._calls.get(key)
+        if task is None:
+            self.executions += 1
+            task = self._calls[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "coalesced_rate": round(self.coalesced / self.calls, 4) if self.calls else 0.0,
+            "errors": self.errors,
+            "in_flight": len(self._calls),
+        }
+
+    def _finish(self, key: str, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if task.cancelled():
+            self.errors += 1
+        elif task.exception() is not None:
+            # Retrieved here so an error nobody waits for anymore is not logged as unhandled
+            self.errors += 1
@@ -6,7 +6,15 @@ Tests:
 2. Lord listing
 3. Quest routing to Lord Architect
 4. Quest routing to Lord Scribe
-5. Error handling (unknown quest type, Lord down)
+5. Explicit Lord routing
+6. Error handling (unknown quest type, Lord down)
+7. Proxy fast path (in-process, pooled client + streamed result)
+8. Response cache (in-process, ETag / Cache-Control / admin purge)
+9. Request coalescing (in-process, concurrent identical quests)
+10. Capability discovery (in-process, tools/list routing index)
+11. Health probes and runtime registration (in-process)
+12. Single flight coalescing (in-process)
+13. Health monitor thresholds (in-process)
 """
 
 import httpx
@@ -182,6 +190,452 @@ async def test_error_handling():
             print(f"  Detail: {e.response.json()}")
 
 
+async def test_proxy_fast_path():
+    """Test pooled, streamed proxying in-process (no servers needed)"""
+    print("\n" + "="*70)
+    print("TEST 7: Proxy Fast Path (in-process)")
+    print("="*70)
+    
+    import king_gateway
+    from lord_client import LordClientPool
+    
+    chunks = [b'{"jsonrpc":"2.0",', b'"id":1,"res', b'ult":{"text":"}{","n":[1,2', b',3]}', b'}', b'\n']
+    
+    async def lord_body():
+        for chunk in chunks:
+            yield chunk
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        if json.loads(request.content)["params"]["name"] == "write_docs":
+            return httpx.Response(200, content=lord_body(), headers={"Content-Type": "application/json"})
+        return httpx.Response(200, json={"jsonrpc": "2.0", "id": 1, "error": {"code": -32601, "message": "Tool not found"}})
+    
+    king_gateway._client_pool = LordClientPool(transport=httpx.MockTransport(handler))
+    king_gateway._response_cache.clear()
+    gateway = httpx.ASGITransport(app=king_gateway.app)
+    async with httpx.AsyncClient(transport=gateway, base_url="http://king") as client:
+        response = await client.post("/quest", json={"quest_type": "write_docs", "quest_data": {}})
+        assert response.status_code == 200
+        assert response.json() == {
+            "lord": "scribe", "quest_type": "write_docs",
+            "result": {"text": "}{", "n": [1, 2, 3]}, "status": "success",
+        }
+        print(f"✓ Streamed result: {response.content!r}")
+        
+        response = await client.post("/quest", json={"quest_type": "create_summary", "quest_data": {}})
+        assert response.status_code == 500
+        print(f"✓ Lord error detected: {response.json()['detail']}")
+        
+        endpoint = king_gateway._client_pool.stats()["endpoints"]["http://localhost:8002"]
+        assert endpoint["requests"] == 2
+        print(f"✓ One pooled client served both quests: {endpoint['requests']} requests")
+    await king_gateway._close_client_pool()
+    
+    # "error" members after the result are never passed through as success
+    error = b'"error":{"code":-32603,"message":"Internal error","data":{"a":1}}'
+    bodies = {
+        "design_system": b'{"jsonrpc":"2.0","id":1,"result":null,' + error + b'}',
+        "analyze_architecture": b'{"jsonrpc":"2.0","id":1,"result":{"n":[1]},' + error + b'}\n',
+        "generate_code": b'{"jsonrpc":"2.0","id":1,"result":"' + b"x" * 200000 + b'",' + error + b'}',
+    }
+    
+    def error_handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=bodies[json.loads(request.content)["params"]["name"]])
+    
+    king_gateway._client_pool = LordClientPool(transport=httpx.MockTransport(error_handler))
+    king_gateway.LORDS["forge"] = {"url": "http://localhost:8003/mcp", "capabilities": ["generate_code"]}
+    king_gateway._rebuild_capability_index()
+    gateway = httpx.ASGITransport(app=king_gateway.app)
+    try:
+        async with httpx.AsyncClient(transport=gateway, base_url="http://king") as client:
+            for quest_type in ("design_system", "analyze_architecture"):
+                response = await client.post("/quest", json={"quest_type": quest_type, "quest_data": {}})
+                assert response.status_code == 500 and "Internal error" in response.json()["detail"]
+            print("✓ Error after result detected (null and non-null result)")
+            
+            # Large bodies are streamed; an error found in the tail aborts the stream
+            try:
+                response = await client.post("/quest", json={"quest_type": "generate_code", "quest_data": {}})
+                aborted = response.status_code != 200 or not response.content.endswith(b'"success"}')
+            except RuntimeError:
+                aborted = True
+            assert aborted
+            print("✓ Streamed response with an error after the result aborted")
+    finally:
+        del king_gateway.LORDS["forge"]
+        king_gateway._rebuild_capability_index()
+        await king_gateway._close_client_pool()
+
+
+async def test_response_cache():
+    """Test the gateway response cache in-process (no servers needed)"""
+    print("\n" + "="*70)
+    print("TEST 8: Response Cache (in-process)")
+    print("="*70)
+    
+    import king_gateway
+    from lord_client import LordClientPool
+    
+    calls = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        rpc = json.loads(request.content)
+        calls.append(rpc["params"]["name"])
+        return httpx.Response(200, json={"jsonrpc": "2.0", "id": rpc["id"], "result": {"call": len(calls)}})
+    
+    king_gateway._client_pool = LordClientPool(transport=httpx.MockTransport(handler))
+    king_gateway._response_cache.clear()
+    hits_before = king_gateway._response_cache.hits
+    gateway = httpx.ASGITransport(app=king_gateway.app)
+    async with httpx.AsyncClient(transport=gateway, base_url="http://king") as client:
+        quest = {"quest_type": "design_system", "quest_data": {"b": 2, "a": 1}}
+        first = await client.post("/quest", json=quest)
+        assert first.headers["X-Cache"] == "MISS"
+        assert first.headers["Cache-Control"] == "max-age=300"
+        
+        # Same quest_data in another key order is the same cache entry
+        second = await client.post("/quest", json={"quest_type": "design_system", "quest_data": {"a": 1, "b": 2}})
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.content == first.content and len(calls) == 1
+        print(f"✓ Second quest served from cache: {second.json()['result']}")
+        
+        etag = first.headers["ETag"]
+        not_modified = await client.post("/quest", json=quest, headers={"If-None-Match": etag})
+        assert not_modified.status_code == 304 and not_modified.content == b""
+        print(f"✓ If-None-Match {etag} -> 304")
+        
+        refreshed = await client.post("/quest", json=quest, headers={"Cache-Control": "no-cache"})
+        assert refreshed.headers["X-Cache"] == "MISS" and refreshed.json()["result"] == {"call": 2}
+        assert refreshed.headers["ETag"] != etag
+        print("✓ Cache-Control: no-cache refreshed the entry")
+        
+        bypass = await client.post("/quest", json={"quest_type": "write_docs", "quest_data": {}},
+                                   headers={"Cache-Control": "no-store"})
+        assert bypass.headers["X-Cache"] == "BYPASS"
+        
+        king_gateway.LORDS["forge"] = {"url": "http://localhost:8003/mcp", "capabilities": ["generate_code"]}
+        king_gateway._rebuild_capability_index()
+        try:
+            uncached = await client.post("/quest", json={"quest_type": "generate_code", "quest_data": {}})
+        finally:
+            del king_gateway.LORDS["forge"]
+            king_gateway._rebuild_capability_index()
+        assert "X-Cache" not in uncached.headers and uncached.headers["Cache-Control"] == "no-store"
+        assert len(calls) == 4
+        print("✓ no-store and non-idempotent quest types are not cached")
+        
+        info = (await client.get("/admin/cache")).json()
+        assert [entry["quest_type"] for entry in info["entries"]] == ["design_system"]
+        assert info["stats"]["hits"] - hits_before == 2  # Cached response and the 304
+        print(f"✓ Admin inspect: {info['stats']}")
+        
+        key = info["entries"][0]["key"]
+        assert (await client.delete(f"/admin/cache/{key}")).json() == {"purged": 1}
+        assert (await client.delete(f"/admin/cache/{key}")).status_code == 404
+        await client.post("/quest", json=quest)
+        assert (await client.delete("/admin/cache", params={"lord": "architect"})).json() == {"purged": 1}
+        print("✓ Admin purge by key and by Lord")
+    await king_gateway._close_client_pool()
+
+
+async def test_request_coalescing():
+    """Test concurrent identical quests share one Lord call (in-process)"""
+    print("\n" + "="*70)
+    print("TEST 9: Request Coalescing (in-process)")
+    print("="*70)
+    
+    import king_gateway
+    from lord_client import LordClientPool
+    
+    calls = []
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        rpc = json.loads(request.content)
+        calls.append(rpc["params"]["arguments"])
+        await asyncio.sleep(0.05)
+        if rpc["params"]["arguments"].get("fail"):
+            return httpx.Response(503)
+        return httpx.Response(200, json={"jsonrpc": "2.0", "id": rpc["id"], "result": {"call": len(calls)}})
+    
+    king_gateway._client_pool = LordClientPool(transport=httpx.MockTransport(handler))
+    king_gateway._response_cache.clear()
+    before = king_gateway._in_flight.stats()
+    gateway = httpx.ASGITransport(app=king_gateway.app)
+    async with httpx.AsyncClient(transport=gateway, base_url="http://king") as client:
+        quest = {"quest_type": "analyze_architecture", "quest_data": {"system": "castle"}}
+        responses = await asyncio.gather(*[client.post("/quest", json=quest) for _ in range(10)])
+        assert len(calls) == 1
+        assert {response.json()["result"]["call"] for response in responses} == {1}
+        print(f"✓ 10 concurrent quests -> {len(calls)} Lord call")
+        
+        failing = {"quest_type": "analyze_architecture", "quest_data": {"fail": True}}
+        responses = await asyncio.gather(*[client.post("/quest", json=failing) for _ in range(4)])
+        assert len(calls) == 2
+        assert [response.status_code for response in responses] == [502] * 4
+        print("✓ Lord error propagated to every coalesced quest")
+        
+        stats = (await client.get("/stats")).json()["coalescing"]
+        assert stats["coalesced"] - before["coalesced"] == 12
+        assert stats["executions"] - before["executions"] == 2 and stats["in_flight"] == 0
+        print(f"✓ Coalescing stats: {stats}")
+    await king_gateway._close_client_pool()
+
+
+async def test_capability_discovery():
+    """Test routing from tools/list discovery (in-process)"""
+    print("\n" + "="*70)
+    print("TEST 10: Capability Discovery (in-process)")
+    print("="*70)
+    
+    import copy
+    import king_gateway
+    from lord_client import LordClientPool
+    
+    lord_tools = {8001: ["design_system", "analyze_architecture", "review_design"]}
+    calls = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        rpc = json.loads(request.content)
+        calls.append(rpc["method"])
+        if request.url.port not in lord_tools:
+            raise httpx.ConnectError("Connection refused", request=request)
+        if rpc["method"] == "tools/list":
+            tools = [{"name": name} for name in lord_tools[request.url.port]]
+            return httpx.Response(200, json={"jsonrpc": "2.0", "id": rpc["id"], "result": {"tools": tools}})
+        return httpx.Response(200, json={"jsonrpc": "2.0", "id": rpc["id"], "result": {"ok": True}})
+    
+    saved_lords = copy.deepcopy(king_gateway.LORDS)
+    king_gateway._client_pool = LordClientPool(transport=httpx.MockTransport(handler))
+    gateway = httpx.ASGITransport(app=king_gateway.app)
+    try:
+        async with httpx.AsyncClient(transport=gateway, base_url="http://king") as client:
+            refreshed = (await client.post("/admin/capabilities/refresh")).json()
+            assert refreshed["lords"] == {"architect": True, "scribe": False}
+            index = (await client.get("/capabilities")).json()["quest_types"]
+            assert index["review_design"] == ["architect"]
+            assert index["write_docs"] == ["scribe"]  # Unreachable Lord keeps its configured tools
+            print(f"✓ Discovered index: {sorted(index)}")
+            
+            response = await client.post("/quest", json={"quest_type": "review_design", "quest_data": {}})
+            assert response.status_code == 200 and response.json()["lord"] == "architect"
+            print("✓ Discovered tool routed to Lord Architect")
+            
+            calls.clear()
+            unknown = await client.post("/quest", json={"quest_type": "index_knowledge", "quest_data": {}})
+            wrong_lord = await client.post(
+                "/quest", json={"quest_type": "review_design", "quest_data": {}, "lord_name": "scribe"},
+            )
+            assert unknown.status_code == 404 and wrong_lord.status_code == 404
+            assert calls == []
+            print(f"✓ Unknown tools rejected without an upstream call: {wrong_lord.json()['detail']}")
+    finally:
+        king_gateway.LORDS.clear()
+        king_gateway.LORDS.update(saved_lords)
+        king_gateway._rebuild_capability_index()
+        await king_gateway._close_client_pool()
+
+
+async def test_health_and_registration():
+    """Test health-based routing and runtime Lord registration (in-process)"""
+    print("\n" + "="*70)
+    print("TEST 11: Health Probes and Lord Registration (in-process)")
+    print("="*70)
+    
+    import copy
+    import king_gateway
+    from lord_client import LordClientPool
+    
+    down = set()
+    quest_calls = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.port in down:
+            raise httpx.ConnectError("Connection refused", request=request)
+        if request.method == "GET":
+            return httpx.Response(200, json={"status": "healthy"})
+        rpc = json.loads(request.content)
+        if rpc["method"] == "tools/list":
+            tools = [{"name": "design_system"}] if request.url.port in (8001, 8011) else [{"name": "write_docs"}]
+            return httpx.Response(200, json={"jsonrpc": "2.0", "id": rpc["id"], "result": {"tools": tools}})
+        quest_calls.append(request.url.port)
+        return httpx.Response(200, json={"jsonrpc": "2.0", "id": rpc["id"], "result": {"port": request.url.port}})
+    
+    saved_lords = copy.deepcopy(king_gateway.LORDS)
+    king_gateway._client_pool = LordClientPool(transport=httpx.MockTransport(handler))
+    king_gateway._response_cache.clear()
+    gateway = httpx.ASGITransport(app=king_gateway.app)
+    quest = {"quest_type": "design_system", "quest_data": {}}
+    try:
+        async with httpx.AsyncClient(transport=gateway, base_url="http://king") as client:
+            registered = (await client.post("/admin/lords", json={
+                "name": "architect_2", "url": "http://localhost:8011/mcp", "description": "Second architect",
+            })).json()
+            assert registered["discovered"] and registered["capabilities"] == ["design_system"]
+            assert (await client.get("/capabilities")).json()["quest_types"]["design_system"] == ["architect", "architect_2"]
+            print(f"✓ Registered architect_2: {registered}")
+            
+            down.add(8001)
+            for _ in range(king_gateway.UNHEALTHY_THRESHOLD):
+                probes = (await client.post("/admin/health/check")).json()["probes"]
+            assert probes["architect"] is False
+            assert (await client.get("/lords")).json()["lords"]["architect"]["healthy"] is False
+            
+            response = await client.post("/quest", json=quest)
+            assert response.json()["lord"] == "architect_2" and quest_calls == [8011]
+            explicit = await client.post("/quest", json={**quest, "lord_name": "architect"})
+            assert explicit.status_code == 503 and quest_calls == [8011]
+            print(f"✓ Unhealthy architect skipped: {explicit.json()['detail']}")
+            
+            down.clear()
+            for _ in range(king_gateway.HEALTHY_THRESHOLD):
+                await client.post("/admin/health/check")
+            assert (await client.post("/quest", json={**quest, "quest_data": {"v": 2}})).json()["lord"] == "architect"
+            print("✓ Recovered architect routed to again")
+            
+            deregistered = (await client.delete("/admin/lords/architect_2")).json()
+            assert deregistered["cache_purged"] == 1
+            assert (await client.delete("/admin/lords/architect_2")).status_code == 404
+            assert "architect_2" not in (await client.get("/admin/health")).json()["lords"]
+            
+            down.add(8001)
+            for _ in range(king_gateway.UNHEALTHY_THRESHOLD):
+                await client.post("/admin/health/check")
+            response = await client.post("/quest", json={**quest, "quest_data": {"v": 3}})
+            assert response.status_code == 503 and "Retry-After" in response.headers
+            print(f"✓ Deregistered architect_2; no healthy Lord left: {response.json()['detail']}")
+    finally:
+        for name in list(king_gateway.LORDS):
+            king_gateway._health.remove(name)
+        king_gateway.LORDS.clear()
+        king_gateway.LORDS.update(saved_lords)
+        for name in king_gateway.LORDS:
+            king_gateway._health.add(name)
+        king_gateway._rebuild_capability_index()
+        king_gateway._response_cache.clear()
+        await king_gateway._close_client_pool()
+
+
+async def test_singleflight():
+    """Test identical concurrent calls share one execution, results and errors"""
+    print("\n" + "="*70)
+    print("TEST 12: Single Flight (in-process)")
+    print("="*70)
+    
+    from singleflight import SingleFlight
+    
+    flight = SingleFlight()
+    executions = []
+    
+    async def fetch(value):
+        executions.append(value)
+        await asyncio.sleep(0.02)
+        if value == "boom":
+            raise RuntimeError("Lord down")
+        return {"value": value}
+    
+    results = await asyncio.gather(
+        *[flight.do("a", lambda: fetch("a")) for _ in range(5)],
+        flight.do("b", lambda: fetch("b")),
+    )
+    assert results[:5] == [{"value": "a"}] * 5 and results[5] == {"value": "b"}
+    assert all(result is results[0] for result in results[:5])
+    assert executions == ["a", "b"]
+    print("✓ 5 concurrent calls for one key -> 1 execution")
+    
+    # Errors reach every waiter
+    errors = await asyncio.gather(
+        *[flight.do("a", lambda: fetch("boom")) for _ in range(3)],
+        return_exceptions=True,
+    )
+    assert [str(error) for error in errors] == ["Lord down"] * 3
+    print("✓ Error raised in every waiter")
+    
+    # A cancelled caller does not cancel the call for the others
+    first = asyncio.create_task(flight.do("c", lambda: fetch("c")))
+    second = asyncio.create_task(flight.do("c", lambda: fetch("c")))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == {"value": "c"}
+    print("✓ Cancelled caller left the shared call running")
+    
+    # Nothing is kept once a call finishes
+    assert await flight.do("a", lambda: fetch("a2")) == {"value": "a2"}
+    assert flight.stats() == {
+        "calls": 12, "executions": 5, "coalesced": 7,
+        "coalesced_rate": round(7 / 12, 4), "errors": 1, "in_flight": 0,
+    }
+    print(f"✓ Stats: {flight.stats()}")
+
+
+async def test_health_monitor():
+    """Test health verdicts flip only after consecutive failures/successes"""
+    print("\n" + "="*70)
+    print("TEST 13: Health Monitor Thresholds (in-process)")
+    print("="*70)
+    
+    from health_monitor import HealthMonitor
+    
+    down = set()
+    changes = []
+    probed = []
+    
+    async def probe(name):
+        probed.append(name)
+        if name == "slow":
+            await asyncio.sleep(1)
+        if name in down:
+            raise httpx.ConnectError("Connection refused")
+    
+    monitor = HealthMonitor(
+        probe, interval=0, timeout=0.05, unhealthy_threshold=2, healthy_threshold=2,
+        on_state_change=lambda name, healthy: changes.append((name, healthy)),
+    )
+    for name in ("architect", "scribe", "slow"):
+        monitor.add(name)
+    assert monitor.healthy(["architect", "scribe", "slow", "unknown"]) == ["architect", "scribe", "slow", "unknown"]
+    
+    down.add("scribe")
+    assert await monitor.check_all() == {"architect": True, "scribe": False, "slow": False}
+    assert monitor.is_healthy("scribe")  # One failure is below the threshold
+    await monitor.check_all()
+    assert monitor.healthy(["architect", "scribe", "slow"]) == ["architect"]
+    assert monitor.stats()["slow"]["last_error"] == "TimeoutError"
+    assert monitor.stats()["scribe"]["last_error"].startswith("ConnectError")
+    print("✓ Unhealthy after 2 consecutive failures (refused and timed out)")
+    
+    down.clear()
+    await monitor.check("scribe")
+    assert not monitor.is_healthy("scribe")
+    await monitor.check("scribe")
+    assert monitor.is_healthy("scribe")
+    assert changes == [("scribe", False), ("slow", False), ("scribe", True)]
+    print(f"✓ Healthy again after 2 consecutive successes: {changes}")
+    
+    # Removed targets are no longer tracked (late results are ignored)
+    assert monitor.remove("slow") and not monitor.remove("slow")
+    monitor.record("slow", False)
+    assert "slow" not in monitor.stats() and monitor.is_healthy("slow")
+    
+    # interval <= 0 disables the background loop
+    probed.clear()
+    await monitor.start()
+    await asyncio.sleep(0.02)
+    assert probed == []
+    
+    # The background loop probes every target; stop() ends it and is idempotent
+    looping = HealthMonitor(probe, interval=0.01, timeout=0.05)
+    looping.add("architect")
+    await looping.start()
+    await asyncio.sleep(0.05)
+    await looping.stop()
+    await looping.stop()
+    assert probed and set(probed) == {"architect"}
+    probes = looping.stats()["architect"]["probes"]
+    await asyncio.sleep(0.03)
+    assert looping.stats()["architect"]["probes"] == probes
+    print(f"✓ Background loop ran {probes} probe rounds and stopped")
+
+
 async def run_all_tests():
     """Run all tests in sequence"""
     print("\n" + "="*70)
@@ -200,6 +654,13 @@ async def run_all_tests():
     await test_scribe_quest()
     await test_explicit_lord_routing()
     await test_error_handling()
+    await test_proxy_fast_path()
+    await test_response_cache()
+    await test_request_coalescing()
+    await test_capability_discovery()
+    await test_health_and_registration()
+    await test_singleflight()
+    await test_health_monitor()
     
     print("\n" + "="*70)
     print("TEST SUITE COMPLETE")
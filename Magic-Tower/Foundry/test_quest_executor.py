@@ -20,7 +20,38 @@ from quest_executor import (
     LordRetryConfig,
     ExecutionHooks,
     build_microservice_design_quest,
+    build_parallel_review_quest,
+    HedgePolicy,
 )
+from lord_cache import LordResultCache, LRUTTLCache, canonical_key
+from lord_client import LordClientPool, LordClientConfig
+from lord_registry import LordRegistry
+from retry_policy import RetryBudget, RetryPolicy, backoff_seconds
+from circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState, LordCircuitBreakers
+
+
+def mock_lord_transport(calls=None, fail_tools=(), delay=0.0):
+    """In-memory Lord fleet: echoes tool name and arguments as JSON-RPC results"""
+    async def handler(request: httpx.Request) -> httpx.Response:
+        import json
+        body = json.loads(request.content)
+        name = body["params"]["name"]
+        if calls is not None:
+            calls.append((request.url.port, name))
+        if delay:
+            await asyncio.sleep(delay)
+        if name in fail_tools:
+            return httpx.Response(200, json={
+                "jsonrpc": "2.0",
+                "error": {"code": -32603, "message": f"{name} failed"},
+                "id": body["id"],
+            })
+        return httpx.Response(200, json={
+            "jsonrpc": "2.0",
+            "result": {"tool": name, "received": body["params"]["arguments"]},
+            "id": body["id"],
+        })
+    return httpx.MockTransport(handler)
 
 
 @pytest.fixture
@@ -324,5 +355,1316 @@ async def test_multiple_runs_same_lord():
     assert len(result.run_data["scribe"]) == 1
 
 
+@pytest.mark.asyncio
+async def test_client_pool_reused_across_steps():
+    """Test all steps share one pooled client per Lord"""
+    calls = []
+    pool = LordClientPool(LordClientConfig(max_connections=4), transport=mock_lord_transport(calls))
+    quest = QuestExecutionData(
+        quest_id="pool-test",
+        quest_type="test",
+        input_data={"requirements": "pooled"},
+        execution_stack=[
+            LordStep(lord_name="architect", tool_name="design_system", run_index=0),
+            LordStep(lord_name="architect", tool_name="design_system", run_index=1),
+            LordStep(lord_name="scribe", tool_name="write_docs"),
+        ],
+    )
+    
+    async with QuestExecutor(client_pool=pool) as executor:
+        result = await executor.execute_quest(quest)
+        stats = executor.pool_stats()
+    
+    assert result.status == ExecutionStatus.COMPLETED
+    assert [port for port, _ in calls] == [8001, 8001, 8002]
+    assert len(stats["endpoints"]) == 2
+    assert stats["endpoints"]["http://localhost:8001"]["requests"] == 2
+    assert stats["endpoints"]["http://localhost:8001"]["in_flight"] == 0
+    
+    # Injected pool is owned by the caller
+    assert not pool.closed
+    await pool.aclose()
+    assert pool.closed
+
+
+@pytest.mark.asyncio
+async def test_client_pool_closed_with_executor():
+    """Test executor-owned pool is released on aclose"""
+    executor = QuestExecutor(client_config=LordClientConfig(max_connections=0, max_keepalive_connections=50))
+    assert executor.client_pool.config.max_connections == 1
+    assert executor.client_pool.config.max_keepalive_connections == 1
+    
+    await executor.aclose()
+    assert executor.client_pool.closed
+    with pytest.raises(RuntimeError):
+        executor.client_pool.client_for("architect", "http://localhost:8001")
+
+
+@pytest.mark.asyncio
+async def test_step_timeout_overrides_only_read_timeout():
+    """Test the per-step timeout keeps the pool's connect/write/pool timeouts"""
+    import json
+    timeouts = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions["timeout"])
+        body = json.loads(request.content)
+        return httpx.Response(200, json={"jsonrpc": "2.0", "result": {"ok": True}, "id": body["id"]})
+    
+    pool = LordClientPool(LordClientConfig(timeout=20.0, connect_timeout=2.0), transport=httpx.MockTransport(handler))
+    quest = QuestExecutionData(
+        quest_id="timeouts",
+        quest_type="test",
+        execution_stack=[LordStep(lord_name="architect", tool_name="design_system", timeout_s=90)],
+    )
+    
+    async with QuestExecutor(client_pool=pool) as executor:
+        await executor.execute_quest(quest)
+    await pool.aclose()
+    
+    assert timeouts == [{"connect": 2.0, "read": 90, "write": 20.0, "pool": 20.0}]
+@pytest.mark.asyncio
+async def test_graph_fan_out_runs_in_parallel():
+    """Test independent graph steps run concurrently and joins merge outputs"""
+    events = []
+    hooks = ExecutionHooks()
+    hooks.register("lord_invoked", lambda step, quest: events.append(("invoked", step.key)))
+    hooks.register("lord_completed", lambda step, quest: events.append(("completed", step.key)))
+    hooks.register("quest_finished", lambda quest: events.append(("finished", quest.quest_id)))
+    
+    pool = LordClientPool(transport=mock_lord_transport(delay=0.2))
+    quest = build_parallel_review_quest("Build auth API")
+    
+    async with QuestExecutor(hooks=hooks, client_pool=pool) as executor:
+        start = asyncio.get_running_loop().time()
+        result = await executor.execute_quest(quest)
+        elapsed = asyncio.get_running_loop().time() - start
+    await pool.aclose()
+    
+    assert result.status == ExecutionStatus.COMPLETED
+    assert result.execution_stack == []
+    
+    # 4 levels of 0.2s each - the two Sentinel steps overlap
+    assert elapsed < 0.2 * 5
+    
+    # Parallel Sentinel steps keep separate run_data entries
+    sentinel_runs = result.run_data["sentinel"]
+    assert sorted(run["step_id"] for run in sentinel_runs.values()) == ["quality", "security"]
+    
+    # Join step received both upstream outputs merged
+    docs_input = result.run_data["scribe"][0]["data"]["received"]
+    assert docs_input["tool"] in ("analyze_security", "check_quality")
+    assert result.output_data == result.run_data["scribe"][0]["data"]
+    
+    # Every step invoked before completing, quest_finished emitted exactly once
+    for key in ("design", "code", "security", "quality", "docs"):
+        assert events.index(("invoked", key)) < events.index(("completed", key))
+    assert events.count(("finished", "q-002")) == 1
+    assert events[-1] == ("finished", "q-002")
+
+
+@pytest.mark.asyncio
+async def test_graph_respects_max_concurrency():
+    """Test graph mode never exceeds the concurrency limit"""
+    pool = LordClientPool(transport=mock_lord_transport(delay=0.05))
+    quest = QuestExecutionData(
+        quest_id="graph-limit",
+        quest_type="test",
+        execution_stack=[LordStep(lord_name="architect", tool_name="design_system", step_id="root")] + [
+            LordStep(lord_name="sentinel", tool_name="check_quality", step_id=f"leaf-{i}", depends_on=["root"])
+            for i in range(6)
+        ],
+    )
+    
+    executor = QuestExecutor(client_pool=pool)
+    result = await executor.execute_quest_graph(quest, max_concurrency=2)
+    
+    assert result.status == ExecutionStatus.COMPLETED
+    assert len(result.run_data["sentinel"]) == 6
+    assert set(result.output_data) == {f"leaf-{i}" for i in range(6)}
+    assert pool.stats()["endpoints"]["http://localhost:8004"]["max_in_flight"] == 2
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_graph_stop_error_and_continue():
+    """Test graph error modes: CONTINUE keeps going, STOP fails the quest"""
+    pool = LordClientPool(transport=mock_lord_transport(fail_tools=("check_quality",)))
+    executor = QuestExecutor(client_pool=pool)
+    
+    quest = build_parallel_review_quest("Build auth API")
+    quest.execution_stack[3].on_error = ErrorMode.CONTINUE
+    result = await executor.execute_quest(quest)
+    assert result.status == ExecutionStatus.COMPLETED
+    assert "scribe" in result.run_data
+    
+    quest = build_parallel_review_quest("Build auth API")
+    result = await executor.execute_quest(quest)
+    assert result.status == ExecutionStatus.ERROR
+    assert result.error["step"] == "quality"
+    assert "scribe" not in result.run_data
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_stop_error_run_data_matches_across_modes():
+    """Test a STOP failure is recorded in run_data the same way in sequential and graph mode"""
+    pool = LordClientPool(transport=mock_lord_transport(fail_tools=("check_quality",)))
+    executor = QuestExecutor(client_pool=pool)
+    
+    def quest(graph):
+        steps = [
+            LordStep(lord_name="architect", tool_name="design_system"),
+            LordStep(lord_name="sentinel", tool_name="check_quality", retry_config=LordRetryConfig(max_tries=1)),
+            LordStep(lord_name="scribe", tool_name="write_docs"),
+        ]
+        if graph:
+            for index, step in enumerate(steps):
+                step.step_id = step.tool_name
+                step.depends_on = [steps[index - 1].tool_name] if index else []
+        return QuestExecutionData(quest_id=f"stop-{graph}", quest_type="test", execution_stack=steps)
+    
+    sequential = await executor.execute_quest(quest(graph=False))
+    graph = await executor.execute_quest(quest(graph=True))
+    await pool.aclose()
+    
+    for result in (sequential, graph):
+        assert result.status == ExecutionStatus.ERROR
+        assert set(result.run_data) == {"architect", "sentinel"}
+        failed = result.run_data["sentinel"][0]
+        assert failed["status"] == ExecutionStatus.ERROR
+        assert failed["error"]["message"].endswith("check_quality failed")
+        assert failed["data"] is None
+@pytest.mark.asyncio
+async def test_graph_rejects_invalid_plans():
+    """Test unknown dependencies and cycles are rejected before execution"""
+    executor = QuestExecutor(client_pool=LordClientPool(transport=mock_lord_transport()))
+    
+    unknown = QuestExecutionData(
+        quest_id="graph-unknown",
+        quest_type="test",
+        execution_stack=[LordStep(lord_name="architect", tool_name="design_system", depends_on=["missing"])],
+    )
+    with pytest.raises(ValueError, match="unknown step"):
+        await executor.execute_quest(unknown)
+    
+    cycle = QuestExecutionData(
+        quest_id="graph-cycle",
+        quest_type="test",
+        execution_stack=[
+            LordStep(lord_name="architect", tool_name="design_system", step_id="a", depends_on=["b"]),
+            LordStep(lord_name="scribe", tool_name="write_docs", step_id="b", depends_on=["a"]),
+        ],
+    )
+    with pytest.raises(ValueError, match="cycle"):
+        await executor.execute_quest(cycle)
+    await executor.aclose()
+
+
+@pytest.mark.asyncio
+async def test_execute_many_with_per_lord_limits():
+    """Test bulk execution isolates quests and caps in-flight calls per Lord"""
+    pool = LordClientPool(transport=mock_lord_transport(delay=0.01))
+    quests = [
+        QuestExecutionData(
+            quest_id=f"bulk-{i:03d}",
+            quest_type="bulk",
+            input_data={"index": i},
+            execution_stack=[
+                LordStep(lord_name="architect", tool_name="design_system"),
+                LordStep(lord_name="sentinel", tool_name="review_code"),
+            ],
+        )
+        for i in range(40)
+    ]
+    
+    executor = QuestExecutor(client_pool=pool)
+    finished = []
+    async for quest in executor.execute_many(quests, max_concurrency=10, per_lord_limits={"sentinel": 2}):
+        finished.append(quest)
+    
+    assert len(finished) == 40
+    assert {quest.quest_id for quest in finished} == {quest.quest_id for quest in quests}
+    assert all(quest.status == ExecutionStatus.COMPLETED for quest in finished)
+    
+    # Each quest saw only its own input
+    for quest in finished:
+        index = quest.input_data["index"]
+        assert quest.run_data["architect"][0]["data"]["received"]["index"] == index
+    
+    endpoints = pool.stats()["endpoints"]
+    assert endpoints["http://localhost:8004"]["max_in_flight"] <= 2
+    assert endpoints["http://localhost:8001"]["max_in_flight"] <= 10
+    assert executor.status == ExecutionStatus.COMPLETED
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_execute_many_reports_failures_and_duplicates():
+    """Test invalid quests and duplicate ids are yielded as errors without stopping the batch"""
+    executor = QuestExecutor(client_pool=LordClientPool(transport=mock_lord_transport()))
+    bad = QuestExecutionData(
+        quest_id="bulk-bad",
+        quest_type="bulk",
+        execution_stack=[LordStep(lord_name="architect", tool_name="design_system", depends_on=["missing"])],
+    )
+    results = [quest async for quest in executor.execute_many([bad])]
+    assert results[0].status == ExecutionStatus.ERROR
+    assert "unknown step" in results[0].error["message"]
+    
+    # The duplicate doesn't cancel quests already in flight
+    def quest(quest_id):
+        return QuestExecutionData(
+            quest_id=quest_id,
+            quest_type="bulk",
+            execution_stack=[LordStep(lord_name="architect", tool_name="design_system")],
+        )
+    
+    batch = [quest("dup"), quest("other"), quest("dup"), quest("last")]
+    results = {}
+    async for finished in executor.execute_many(batch, max_concurrency=4):
+        results.setdefault(finished.quest_id, []).append(finished)
+    
+    assert sorted(results) == ["dup", "last", "other"]
+    assert results["other"][0].status == results["last"][0].status == ExecutionStatus.COMPLETED
+    assert sorted(result.status.value for result in results["dup"]) == ["completed", "error"]
+    rejected = next(result for result in results["dup"] if result.status == ExecutionStatus.ERROR)
+    assert "Duplicate quest_id" in rejected.error["message"]
+    assert batch[2].status == ExecutionStatus.NEW  # Never executed
+    await executor.aclose()
+
+
+@pytest.mark.asyncio
+async def test_result_cache_skips_repeat_calls():
+    """Test identical Lord calls are served from the result cache"""
+    calls = []
+    cache = LordResultCache(max_entries=16)
+    executor = QuestExecutor(
+        client_pool=LordClientPool(transport=mock_lord_transport(calls)),
+        result_cache=cache,
+    )
+    
+    def quest(quest_id, cache_flag=None):
+        return QuestExecutionData(
+            quest_id=quest_id,
+            quest_type="cached",
+            input_data={"requirements": ["auth", "jwt"], "scale": "small"},
+            execution_stack=[LordStep(lord_name="architect", tool_name="design_system", cache=cache_flag)],
+        )
+    
+    first = await executor.execute_quest(quest("cache-1"))
+    second = await executor.execute_quest(quest("cache-2"))
+    assert len(calls) == 1
+    assert first.output_data == second.output_data
+    
+    # Hits are independent copies
+    second.output_data["received"]["scale"] = "mutated"
+    third = await executor.execute_quest(quest("cache-3"))
+    assert third.output_data["received"]["scale"] == "small"
+    
+    # Per-step opt-out always calls the Lord
+    await executor.execute_quest(quest("cache-4", cache_flag=False))
+    assert len(calls) == 2
+    
+    stats = executor.cache_stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    await executor.aclose()
+
+
+@pytest.mark.asyncio
+async def test_result_cache_persistent_tier(tmp_path):
+    """Test results survive in the QuestRepository SQLite file"""
+    from quest_persistence import QuestRepository
+    repo = QuestRepository(str(tmp_path / "cache.db"))
+    
+    first = LordResultCache(repository=repo)
+    await first.put("scribe", "write_docs", {"topic": "x"}, {"text": "docs"})
+    
+    second = LordResultCache(repository=repo)
+    hit, result = await second.get("scribe", "write_docs", {"topic": "x"})
+    assert hit and result == {"text": "docs"}
+    assert second.stats()["persistent_hits"] == 1
+    
+    # Promoted to memory tier
+    await second.get("scribe", "write_docs", {"topic": "x"})
+    assert second.stats()["memory_hits"] == 1
+    
+    # Promotion keeps the remaining persistent expiry instead of a fresh TTL
+    short = LordResultCache(repository=repo, ttl=0.5)
+    await short.put("scribe", "write_docs", {"topic": "y"}, {"text": "docs"})
+    third = LordResultCache(repository=repo, ttl=300)
+    assert (await third.get("scribe", "write_docs", {"topic": "y"}))[0]
+    assert third.memory.ttl_remaining(LordResultCache.key_for("scribe", "write_docs", {"topic": "y"})) <= 0.5
+    
+    # The memory budget counts encoded bytes, not characters
+    sized = LordResultCache(max_bytes=20)
+    await sized.put("scribe", "write_docs", {}, "é" * 8)
+    assert sized.memory.total_bytes == 18
+    await sized.put("scribe", "write_docs", {"topic": "z"}, "é" * 10)
+    assert sized.memory.total_bytes == 18 and len(sized.memory) == 1  # 22 bytes: not kept
+
+
+@pytest.mark.asyncio
+async def test_result_cache_io_outside_attempt_timeout():
+    """Test slow cache stores don't time out a successful Lord call or trip its breaker"""
+    import time
+    
+    class SlowRepository:
+        def get_cached_entry(self, key):
+            return None
+        
+        def put_cached_result(self, *args):
+            time.sleep(0.2)
+    
+    calls = []
+    breakers = LordCircuitBreakers(failure_threshold=1)
+    executor = QuestExecutor(
+        client_pool=LordClientPool(transport=mock_lord_transport(calls)),
+        result_cache=LordResultCache(repository=SlowRepository()),
+        circuit_breakers=breakers,
+    )
+    quest = QuestExecutionData(
+        quest_id="slow-cache",
+        quest_type="test",
+        execution_stack=[
+            LordStep(
+                lord_name="architect",
+                tool_name="design_system",
+                timeout_s=0.1,
+                retry_config=LordRetryConfig(max_tries=2, wait_between_tries_ms=0),
+            ),
+        ],
+    )
+    
+    result = await executor.execute_quest(quest)
+    
+    assert result.status == ExecutionStatus.COMPLETED
+    assert len(calls) == 1  # Not retried
+    assert breakers.state("architect") == CircuitState.CLOSED
+    await executor.aclose()
+def test_lru_ttl_cache_eviction():
+    """Test LRU, byte-size and TTL eviction"""
+    cache = LRUTTLCache(max_entries=2, max_bytes=10, default_ttl=None)
+    cache.set("a", "1234")
+    cache.set("b", "1234")
+    cache.get("a")
+    cache.set("c", "1234")  # Entry limit: evicts least recently used "b"
+    assert "a" in cache and "c" in cache and "b" not in cache
+    
+    cache.set("d", "123456789")  # Byte limit: evicts until <= 10 bytes
+    assert cache.keys() == ["d"]
+    assert cache.set("huge", "x" * 11) is False
+    
+    cache.set("short", "1", ttl=0.001)
+    import time
+    time.sleep(0.01)
+    assert cache.get("short") is None
+    assert cache.stats()["expirations"] == 1
+    
+    assert canonical_key("a", {"x": 1, "y": 2}) == canonical_key("a", {"y": 2, "x": 1})
+
+
+@pytest.mark.asyncio
+async def test_background_hooks_do_not_block_steps():
+    """Test slow async hooks run off the step path and are timed per event"""
+    hooks = ExecutionHooks(async_mode="background", sync_mode="thread", queue_size=100)
+    seen = []
+    
+    @hooks.register("lord_completed")
+    async def slow_metrics(step, quest_data):
+        await asyncio.sleep(0.2)
+        seen.append(step.lord_name)
+    
+    @hooks.register("lord_invoked")
+    def blocking_logger(step, quest_data):
+        import time
+        time.sleep(0.05)
+    
+    quest = QuestExecutionData(
+        quest_id="hooks-bg",
+        quest_type="test",
+        execution_stack=[
+            LordStep(lord_name="architect", tool_name="design_system"),
+            LordStep(lord_name="scribe", tool_name="write_docs"),
+        ],
+    )
+    executor = QuestExecutor(hooks=hooks, client_pool=LordClientPool(transport=mock_lord_transport()))
+    
+    start = asyncio.get_running_loop().time()
+    result = await executor.execute_quest(quest)
+    elapsed = asyncio.get_running_loop().time() - start
+    
+    assert result.status == ExecutionStatus.COMPLETED
+    assert elapsed < 0.2  # Slow async hooks did not add to quest latency
+    
+    await hooks.drain()
+    assert seen == ["architect", "scribe"]
+    
+    stats = hooks.stats()["events"]
+    assert stats["lord_completed"]["callbacks_run"] == 2
+    assert stats["lord_completed"]["max_time_seconds"] >= 0.2
+    assert stats["lord_invoked"]["callbacks_run"] == 2
+    
+    await hooks.aclose()
+    await executor.aclose()
+    await executor.client_pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_background_hooks_overflow_policy():
+    """Test full hook queue drops events and counts them"""
+    for overflow in ("drop_new", "drop_oldest"):
+        hooks = ExecutionHooks(async_mode="background", queue_size=2, overflow=overflow)
+        received = []
+        
+        async def record(quest_data):
+            received.append(quest_data)
+        
+        hooks.register("quest_started", record)
+        for i in range(5):
+            await hooks.emit("quest_started", i)
+        await hooks.drain()
+        
+        assert hooks.stats()["events"]["quest_started"]["dropped"] == 3
+        assert received == ([0, 1] if overflow == "drop_new" else [3, 4])
+        await hooks.aclose()
+
+@pytest.mark.asyncio
+async def test_step_timeout_retries_then_fails():
+    """Test per-step timeout cuts slow Lord calls and feeds the retry loop"""
+    calls = []
+    pool = LordClientPool(transport=mock_lord_transport(calls=calls, delay=0.5))
+    quest = QuestExecutionData(
+        quest_id="timeout-step",
+        quest_type="test",
+        execution_stack=[
+            LordStep(
+                lord_name="architect",
+                tool_name="design_system",
+                timeout_s=0.05,
+                retry_config=LordRetryConfig(max_tries=2, wait_between_tries_ms=0),
+            ),
+        ],
+    )
+    
+    async with QuestExecutor(client_pool=pool) as executor:
+        start = asyncio.get_running_loop().time()
+        result = await executor.execute_quest(quest)
+        elapsed = asyncio.get_running_loop().time() - start
+    
+    assert result.status == ExecutionStatus.ERROR
+    assert "timed out" in result.error["message"]
+    assert len(calls) == 2
+    assert elapsed < 0.4
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_quest_deadline_times_out_and_skips_retries():
+    """Test exhausted quest deadline yields TIMED_OUT regardless of on_error"""
+    import time
+    calls = []
+    pool = LordClientPool(transport=mock_lord_transport(calls=calls, delay=0.3))
+    quest = QuestExecutionData(
+        quest_id="timeout-quest",
+        quest_type="test",
+        deadline=time.time() + 0.1,
+        execution_stack=[
+            LordStep(
+                lord_name="architect",
+                tool_name="design_system",
+                on_error=ErrorMode.CONTINUE,
+                retry_config=LordRetryConfig(max_tries=3, wait_between_tries_ms=50),
+            ),
+            LordStep(lord_name="scribe", tool_name="write_docs"),
+        ],
+    )
+    
+    hooks = ExecutionHooks()
+    finished = []
+    hooks.register("quest_finished", lambda quest_data: finished.append(quest_data.status))
+    async with QuestExecutor(client_pool=pool, hooks=hooks) as executor:
+        result = await executor.execute_quest(quest)
+    
+    assert result.status == ExecutionStatus.TIMED_OUT
+    assert finished == [ExecutionStatus.TIMED_OUT]  # Emitted once
+    assert result.error["lord"] == "architect"
+    assert calls == [(8001, "design_system")]  # No retries, scribe never called
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_quest_deadline_does_not_trip_breaker():
+    """Test a tight quest deadline is not recorded as a Lord failure"""
+    import time
+    calls = []
+    breakers = LordCircuitBreakers(failure_threshold=1)
+    pool = LordClientPool(transport=mock_lord_transport(calls=calls, delay=0.2))
+    
+    def quest(quest_id, deadline=None, timeout_s=None):
+        return QuestExecutionData(
+            quest_id=quest_id,
+            quest_type="test",
+            deadline=deadline,
+            execution_stack=[LordStep(lord_name="architect", tool_name="design_system", timeout_s=timeout_s)],
+        )
+    
+    async with QuestExecutor(client_pool=pool, circuit_breakers=breakers) as executor:
+        result = await executor.execute_quest(quest("tight-budget", deadline=time.time() + 0.05))
+        assert result.status == ExecutionStatus.TIMED_OUT
+        assert breakers.state("architect") == CircuitState.CLOSED
+        
+        # The Lord's own step timeout still counts against it
+        result = await executor.execute_quest(quest("slow-lord", timeout_s=0.05))
+        assert result.status == ExecutionStatus.ERROR
+        assert breakers.state("architect") == CircuitState.OPEN
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_deadline_forwarded_to_lords():
+    """Test remaining budget is sent as params._meta.deadline_ms"""
+    import json
+    import time
+    seen = []
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        seen.append(body["params"].get("_meta"))
+        return httpx.Response(200, json={"jsonrpc": "2.0", "result": {}, "id": body["id"]})
+    
+    pool = LordClientPool(transport=httpx.MockTransport(handler))
+    async with QuestExecutor(client_pool=pool) as executor:
+        await executor.execute_quest(QuestExecutionData(
+            quest_id="deadline-meta",
+            quest_type="test",
+            deadline=time.time() + 5,
+            execution_stack=[LordStep(lord_name="architect", tool_name="design_system")],
+        ))
+        await executor.execute_quest(QuestExecutionData(
+            quest_id="no-deadline",
+            quest_type="test",
+            execution_stack=[LordStep(lord_name="architect", tool_name="design_system")],
+        ))
+    
+    assert 4000 < seen[0]["deadline_ms"] <= 5000
+    assert seen[1] is None
+    await pool.aclose()
+
+@pytest.mark.asyncio
+async def test_registry_spreads_calls_across_replicas():
+    """Test round-robin balancing over several sentinel replicas"""
+    calls = []
+    registry = LordRegistry({"sentinel": [9004, 9014, 9024]})
+    executor = QuestExecutor(
+        client_pool=LordClientPool(transport=mock_lord_transport(calls=calls)),
+        registry=registry,
+    )
+    quest = QuestExecutionData(
+        quest_id="replicas",
+        quest_type="test",
+        execution_stack=[LordStep(lord_name="sentinel", tool_name="review_code") for _ in range(6)],
+    )
+    
+    result = await executor.execute_quest(quest)
+    
+    assert result.status == ExecutionStatus.COMPLETED
+    assert sorted(port for port, _ in calls) == [9004, 9004, 9014, 9014, 9024, 9024]
+    assert all(e["outstanding"] == 0 for e in executor.registry_stats()["lords"]["sentinel"])
+    await executor.aclose()
+
+
+@pytest.mark.asyncio
+async def test_registry_ejects_failing_replica():
+    """Test passive health ejects a failing replica and retries land on a healthy one"""
+    import json
+    calls = []
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        calls.append(request.url.port)
+        if request.url.port == 9014:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"jsonrpc": "2.0", "result": {"ok": True}, "id": body["id"]})
+    
+    registry = LordRegistry({"sentinel": [9004, 9014]}, failure_threshold=1, ejection_cooldown=60)
+    executor = QuestExecutor(client_pool=LordClientPool(transport=httpx.MockTransport(handler)), registry=registry)
+    quest = QuestExecutionData(
+        quest_id="eject",
+        quest_type="test",
+        execution_stack=[
+            LordStep(
+                lord_name="sentinel",
+                tool_name="review_code",
+                retry_config=LordRetryConfig(max_tries=2, wait_between_tries_ms=0),
+            )
+            for _ in range(4)
+        ],
+    )
+    
+    result = await executor.execute_quest(quest)
+    
+    assert result.status == ExecutionStatus.COMPLETED
+    assert calls.count(9014) == 1  # Ejected after its first failure
+    stats = {e["url"]: e for e in registry.stats()["lords"]["sentinel"]}
+    assert stats["http://localhost:9014"]["available"] is False
+    assert stats["http://localhost:9014"]["ejections"] == 1
+    await executor.aclose()
+
+
+def test_registry_balancing_strategies():
+    """Test least-outstanding and EWMA strategies and panic mode"""
+    registry = LordRegistry({"scribe": [9002, 9012]}, strategy="least_outstanding")
+    first = registry.acquire("scribe")
+    second = registry.acquire("scribe")
+    assert first.url != second.url  # Busy replica avoided
+    
+    registry = LordRegistry({"scribe": [9002, 9012]}, strategy="ewma")
+    slow, fast = registry.endpoints("scribe")
+    registry.release(registry.acquire("scribe", exclude=[fast.url]), 2.0, ok=True)
+    registry.release(registry.acquire("scribe", exclude=[slow.url]), 0.1, ok=True)
+    for _ in range(3):
+        endpoint = registry.acquire("scribe")
+        registry.release(endpoint, 0.1 if endpoint is fast else 2.0, ok=True)
+    assert fast.requests > slow.requests
+    
+    registry = LordRegistry({"scribe": 9002}, failure_threshold=1)
+    only = registry.acquire("scribe")
+    registry.release(only, 0.1, ok=False)
+    assert not only.available()
+    assert registry.acquire("scribe") is only  # Panic mode keeps the Lord routable
+    
+    with pytest.raises(ValueError):
+        LordRegistry(strategy="fastest")
+
+@pytest.mark.asyncio
+async def test_hedged_request_wins_on_slow_replica():
+    """Test slow primary is hedged to another replica and the loser is cancelled"""
+    import json
+    calls = []
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        calls.append(request.url.port)
+        if request.url.port == 9004:
+            await asyncio.sleep(1.0)
+        return httpx.Response(200, json={"jsonrpc": "2.0", "result": {"port": request.url.port}, "id": body["id"]})
+    
+    registry = LordRegistry({"sentinel": [9004, 9014]})
+    executor = QuestExecutor(client_pool=LordClientPool(transport=httpx.MockTransport(handler)), registry=registry)
+    quest = QuestExecutionData(
+        quest_id="hedge",
+        quest_type="test",
+        execution_stack=[
+            LordStep(lord_name="sentinel", tool_name="review_code", hedge=HedgePolicy(default_delay_ms=50)),
+        ],
+    )
+    
+    start = asyncio.get_running_loop().time()
+    result = await executor.execute_quest(quest)
+    elapsed = asyncio.get_running_loop().time() - start
+    
+    assert result.status == ExecutionStatus.COMPLETED
+    assert result.output_data == {"port": 9014}
+    assert calls == [9004, 9014]
+    assert elapsed < 0.5
+    assert executor.hedge_stats() == {"sentinel": {"sent": 1, "won": 1}}
+    assert all(e.outstanding == 0 for e in registry.endpoints("sentinel"))
+    assert all(e.failures == 0 for e in registry.endpoints("sentinel"))  # Losing hedge isn't a failure
+    
+    await executor.aclose()
+    
+    # A single replica is never hedged onto itself (no doubled load)
+    calls.clear()
+    registry = LordRegistry({"sentinel": 9004})
+    executor = QuestExecutor(client_pool=LordClientPool(transport=httpx.MockTransport(handler)), registry=registry)
+    result = await executor.execute_quest(QuestExecutionData(
+        quest_id="single-replica",
+        quest_type="test",
+        execution_stack=[
+            LordStep(lord_name="sentinel", tool_name="review_code", hedge=HedgePolicy(default_delay_ms=50)),
+        ],
+    ))
+    
+    assert result.output_data == {"port": 9004}
+    assert calls == [9004]
+    assert [e.requests for e in registry.endpoints("sentinel")] == [1]
+    assert executor.hedge_stats() == {"sentinel": {"sent": 0, "won": 0}}
+    await executor.aclose()
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_fails_fast_and_keeps_error_modes():
+    """Test open circuit skips retries, on_error still applies, transitions reach hooks"""
+    import json
+    calls = []
+    down = {"architect"}
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        calls.append(request.url.port)
+        if request.url.port == 8001 and "architect" in down:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, json={"jsonrpc": "2.0", "result": {"ok": True}, "id": body["id"]})
+    
+    hooks = ExecutionHooks()
+    transitions = []
+    errors = []
+    hooks.register("breaker_state_changed", lambda lord, old, new: transitions.append((lord, old, new)))
+    hooks.register("lord_error", lambda step, quest_data: errors.append(step.error["message"]))
+    
+    breakers = LordCircuitBreakers(failure_threshold=2, reset_timeout=0.2)
+    executor = QuestExecutor(
+        hooks=hooks,
+        client_pool=LordClientPool(transport=httpx.MockTransport(handler)),
+        circuit_breakers=breakers,
+    )
+    
+    def quest(quest_id):
+        return QuestExecutionData(
+            quest_id=quest_id,
+            quest_type="test",
+            execution_stack=[
+                LordStep(
+                    lord_name="architect",
+                    tool_name="design_system",
+                    on_error=ErrorMode.CONTINUE,
+                    retry_config=LordRetryConfig(max_tries=3, wait_between_tries_ms=0),
+                ),
+                LordStep(lord_name="scribe", tool_name="write_docs"),
+            ],
+        )
+    
+    first = await executor.execute_quest(quest("breaker-1"))
+    assert first.status == ExecutionStatus.COMPLETED  # CONTINUE still applied
+    assert calls == [8001, 8001, 8002]  # Third retry rejected by the open circuit
+    assert errors[0].startswith("Circuit open")
+    assert breakers.state("architect") == CircuitState.OPEN
+    
+    calls.clear()
+    second = await executor.execute_quest(quest("breaker-2"))
+    assert second.status == ExecutionStatus.COMPLETED
+    assert calls == [8002]  # Architect never contacted while open
+    
+    # After reset_timeout a half-open trial succeeds and closes the circuit
+    down.clear()
+    await asyncio.sleep(0.25)
+    third = await executor.execute_quest(quest("breaker-3"))
+    assert third.run_data["architect"][0]["status"] == ExecutionStatus.SUCCESS
+    assert len(errors) == 2
+    assert [(old, new) for _, old, new in transitions] == [
+        (CircuitState.CLOSED, CircuitState.OPEN),
+        (CircuitState.OPEN, CircuitState.HALF_OPEN),
+        (CircuitState.HALF_OPEN, CircuitState.CLOSED),
+    ]
+    assert executor.breaker_stats()["architect"]["rejected"] == 2
+    await executor.aclose()
+
+
+@pytest.mark.asyncio
+async def test_shared_circuit_breakers_notify_every_executor():
+    """Test executors sharing LordCircuitBreakers each get state changes"""
+    breakers = LordCircuitBreakers(failure_threshold=1)
+    seen = {"first": [], "second": []}
+    executors = {}
+    for name in seen:
+        hooks = ExecutionHooks()
+        hooks.register("breaker_state_changed", lambda lord, old, new, name=name: seen[name].append((lord, new)))
+        executors[name] = QuestExecutor(hooks=hooks, circuit_breakers=breakers)
+    
+    breakers.for_lord("architect").record(False)
+    for executor in executors.values():
+        await executor._emit_breaker_events()
+    assert seen == {"first": [("architect", CircuitState.OPEN)], "second": [("architect", CircuitState.OPEN)]}
+    
+    # A closed executor unsubscribes
+    await executors["first"].aclose()
+    breakers.for_lord("scribe").record(False)
+    await executors["second"]._emit_breaker_events()
+    assert seen["second"][-1] == ("scribe", CircuitState.OPEN) and len(seen["first"]) == 1
+    await executors["second"].aclose()
+
+
+def test_circuit_breaker_half_open_failure_reopens():
+    """Test half-open trial failure re-opens and limits trial calls"""
+    breaker = CircuitBreaker("sentinel", failure_threshold=1, reset_timeout=0.0)
+    breaker.acquire()
+    breaker.record(False)
+    assert breaker.state == CircuitState.OPEN
+    
+    breaker.acquire()  # reset_timeout elapsed -> trial call admitted
+    assert breaker.state == CircuitState.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire()  # Only one trial at a time
+    breaker.record(False)
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.opened == 2
+
+@pytest.mark.asyncio
+async def test_retry_policy_classifies_errors():
+    """Test non-retryable JSON-RPC codes fail at once while internal errors retry"""
+    import json
+    calls = []
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        name = body["params"]["name"]
+        calls.append(name)
+        code = -32601 if name == "missing_tool" else -32603
+        return httpx.Response(200, json={
+            "jsonrpc": "2.0", "error": {"code": code, "message": f"{name} failed"}, "id": body["id"],
+        })
+    
+    executor = QuestExecutor(client_pool=LordClientPool(transport=httpx.MockTransport(handler)))
+    errors = []
+    executor.hooks.register("lord_error", lambda step, quest_data: errors.append(step.error))
+    
+    for tool in ("missing_tool", "flaky_tool"):
+        await executor.execute_quest(QuestExecutionData(
+            quest_id=tool,
+            quest_type="test",
+            execution_stack=[LordStep(
+                lord_name="architect",
+                tool_name=tool,
+                retry_config=LordRetryConfig(max_tries=3, wait_between_tries_ms=0),
+            )],
+        ))
+    
+    assert calls == ["missing_tool", "flaky_tool", "flaky_tool", "flaky_tool"]
+    assert errors[0] == {"message": "Lord architect error: missing_tool failed", "attempts": 1, "code": -32601}
+    assert errors[1]["attempts"] == 3
+    
+    unknown = await executor.execute_quest(QuestExecutionData(
+        quest_id="unknown-lord",
+        quest_type="test",
+        execution_stack=[LordStep(lord_name="oracle", tool_name="predict", retry_config=LordRetryConfig(max_tries=3))],
+    ))
+    assert unknown.status == ExecutionStatus.ERROR
+    assert errors[2]["attempts"] == 1
+    await executor.aclose()
+
+
+@pytest.mark.asyncio
+async def test_retry_budget_limits_retry_storm():
+    """Test exhausted per-Lord retry budget stops retries across quests"""
+    calls = []
+    policy = RetryPolicy(budget=RetryBudget(capacity=2, deposit_ratio=0, refill_per_second=0))
+    executor = QuestExecutor(
+        client_pool=LordClientPool(transport=mock_lord_transport(calls=calls, fail_tools=("design_system",))),
+        retry_policy=policy,
+        circuit_breakers=False,
+    )
+    
+    for i in range(3):
+        await executor.execute_quest(QuestExecutionData(
+            quest_id=f"storm-{i}",
+            quest_type="test",
+            execution_stack=[LordStep(
+                lord_name="architect",
+                tool_name="design_system",
+                retry_config=LordRetryConfig(max_tries=3, wait_between_tries_ms=0),
+            )],
+        ))
+    
+    # 3 first attempts + only 2 budgeted retries
+    assert len(calls) == 5
+    stats = executor.retry_stats()["budget"]["architect"]
+    assert stats["retries_allowed"] == 2
+    assert stats["retries_denied"] == 2
+    await executor.aclose()
+
+
+def test_exponential_backoff_with_jitter():
+    """Test backoff growth, cap and jitter bounds"""
+    import random
+    fixed = LordRetryConfig(max_tries=5, wait_between_tries_ms=100)
+    assert [backoff_seconds(fixed, n) for n in range(4)] == [0.0, 0.1, 0.1, 0.1]
+    
+    exp = LordRetryConfig(max_tries=5, wait_between_tries_ms=100, exponential_backoff=True, max_wait_ms=300, jitter="none")
+    assert [backoff_seconds(exp, n) for n in range(5)] == [0.0, 0.1, 0.2, 0.3, 0.3]
+    
+    exp.jitter = "full"
+    rng = random.Random(7)
+    waits = [backoff_seconds(exp, 3, rng) for _ in range(50)]
+    assert all(0 <= w <= 0.3 for w in waits) and len(set(waits)) > 1
+    
+    exp.jitter = "equal"
+    assert all(0.15 <= backoff_seconds(exp, 3, rng) <= 0.3 for _ in range(50))
+    
+    with pytest.raises(ValueError):
+        LordRetryConfig(jitter="random")
+
+@pytest.mark.asyncio
+async def test_inproc_transport_calls_lord_apps_directly():
+    """Test "inproc" registry entries run real Lord apps without a server"""
+    calls = []
+    registry = LordRegistry({"architect": "inproc", "scribe": "inproc", "sentinel": 9004})
+    executor = QuestExecutor(
+        client_pool=LordClientPool(transport=mock_lord_transport(calls=calls)),
+        registry=registry,
+    )
+    quest = QuestExecutionData(
+        quest_id="inproc",
+        quest_type="test",
+        input_data={"app_name": "Camelot", "requirements": ["auth"]},
+        execution_stack=[
+            LordStep(lord_name="architect", tool_name="design_system"),
+            LordStep(lord_name="scribe", tool_name="write_docs"),
+            LordStep(lord_name="sentinel", tool_name="review_code"),
+        ],
+    )
+    
+    result = await executor.execute_quest(quest)
+    
+    assert result.status == ExecutionStatus.COMPLETED
+    assert "Camelot" in result.run_data["architect"][0]["data"]["content"][0]["text"]
+    assert result.run_data["scribe"][0]["data"]["metadata"]["lord"] == "scribe"
+    assert calls == [(9004, "review_code")]  # Only the HTTP Lord hit the (mock) network
+    assert [e["transport"] for e in executor.registry_stats()["lords"]["architect"]] == ["inproc"]
+    await executor.aclose()
+
+@pytest.mark.asyncio
+async def test_lord_batch_requests_run_concurrently():
+    """Test a JSON-RPC batch to a Lord runs calls concurrently and keeps order/ids"""
+    import lord_sentinel
+    batch = [
+        {"jsonrpc": "2.0", "method": "tools/call", "params": {"name": "analyze_security", "arguments": {"code": "x = 1"}}, "id": 7},
+        {"jsonrpc": "2.0", "method": "tools/call", "params": {"name": "check_quality", "arguments": {"code": "x = 1"}}, "id": 8},
+        {"jsonrpc": "2.0", "method": "tools/call", "params": {"name": "no_such_tool", "arguments": {}}, "id": 9},
+        {"method": "tools/call"},
+    ]
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=lord_sentinel.app), base_url="http://sentinel") as client:
+        start = asyncio.get_running_loop().time()
+        response = await client.post("/mcp", json=batch)
+        elapsed = asyncio.get_running_loop().time() - start
+        empty = await client.post("/mcp", json=[])
+    
+    body = response.json()
+    assert [item["id"] for item in body] == [7, 8, 9, None]
+    assert "vulnerabilities" in body[0]["result"]
+    assert "grade" in body[1]["result"]
+    assert body[2]["error"]["code"] == -32601
+    assert body[3]["error"]["code"] == -32600
+    assert elapsed < 2.3  # 1.5s + 1.0s tools overlapped
+    assert empty.json()["error"]["code"] == -32600
+
+
+@pytest.mark.asyncio
+async def test_executor_batches_concurrent_calls():
+    """Test concurrent graph steps for one Lord share a single batch request"""
+    import json
+    bodies = []
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        bodies.append(body)
+        
+        def answer(item):
+            return {"jsonrpc": "2.0", "result": {"tool": item["params"]["name"]}, "id": item["id"]}
+        
+        if isinstance(body, list):
+            return httpx.Response(200, json=[answer(item) for item in reversed(body)])
+        return httpx.Response(200, json=answer(body))
+    
+    executor = QuestExecutor(
+        client_pool=LordClientPool(transport=httpx.MockTransport(handler)),
+        batch_window=0.01,
+    )
+    result = await executor.execute_quest(build_parallel_review_quest("Batch it"))
+    
+    assert result.status == ExecutionStatus.COMPLETED
+    batches = [body for body in bodies if isinstance(body, list)]
+    assert len(batches) == 1
+    assert sorted(item["params"]["name"] for item in batches[0]) == ["analyze_security", "check_quality"]
+    assert len({item["id"] for item in batches[0]}) == 2
+    assert result.run_data["sentinel"][0]["data"]["tool"] != result.run_data["sentinel"][1]["data"]["tool"]
+    assert executor.batch_stats()["batches_sent"] == 1
+    assert executor.batch_stats()["requests_sent"] == 4  # 5 calls, 4 HTTP requests
+    
+    # Calls with different timeouts are not batched (a batch is sent with one timeout)
+    bodies.clear()
+    quest = build_parallel_review_quest("Batch it")
+    quest.execution_stack[3].timeout_s = 90
+    result = await executor.execute_quest(quest)
+    assert result.status == ExecutionStatus.COMPLETED
+    assert len(bodies) == 5 and not any(isinstance(body, list) for body in bodies)
+    assert executor.batch_stats()["batches_sent"] == 1
+    await executor.aclose()
+
+@pytest.mark.asyncio
+async def test_lord_server_dispatch_and_errors():
+    """Test shared Lord server: tools/list, error codes, timing stats"""
+    from lord_server import LordServer, ToolError
+    
+    server = LordServer("tester", port=9999)
+    
+    @server.tool("echo", "Echo arguments", {"type": "object"})
+    async def echo(arguments):
+        return {"echo": arguments}
+    
+    @server.tool("picky")
+    def picky(arguments):
+        """Rejects everything"""
+        raise ToolError("bad input")
+    
+    @server.tool("broken")
+    def broken(arguments):
+        raise RuntimeError("boom")
+    
+    async def rpc(client, payload):
+        if isinstance(payload, bytes):
+            return await client.post("/mcp", content=payload)
+        return await client.post("/mcp", json=payload)
+    
+    def call(name, arguments=None, request_id=1):
+        return {"jsonrpc": "2.0", "method": "tools/call", "params": {"name": name, "arguments": arguments or {}}, "id": request_id}
+    
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=server.app), base_url="http://lord") as client:
+        listed = (await rpc(client, {"jsonrpc": "2.0", "method": "tools/list", "id": "a"})).json()
+        assert [tool["name"] for tool in listed["result"]["tools"]] == ["echo", "picky", "broken"]
+        assert listed["result"]["tools"][1]["description"] == "Rejects everything"
+        
+        ok = await rpc(client, call("echo", {"x": 1}))
+        assert ok.json() == {"jsonrpc": "2.0", "id": 1, "result": {"echo": {"x": 1}}}
+        assert list(ok.json())[-1] == "result"
+        assert float(ok.headers["X-Process-Time"]) >= 0
+        
+        assert (await rpc(client, call("picky"))).json()["error"]["code"] == -32602
+        assert (await rpc(client, call("broken"))).json()["error"]["code"] == -32603
+        assert (await rpc(client, call("missing"))).json()["error"]["code"] == -32601
+        assert (await rpc(client, {"jsonrpc": "2.0", "method": "nope", "id": 2})).json()["error"]["code"] == -32601
+        assert (await rpc(client, b"{not json")).json()["error"]["code"] == -32700
+        bad_arguments = {"jsonrpc": "2.0", "method": "tools/call", "params": {"name": "echo", "arguments": [1]}, "id": 3}
+        assert (await rpc(client, bad_arguments)).json()["error"]["code"] == -32602
+        
+        stats = (await client.get("/stats")).json()["tools"]
+        assert stats["echo"]["calls"] == 1
+        assert stats["broken"]["errors"] == 1
+        assert (await client.get("/")).json()["capabilities"] == ["echo", "picky", "broken"]
+    
+    with pytest.raises(ValueError):
+        server.add_tool("echo", echo)
+
+
+@pytest.mark.asyncio
+async def test_lord_server_offloads_cpu_bound_tools():
+    """Test CPU-bound tools run off the event loop and saturation answers 503"""
+    import threading
+    from lord_server import LordServer
+    import lord_scribe
+    
+    release = threading.Event()
+    server = LordServer("tester", executor="thread", max_workers=1, max_queue=1)
+    
+    @server.tool("crunch", cpu_bound=True)
+    def crunch(arguments):
+        release.wait(5)
+        return {"thread": threading.current_thread().name}
+    
+    @server.tool("ping")
+    async def ping(arguments):
+        return {"pong": True}
+    
+    def call(name, request_id):
+        return {"jsonrpc": "2.0", "method": "tools/call", "params": {"name": name, "arguments": {}}, "id": request_id}
+    
+    with pytest.raises(ValueError):
+        server.add_tool("bad", ping, cpu_bound=True)
+    
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=server.app), base_url="http://lord") as client:
+        running = [asyncio.create_task(client.post("/mcp", json=call("crunch", i))) for i in range(2)]
+        await asyncio.sleep(0.1)
+        
+        # Event loop still serves cheap tools while the pool is busy
+        assert (await client.post("/mcp", json=call("ping", 3))).json()["result"] == {"pong": True}
+        
+        busy = await client.post("/mcp", json=call("crunch", 4))
+        assert busy.status_code == 503
+        assert busy.json()["error"]["code"] == -32000
+        
+        release.set()
+        results = [(await task).json()["result"] for task in running]
+        assert all(result["thread"].startswith("lord-tester") for result in results)
+        
+        executor = (await client.get("/stats")).json()["executor"]
+        assert executor["completed"] == 2 and executor["rejected"] == 1 and executor["in_flight"] == 0
+    server.shutdown()
+    
+    # Process pool: the scribe's summary runs in a worker process
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=lord_scribe.app), base_url="http://scribe") as client:
+        request = {"jsonrpc": "2.0", "method": "tools/call", "params": {"name": "create_summary", "arguments": {"content": "word " * 500}}, "id": 1}
+        response = await client.post("/mcp", json=request)
+    assert response.status_code == 200
+    assert response.json()["result"]["metadata"]["original_length"] == 2500
+    assert lord_scribe.server.executor_stats()["completed"] >= 1
+    lord_scribe.server.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_sentinel_full_review_matches_individual_tools():
+    """Test full_review scans once, overlaps the analyses and matches the separate tools"""
+    import lord_sentinel
+    code = 'SECRET_KEY = "your-secret-key"\n# TODO\ndef login(password):\n    if password:\n        eval(password)\n'
+    
+    # One-pass scan counts the same as str.count
+    scan = lord_sentinel._scan(code)
+    for marker in lord_sentinel._MARKERS:
+        assert scan.get(marker, 0) == code.count(marker)
+    assert scan["TODO"] == 1 and "->" not in scan
+    
+    def call(name, request_id):
+        return {"jsonrpc": "2.0", "method": "tools/call", "params": {"name": name, "arguments": {"code": code}}, "id": request_id}
+    
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=lord_sentinel.app), base_url="http://sentinel") as client:
+        start = asyncio.get_running_loop().time()
+        combined = (await client.post("/mcp", json=call("full_review", 1))).json()["result"]
+        elapsed = asyncio.get_running_loop().time() - start
+        separate = (await client.post("/mcp", json=[
+            call("review_code", 2), call("analyze_security", 3), call("check_quality", 4),
+        ])).json()
+    lord_sentinel.server.shutdown()
+    
+    assert elapsed < 2.4  # Slowest analysis (2.0s), not the 4.5s sum
+    assert combined["review"] == separate[0]["result"]
+    assert combined["security"] == separate[1]["result"]
+    assert combined["quality"] == separate[2]["result"]
+    assert combined["security"]["risk_level"] == "critical"
+    assert combined["approved"] is False
+
+
+@pytest.mark.asyncio
+async def test_sentinel_quality_uses_ast_engine_and_hash_cache():
+    """Test AST/tokenize metrics ignore strings/comments and unchanged files hit the cache"""
+    import lord_sentinel
+    import dataclasses
+    from code_analysis import SourceMetrics, analyze_source
+    
+    source = (
+        "class Auth:\n"
+        "    def check(self, user):  # if this looks like a branch, it isn't\n"
+        "        note = 'if for while def '\n"
+        "        if user and user.active:\n"
+        "            return True\n"
+        "        for attempt in range(3):\n"
+        "            try:\n"
+        "                return [r for r in attempt if r]\n"
+        "            except ValueError:\n"
+        "                pass\n"
+        "        return False\n"
+        "\n"
+        "# module comment\n"
+    )
+    metrics = analyze_source(source)
+    assert metrics.num_classes == 1
+    assert [(f.name, f.line, f.complexity) for f in metrics.functions] == [("check", 2, 7)]
+    assert (metrics.lines, metrics.code_lines, metrics.comment_lines, metrics.blank_lines) == (13, 11, 1, 1)
+    assert analyze_source("def broken(:\n").syntax_error is not None
+    
+    # Store round-trip and LRU eviction of the memory tier
+    assert SourceMetrics.from_dict(dataclasses.asdict(metrics)) == metrics
+    store = lord_sentinel.configure_store(max_entries=2)
+    for code in ("a = 1", "b = 2", "c = 3"):
+        await lord_sentinel._collect_reports({"code": code})
+    assert store.memory.stats()["evictions"] == 1
+    
+    before = store.stats()
+    files = [{"path": "auth.py", "code": source}, {"path": "main.py", "code": "import auth\n"}]
+    request = {"jsonrpc": "2.0", "method": "tools/call", "params": {"name": "check_quality", "arguments": {"code": source, "files": files}}, "id": 1}
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=lord_sentinel.app), base_url="http://sentinel") as client:
+        first = (await client.post("/mcp", json=request)).json()["result"]
+        stores = store.stats()["stores"] - before["stores"]
+        second = (await client.post("/mcp", json=request)).json()["result"]
+    lord_sentinel.server.shutdown()
+    lord_sentinel.configure_store()
+    
+    assert first == second
+    assert stores == 2  # code == files[0]: two distinct contents analyzed once each
+    after = store.stats()
+    assert after["stores"] - before["stores"] == stores  # Resubmission analyzed nothing
+    assert after["hits"] - before["hits"] == 2
+    assert first["metrics"]["num_functions"] == 1
+    assert first["metrics"]["cyclomatic_complexity"] == 7
+    assert [f["path"] for f in first["files"]] == ["<code>", "auth.py", "main.py"]
+
+
+@pytest.mark.asyncio
+async def test_sentinel_incremental_review_against_base(tmp_path):
+    """Test diff-aware reviews reuse persisted per-file results and report changed functions"""
+    import lord_sentinel
+    from code_analysis import content_hash
+    
+    auth_v1 = "def login(user):\n    return True\n\ndef logout(user):\n    return None\n"
+    auth_v2 = "def login(user):\n    # TODO: check password\n    return user is not None\n\ndef logout(user):\n    return None\n"
+    util = "def helper(x: int) -> int:\n    return x * 2\n"
+    
+    def call(name, arguments):
+        return {"jsonrpc": "2.0", "method": "tools/call", "params": {"name": name, "arguments": arguments}, "id": 1}
+    
+    db_path = str(tmp_path / "sentinel.db")
+    store = lord_sentinel.configure_store(db_path)
+    transport = httpx.ASGITransport(app=lord_sentinel.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://sentinel") as client:
+        files_v1 = [{"path": "auth.py", "code": auth_v1}, {"path": "util.py", "code": util}]
+        first = (await client.post("/mcp", json=call("check_quality", {"files": files_v1, "base": {}}))).json()["result"]
+        assert first["incremental"]["added"] == ["auth.py", "util.py"]
+        assert first["incremental"]["analyzed"] == 2
+        revision = first["incremental"]["revision"]
+        assert revision == {"auth.py": content_hash(auth_v1), "util.py": content_hash(util)}
+        
+        # New process: memory tier is empty, the persistent tier still has every file
+        store = lord_sentinel.configure_store(db_path)
+        files_v2 = [{"path": "auth.py", "code": auth_v2}, {"path": "util.py", "hash": revision["util.py"]}]
+        review = (await client.post("/mcp", json=call("review_code", {"files": files_v2, "base": revision}))).json()["result"]
+    lord_sentinel.server.shutdown()
+    lord_sentinel.configure_store()
+    
+    changes = review["incremental"]
+    assert changes["changed"] == ["auth.py"]
+    assert changes["unchanged"] == ["util.py"]
+    assert changes["changed_functions"] == {"auth.py": ["login"]}
+    assert changes["analyzed"] == 1 and changes["reused"] == 1
+    assert changes["missing"] == []
+    assert store.stats()["persistent_hits"] >= 2  # util.py report + auth.py base report
+    
+    assert {(issue["path"], issue["type"]) for issue in review["issues"]} == {
+        ("auth.py", "incomplete"), ("auth.py", "style"),
+    }
+    assert review["score"] == 75
+
+
+def test_security_rule_engine_single_pass_with_lines():
+    """Test compiled security rules: line numbers, requires/unless, ignore_case"""
+    from security_rules import DEFAULT_RULESET, SecurityRule, SecurityRuleSet
+    
+    code = (
+        "import sqlite3\n"
+        "def find(cursor, name):\n"
+        "    query = \"SELECT * FROM users WHERE name = '%s'\" % name\n"
+        "    cursor.execute(query)\n"
+        "    return eval(name)\n"
+        "PASSWORD = 'hunter2'\n"
+        "# exec(legacy)\n"
+    )
+    findings = {finding["type"]: finding for finding in DEFAULT_RULESET.scan(code)}
+    assert findings["sql-injection"]["lines"] == [4]
+    assert findings["code-injection"]["lines"] == [5, 7]
+    assert findings["code-injection"]["line"] == 5
+    assert findings["weak-crypto"]["lines"] == [6]  # ignore_case
+    
+    # unless/requires are per source
+    assert DEFAULT_RULESET.scan("password = hash_password(p)\ncursor.execute(q)\n") == []
+    assert [f["type"] for f in DEFAULT_RULESET.scan("cursor.execute('SELECT ?', (x,))")] == []
+    
+    # Custom rule sets share groups across rules and scan files lazily
+    rules = SecurityRuleSet([
+        SecurityRule(type="debug", severity="low", message="debug", patterns=(r"pdb\.set_trace\(",)),
+        SecurityRule(type="shell", severity="high", message="shell", patterns=(r"shell=True",), unless=(r"pdb\.set_trace\(",)),
+    ])
+    assert rules.pattern.pattern.count("(?P<") == 2
+    scanned = rules.scan_files(iter([("a.py", "run(x, shell=True)\n"), ("b.py", "\n\nimport pdb; pdb.set_trace()\n")]))
+    assert next(scanned) == ("a.py", [{"severity": "high", "type": "shell", "message": "shell", "line": 1, "lines": [1]}])
+    assert [f["line"] for f in next(scanned)[1]] == [3]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
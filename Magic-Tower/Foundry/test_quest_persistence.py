@@ -20,6 +20,7 @@ from quest_executor import (
     ExecutionHooks
 )
 from quest_persistence import QuestRepository
+from persistence_queue import WriteBehindQueue
 
 
 # Test database path
@@ -501,6 +502,371 @@ async def test_11_delete_quest():
     cleanup_test_db()
 
 
+async def test_12_write_behind_batches():
+    """Test: Write-behind queue batches writes and flush is a durability barrier"""
+    cleanup_test_db()
+    repo = QuestRepository(TEST_DB)
+    queue = WriteBehindQueue(repo, max_queue_size=4, batch_size=50, batch_interval=0.01)
+    
+    quest_data = QuestExecutionData(
+        quest_id="q-test-012",
+        quest_type="test_write_behind",
+        input_data={"test": "data"},
+        execution_stack=[LordStep("architect", "design_system")],
+        status=ExecutionStatus.RUNNING
+    )
+    
+    await queue.save_quest(quest_data)
+    for i in range(20):
+        await queue.save_lord_run(
+            quest_id=quest_data.quest_id,
+            lord_name="architect",
+            tool_name="design_system",
+            run_index=i,
+            status="success",
+            input_data={"i": i},
+            output_data={"design": i},
+            start_time=time.time()
+        )
+    
+    # Row was serialized at enqueue time - later mutations don't leak in
+    quest_data.execution_stack.clear()
+    quest_data.status = ExecutionStatus.COMPLETED
+    await queue.save_quest(quest_data)
+    
+    await queue.flush()
+    stats = queue.stats()
+    assert stats["written"] == 22
+    assert stats["batches"] < 22
+    assert stats["backpressure_waits"] > 0  # Queue bound (4) was hit
+    assert stats["max_queue_depth"] <= 4
+    
+    loaded = repo.load_quest("q-test-012")
+    assert loaded.status == ExecutionStatus.COMPLETED
+    assert loaded.execution_stack == []
+    assert len(loaded.run_data["architect"]) == 20
+    
+    await queue.aclose()
+    assert queue.closed
+    
+    print("✅ TEST 12: Write-behind batches")
+    cleanup_test_db()
+
+
+async def test_13_executor_write_behind():
+    """Test: Executor auto-saves through the write-behind queue"""
+    import httpx
+    from lord_client import LordClientPool
+    
+    cleanup_test_db()
+    repo = QuestRepository(TEST_DB)
+    
+    def handler(request):
+        body = __import__("json").loads(request.content)
+        return httpx.Response(200, json={"jsonrpc": "2.0", "result": {"ok": True}, "id": body["id"]})
+    
+    executor = QuestExecutor(
+        repository=repo,
+        write_behind=True,
+        client_pool=LordClientPool(transport=httpx.MockTransport(handler))
+    )
+    assert executor.write_queue is not None
+    
+    quest_data = QuestExecutionData(
+        quest_id="q-test-013",
+        quest_type="test_write_behind",
+        input_data={"test": "data"},
+        execution_stack=[
+            LordStep("architect", "design_system"),
+            LordStep("scribe", "write_docs"),
+        ]
+    )
+    
+    result = await executor.execute_quest(quest_data)
+    assert result.status == ExecutionStatus.COMPLETED
+    
+    # Quest end flushed the queue: state is already on disk
+    loaded = repo.load_quest("q-test-013")
+    assert loaded.status == ExecutionStatus.COMPLETED
+    assert "architect" in loaded.run_data
+    assert "scribe" in loaded.run_data
+    
+    await executor.aclose()
+    await executor.client_pool.aclose()
+    assert executor.write_queue.closed
+    
+    print("✅ TEST 13: Executor write-behind")
+    cleanup_test_db()
+
+
+def mock_lord_pool():
+    """Client pool whose Lords answer every tool call in-memory"""
+    import json
+    import httpx
+    from lord_client import LordClientPool
+    
+    def handler(request):
+        body = json.loads(request.content)
+        result = {"tool": body["params"]["name"], "payload": "x" * 1000}
+        return httpx.Response(200, json={"jsonrpc": "2.0", "result": result, "id": body["id"]})
+    
+    return LordClientPool(transport=httpx.MockTransport(handler))
+
+
+async def test_14_incremental_state_log():
+    """Test: Incremental mode appends events instead of rewriting the quest row"""
+    import sqlite3
+    
+    cleanup_test_db()
+    repo = QuestRepository(TEST_DB)
+    pool = mock_lord_pool()
+    executor = QuestExecutor(repository=repo, client_pool=pool, incremental_state=True, compact_every=1000)
+    
+    quest_data = QuestExecutionData(
+        quest_id="q-test-014",
+        quest_type="test_incremental",
+        input_data={"test": "data"},
+        execution_stack=[LordStep("architect", "design_system", run_index=i) for i in range(5)]
+    )
+    
+    result = await executor.execute_quest(quest_data)
+    assert result.status == ExecutionStatus.COMPLETED
+    
+    # Checkpoint row still holds the base stack; 5 step events + 1 finish event appended
+    assert repo.count_quest_events("q-test-014") == 6
+    conn = sqlite3.connect(TEST_DB)
+    stored_stack, stored_status = conn.execute(
+        "SELECT execution_stack, status FROM quest_executions WHERE quest_id = ?", ("q-test-014",)
+    ).fetchone()
+    conn.close()
+    assert stored_status == "running"
+    assert len(__import__("json").loads(stored_stack)) == 5
+    
+    # load_quest replays the log into full state
+    loaded = repo.load_quest("q-test-014")
+    assert loaded.status == ExecutionStatus.COMPLETED
+    assert loaded.execution_stack == []
+    assert loaded.output_data == {"tool": "design_system", "payload": "x" * 1000}
+    
+    # Compaction folds the log into the row
+    assert repo.compact_quest("q-test-014") is True
+    assert repo.count_quest_events("q-test-014") == 0
+    compacted = repo.load_quest("q-test-014")
+    assert compacted.status == ExecutionStatus.COMPLETED
+    assert compacted.execution_stack == []
+    assert compacted.output_data == loaded.output_data
+    
+    await pool.aclose()
+    print("✅ TEST 14: Incremental state log")
+    cleanup_test_db()
+
+
+async def test_15_incremental_write_behind_compaction():
+    """Test: Incremental events and compaction checkpoints through write-behind"""
+    cleanup_test_db()
+    repo = QuestRepository(TEST_DB)
+    pool = mock_lord_pool()
+    executor = QuestExecutor(
+        repository=repo,
+        client_pool=pool,
+        write_behind=True,
+        incremental_state=True,
+        compact_every=2
+    )
+    
+    quest_data = QuestExecutionData(
+        quest_id="q-test-015",
+        quest_type="test_incremental",
+        input_data={"test": "data"},
+        execution_stack=[
+            LordStep("architect", "design_system", step_id="design"),
+            LordStep("sentinel", "check_quality", step_id="quality", depends_on=["design"]),
+            LordStep("sentinel", "analyze_security", step_id="security", depends_on=["design"]),
+        ]
+    )
+    
+    await executor.execute_quest(quest_data)
+    
+    # 3 step events + finish event, compacted every 2 -> nothing pending
+    assert repo.count_quest_events("q-test-015") == 0
+    loaded = repo.load_quest("q-test-015")
+    assert loaded.status == ExecutionStatus.COMPLETED
+    assert loaded.execution_stack == []
+    assert set(loaded.output_data) == {"quality", "security"}
+    assert loaded.output_data["quality"]["tool"] == "check_quality"
+    
+    await executor.aclose()
+    await pool.aclose()
+    print("✅ TEST 15: Incremental write-behind compaction")
+    cleanup_test_db()
+
+
+async def test_17_incremental_log_skipped_steps():
+    """Test: Steps skipped or failed in incremental mode still leave the stack on load"""
+    import json
+    import httpx
+    from lord_client import LordClientPool
+    
+    def handler(request):
+        body = json.loads(request.content)
+        if request.url.port == 8001:
+            return httpx.Response(200, json={"jsonrpc": "2.0", "error": {"code": -32602, "message": "bad"}, "id": body["id"]})
+        return httpx.Response(200, json={"jsonrpc": "2.0", "result": {"ok": True}, "id": body["id"]})
+    
+    def quest(quest_id, on_error):
+        return QuestExecutionData(
+            quest_id=quest_id,
+            quest_type="test_incremental_skip",
+            input_data={"test": "data"},
+            execution_stack=[
+                LordStep("architect", "design_system", on_error=on_error,
+                         retry_config=LordRetryConfig(max_tries=1)),
+                LordStep("scribe", "write_docs"),
+            ]
+        )
+    
+    cleanup_test_db()
+    repo = QuestRepository(TEST_DB)
+    pool = LordClientPool(transport=httpx.MockTransport(handler))
+    executor = QuestExecutor(repository=repo, client_pool=pool, incremental_state=True, compact_every=1000)
+    
+    for quest_id, on_error, status in (
+        ("q-test-017-continue", ErrorMode.CONTINUE, ExecutionStatus.COMPLETED),
+        ("q-test-017-stop", ErrorMode.STOP, ExecutionStatus.ERROR),
+    ):
+        result = await executor.execute_quest(quest(quest_id, on_error))
+        assert result.status == status
+        
+        # Replayed events match the in-memory (and full-row) stack
+        loaded = repo.load_quest(quest_id)
+        assert loaded.status == status
+        assert [step.lord_name for step in loaded.execution_stack] == [step.lord_name for step in result.execution_stack]
+        assert repo.compact_quest(quest_id) is True
+        assert [step.lord_name for step in repo.load_quest(quest_id).execution_stack] == [
+            step.lord_name for step in result.execution_stack
+        ]
+    
+    await executor.aclose()
+    await pool.aclose()
+    print("✅ TEST 17: Incremental log records skipped and failed steps")
+    cleanup_test_db()
+
+
+async def test_16_deadline_round_trip():
+    """Test: Quest deadline survives save/load, pause/resume and replay"""
+    import sqlite3
+    
+    cleanup_test_db()
+    
+    # A schema 1 database gains the deadline column on open
+    conn = sqlite3.connect(TEST_DB)
+    conn.execute("""
+        CREATE TABLE quest_executions (
+            quest_id TEXT PRIMARY KEY, quest_type TEXT NOT NULL, status TEXT NOT NULL,
+            start_time REAL, end_time REAL, duration_seconds REAL,
+            input_data TEXT NOT NULL, output_data TEXT, execution_stack TEXT NOT NULL,
+            created_at TEXT NOT NULL, updated_at TEXT NOT NULL, schema_version INTEGER NOT NULL
+        )
+    """)
+    conn.commit()
+    conn.close()
+    repo = QuestRepository(TEST_DB)
+    
+    start = time.time()
+    deadline = start + 60
+    quest_data = QuestExecutionData(
+        quest_id="q-test-016",
+        quest_type="test_deadline",
+        input_data={"test": "data"},
+        execution_stack=[LordStep("architect", "design_system"), LordStep("scribe", "write_docs")],
+        status=ExecutionStatus.RUNNING,
+        start_time=start,
+        deadline=deadline,
+    )
+    repo.save_quest(quest_data)
+    assert repo.load_quest("q-test-016").deadline == deadline
+    
+    pool = mock_lord_pool()
+    executor = QuestExecutor(repository=repo, client_pool=pool)
+    assert await executor.pause_quest("q-test-016")
+    assert repo.load_quest("q-test-016").deadline == deadline
+    
+    resumed = await executor.resume_quest("q-test-016")
+    assert resumed.status == ExecutionStatus.COMPLETED
+    assert resumed.deadline == deadline
+    assert repo.load_quest("q-test-016").deadline == deadline
+    
+    # A replay keeps the time budget, counted from the replay
+    replayed = await executor.replay_quest("q-test-016")
+    assert replayed.deadline is not None
+    assert replayed.deadline > deadline - 1 and replayed.deadline - replayed.start_time <= 60
+    assert repo.load_quest(replayed.quest_id).deadline == replayed.deadline
+    
+    await executor.aclose()
+    await pool.aclose()
+    print("✅ TEST 16: Deadline round trip")
+    cleanup_test_db()
+
+
+async def test_18_graph_pause_resume():
+    """Test: A graph quest paused mid-run resumes after its completed steps"""
+    import json
+    import httpx
+    from lord_client import LordClientPool
+    
+    released = asyncio.Event()
+    calls = []
+    
+    async def handler(request):
+        body = json.loads(request.content)
+        tool = body["params"]["name"]
+        calls.append(tool)
+        if tool == "write_docs":
+            await released.wait()
+        result = {"tool": tool, "seen": sorted(body["params"]["arguments"])}
+        return httpx.Response(200, json={"jsonrpc": "2.0", "result": result, "id": body["id"]})
+    
+    cleanup_test_db()
+    repo = QuestRepository(TEST_DB)
+    pool = LordClientPool(transport=httpx.MockTransport(handler))
+    executor = QuestExecutor(repository=repo, client_pool=pool)
+    
+    quest_data = QuestExecutionData(
+        quest_id="q-test-018",
+        quest_type="test_graph_resume",
+        input_data={"requirements": "castle"},
+        execution_stack=[
+            LordStep("architect", "design_system", step_id="a"),
+            LordStep("scribe", "write_docs", step_id="b", depends_on=["a"]),
+        ]
+    )
+    
+    # Stop the quest while b is in flight
+    task = asyncio.create_task(executor.execute_quest(quest_data))
+    while calls != ["design_system", "write_docs"]:
+        await asyncio.sleep(0.01)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    
+    loaded = repo.load_quest("q-test-018")
+    assert loaded.run_data["architect"][0]["step_id"] == "a"
+    assert [step.key for step in loaded.execution_stack] == ["b"]
+    
+    assert await executor.pause_quest("q-test-018")
+    released.set()
+    resumed = await executor.resume_quest("q-test-018")
+    
+    assert resumed.status == ExecutionStatus.COMPLETED
+    assert calls == ["design_system", "write_docs", "write_docs"]  # a is not rerun
+    assert resumed.output_data == {"tool": "write_docs", "seen": ["seen", "tool"]}  # b got a's output
+    assert repo.load_quest("q-test-018").run_data["scribe"][0]["step_id"] == "b"
+    
+    await executor.aclose()
+    await pool.aclose()
+    print("✅ TEST 18: Graph quest pause/resume")
+    cleanup_test_db()
+
+
 async def run_all_tests():
     """Run all persistence tests"""
     print("\n" + "="*60)
@@ -519,6 +885,13 @@ async def run_all_tests():
         test_9_lord_performance_stats,
         test_10_update_quest_status,
         test_11_delete_quest,
+        test_12_write_behind_batches,
+        test_13_executor_write_behind,
+        test_14_incremental_state_log,
+        test_15_incremental_write_behind_compaction,
+        test_16_deadline_round_trip,
+        test_17_incremental_log_skipped_steps,
+        test_18_graph_pause_resume,
     ]
     
     passed = 0